@@ -0,0 +1,54 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: PacketEncoder vs json.dumps(packet.to_dict(), default=str) per packet.
+
+Run from the repository root:
+    python docs/examples/benchmarks/bench_packet_encoder.py [packets]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+from bench_trace_format import make_packet
+
+from mdm_engine.trace import PacketEncoder
+
+
+def best_of(fns, packets, repeat: int = 9) -> list[float]:
+    """Best us/packet per fn; rounds interleave the fns so machine noise hits both."""
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            t0 = time.perf_counter()
+            for p in packets:
+                fn(p)
+            best[i] = min(best[i], time.perf_counter() - t0)
+    return [b / len(packets) * 1e6 for b in best]
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    packets = [make_packet(i) for i in range(n)]
+    encoder = PacketEncoder()
+    for p in packets:
+        assert encoder.encode(p) == json.dumps(p.to_dict(), default=str)
+
+    t_json, t_enc = best_of(
+        [
+            lambda p: json.dumps(p.to_dict(), default=str) + "\n",
+            lambda p: encoder.encode(p, newline=True),
+        ],
+        packets,
+    )
+    print(f"packets={n} (outputs identical)")
+    print(f"json.dumps(to_dict(), default=str)  {t_json:6.2f} us/pkt")
+    print(f"PacketEncoder.encode                {t_enc:6.2f} us/pkt")
+    print(f"speedup {t_json / t_enc:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: redact_dict on large nested payloads vs the previous per-key regex copy.
+
+Run from the repository root:
+    python docs/examples/benchmarks/bench_redaction.py [payloads]
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+from typing import Any
+
+from mdm_engine.security.redaction import REDACT_KEYS, redact_dict
+
+
+def redact_dict_regex(d: dict[str, Any]) -> dict[str, Any]:
+    """Previous implementation: regex per key at every depth, full copy."""
+    norm_set = {re.sub(r"[-_\s]", "", x.lower()) for x in REDACT_KEYS}
+
+    def impl(d: dict[str, Any]) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for k, v in d.items():
+            if re.sub(r"[-_\s]", "", k.lower()) in norm_set:
+                out[k] = "[REDACTED]"
+            elif isinstance(v, dict):
+                out[k] = impl(v)
+            elif isinstance(v, list):
+                out[k] = [impl(x) if isinstance(x, dict) else x for x in v]
+            else:
+                out[k] = v
+        return out
+
+    return impl(d)
+
+
+def make_payload(i: int, secret: bool) -> dict[str, Any]:
+    """~400 keys over 3 levels; one sensitive key deep inside when secret."""
+    payload = {
+        "step": i,
+        "signals": {f"signal_{j}": 0.01 * j + i for j in range(50)},
+        "groups": [
+            {"id": g, "values": {f"state_scalar_{j}": float(j) for j in range(20)}}
+            for g in range(15)
+        ],
+        "meta": {"source": "bench", "ts_ms": 1_700_000_000_000 + i},
+    }
+    if secret:
+        payload["groups"][7]["values"]["API-Key"] = "k"
+    return payload
+
+
+def best_of(fns, payloads, repeat: int = 7) -> list[float]:
+    """Best us/payload per fn; rounds interleave the fns so machine noise hits all."""
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            t0 = time.perf_counter()
+            for p in payloads:
+                fn(p)
+            best[i] = min(best[i], time.perf_counter() - t0)
+    return [b / len(payloads) * 1e6 for b in best]
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for secret in (False, True):
+        payloads = [make_payload(i, secret) for i in range(n)]
+        for p in payloads[:5]:
+            assert redact_dict(p) == redact_dict_regex(p) == redact_dict(p, shared=True)
+        t_old, t_copy, t_new = best_of(
+            [
+                redact_dict_regex,
+                redact_dict,
+                lambda p: redact_dict(p, shared=True),
+            ],
+            payloads,
+        )
+        label = "one sensitive key" if secret else "nothing sensitive"
+        print(f"payloads={n} ({label}, outputs identical)")
+        print(f"  regex per key, full copy   {t_old:8.1f} us")
+        print(f"  redact_dict (copy)         {t_copy:8.1f} us  {t_old / t_copy:5.1f}x")
+        print(f"  redact_dict(shared=True)   {t_new:8.1f} us  {t_old / t_new:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
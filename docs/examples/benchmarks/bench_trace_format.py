@@ -0,0 +1,93 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: TraceLogger JSONL vs binary format (write rate, file size, read rate).
+
+Run from the repository root:
+    python docs/examples/benchmarks/bench_trace_format.py [packets]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.types import Action
+
+from mdm_engine.trace import BinaryTraceReader, TraceLogger
+
+
+def make_packet(step: int) -> PacketV2:
+    x = step * 1e-3
+    return PacketV2(
+        run_id="bench",
+        step=step,
+        input={
+            "ts_ms": 1_700_000_000_000 + step,
+            "signal_0": 0.5 + x,
+            "signal_1": 0.25 - x,
+            "state_scalar_a": 1.0 / (1 + step),
+            "state_scalar_b": 3.0 * x,
+        },
+        external={"now_ms": 1_700_000_000_000.0 + step, "errors_in_window": 0},
+        mdm={
+            "action": Action.ACT,
+            "confidence": 0.8 - x / 10,
+            "reasons": ["signal_above_threshold"],
+            "params": {"value_a": 0.49, "value_b": 0.51, "size": 1.0},
+        },
+        final_action={"action": Action.ACT, "allowed": True, "reasons": []},
+        latency_ms=3,
+        mismatch=None,
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    packets = [make_packet(i) for i in range(n)]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ("jsonl", "binary"):
+            run_dir = Path(tmp) / fmt
+            t0 = time.perf_counter()
+            with TraceLogger(run_dir, flush_every_n=1000, format=fmt) as logger:
+                for p in packets:
+                    logger.write(p)
+            t_write = time.perf_counter() - t0
+            path = logger.path
+            t0 = time.perf_counter()
+            if fmt == "jsonl":
+                with open(path, encoding="utf-8") as f:
+                    count = sum(1 for line in f if json.loads(line))
+            else:
+                with BinaryTraceReader(path) as reader:
+                    count = sum(1 for _ in reader)
+            t_read = time.perf_counter() - t0
+            assert count == n
+            results[fmt] = (t_write, path.stat().st_size, t_read)
+            if fmt == "binary":
+                with BinaryTraceReader(path) as reader:
+                    t0 = time.perf_counter()
+                    count = sum(1 for _ in reader.records())
+                    t_scan = time.perf_counter() - t0
+                assert count == n
+
+    print(f"packets={n}")
+    for fmt, (t_write, size, t_read) in results.items():
+        print(
+            f"{fmt:6s}  write {n / t_write:10,.0f} pkt/s  "
+            f"size {size / n:6.1f} B/pkt  read {n / t_read:10,.0f} pkt/s"
+        )
+    print(f"binary  records() scan (no decode) {n / t_scan:12,.0f} pkt/s")
+    (jw, js, jr), (bw, bs, br) = results["jsonl"], results["binary"]
+    print(
+        f"binary/jsonl: write {jw / bw:.2f}x  size {bs / js:.2f}  read {jr / br:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: per-instrument build_features loop vs build_features_batch (2-D book arrays).
+
+Example domain only. Run with mdm_engine_legacy importable as mdm_engine.features:
+    python bench_features_batch.py [instruments] [levels]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from mdm_engine.features.batch import build_features_batch
+from mdm_engine.features.feature_builder import build_features
+
+
+def _books(n: int, levels: int, hist_len: int, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    mid = rng.uniform(0.2, 0.8, n)
+    bid0 = np.round((mid - 0.01) / 0.01) * 0.01
+    ask0 = bid0 + 0.01 * rng.integers(1, 4, n)
+    steps = 0.01 * np.arange(levels)
+    bid_px = bid0[:, None] - steps
+    ask_px = ask0[:, None] + steps
+    bid_sz = rng.uniform(10, 200, (n, levels))
+    ask_sz = rng.uniform(10, 200, (n, levels))
+    hist = mid[:, None] * np.exp(np.cumsum(rng.normal(0, 0.002, (n, hist_len)), axis=1))
+    return bid_px, bid_sz, ask_px, ask_sz, hist
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    vol_window = 50
+    bid_px, bid_sz, ask_px, ask_sz, hist = _books(n, levels, vol_window + 1)
+
+    t0 = time.perf_counter()
+    ref = []
+    for i in range(n):
+        bids = list(zip(bid_px[i].tolist(), bid_sz[i].tolist()))
+        asks = list(zip(ask_px[i].tolist(), ask_sz[i].tolist()))
+        ref.append(
+            build_features(
+                bids[0][0], asks[0][0], 0.0, 0.0, bids, asks,
+                hist[i].tolist(), vol_window, 0, 0,
+            )
+        )  # fmt: skip
+    t_ref = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    table = build_features_batch(bid_px, bid_sz, ask_px, ask_sz, hist, vol_window, 0, 0)
+    t_batch = time.perf_counter() - t0
+
+    max_err = max(
+        abs(ref[i][k] - float(table[k][i])) / max(1.0, abs(ref[i][k]))
+        for i in range(n)
+        for k in table
+    )
+    print(f"instruments={n} levels={levels}")
+    print(f"build_features loop:  {t_ref * 1e3:8.2f} ms")
+    print(f"build_features_batch: {t_batch * 1e3:8.2f} ms")
+    print(f"speedup: {t_ref / t_batch:.1f}x  max rel diff: {max_err:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: Monte Carlo runner scaling across process counts (1, 2, 4, ... cpu_count).
+
+Example domain only. Run with mdm_engine_legacy importable as mdm_engine.sim:
+    python bench_monte_carlo.py [runs] [steps]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from reference_model_legacy import compute_proposal_reference
+
+from mdm_engine.sim.monte_carlo import RunConfig, run_monte_carlo
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    config = RunConfig(steps=steps, model=compute_proposal_reference)
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, *(w for w in (2, 4, 8, 16, 32) if w <= cpus), cpus})
+
+    base = run_monte_carlo(config, runs, seed=0, workers=1)
+    print(f"runs={runs} steps={steps} cpus={cpus}")
+    print(f"workers=1  {runs / base.elapsed_s:8.1f} runs/s")
+    for w in counts[1:]:
+        res = run_monte_carlo(config, runs, seed=0, workers=w)
+        assert res.summaries == base.summaries
+        speedup = base.elapsed_s / res.elapsed_s
+        print(
+            f"workers={w:<2} {runs / res.elapsed_s:8.1f} runs/s  "
+            f"speedup {speedup:.2f}x  efficiency {speedup / w:.0%}"
+        )
+    pnl = base.stats["realized_pnl"]
+    print(
+        f"realized_pnl p05/p50/p95: {pnl['p05']:.4f} {pnl['p50']:.4f} {pnl['p95']:.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: PaperBroker soak (process_fills + get_state every tick) by equity mode.
+
+Example domain only. Run with mdm_engine_legacy importable as mdm_engine.sim:
+    python bench_paper_broker.py [ticks] [markets]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+from mdm_engine.sim.microstructure_sim import MicrostructureSim
+from mdm_engine.sim.paper_broker import PaperBroker
+
+
+def soak(n: int, markets: int, equity: str, **broker_kwargs) -> tuple[float, int]:
+    broker = PaperBroker(sim=MicrostructureSim(seed=1), **broker_kwargs)
+    book = {"bid": 0.49, "ask": 0.51, "mid": 0.5, "ts_ms": 0}
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for t in range(n):
+        market_id = f"m{t % markets}"
+        book["ts_ms"] = t
+        book["mid"] = 0.5 + 0.001 * (t % 7)
+        broker.set_book(book, market_id)
+        broker.submit_order(market_id, "bid" if t % 2 else "ask", 0.5, 1.0, True)
+        broker.process_fills(t)
+        broker.get_state(equity=equity)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    markets = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    cases = [
+        ("list", {}),
+        ("view", {}),
+        ("summary", {}),
+        ("summary", {"equity_maxlen": 1024, "fill_records_maxlen": 1024}),
+    ]
+    print(f"ticks={n} markets={markets}")
+    for equity, kwargs in cases:
+        elapsed, peak = soak(n, markets, equity, **kwargs)
+        label = f"{equity} {kwargs}" if kwargs else equity
+        print(
+            f"{label:<62} {elapsed / n * 1e6:8.1f} us/tick  peak {peak / 1e6:6.2f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
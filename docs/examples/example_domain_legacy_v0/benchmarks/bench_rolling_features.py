@@ -0,0 +1,74 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: build_features (list histories) vs RollingFeatureEngine (incremental).
+
+Equivalence of the two is checked in tests/test_legacy_rolling_features.py.
+
+Example domain only. Run with mdm_engine_legacy importable as mdm_engine.features:
+    python bench_rolling_features.py [ticks]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from mdm_engine.features.feature_builder import build_features
+from mdm_engine.features.rolling import RollingFeatureEngine
+
+
+def _ticks(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    mid = 0.5
+    for t in range(n):
+        mid = max(0.01, mid + rng.gauss(0, 0.002))
+        bid = round((mid - 0.01) / 0.01) * 0.01
+        ask = bid + 0.01 * rng.randint(1, 3)
+        bd, ad = rng.uniform(10, 200), rng.uniform(10, 200)
+        yield bid, ask, bd, ad, t * 100, t * 100 + rng.randint(0, 50)
+
+
+def bench_build_features(n: int, vol_window: int = 50) -> tuple[float, list[dict]]:
+    mids: list[float] = []
+    spreads: list[float] = []
+    depths: list[float] = []
+    stale: list[int] = []
+    out = []
+    t0 = time.perf_counter()
+    for bid, ask, bd, ad, last, now in _ticks(n):
+        mids.append((bid + ask) / 2.0)
+        spreads.append(max(0.0, ask - bid))
+        depths.append(bd + ad)
+        stale.append(now - last)
+        out.append(
+            build_features(
+                bid, ask, bd, ad, None, None, mids, vol_window, last, now,
+                spread_history=spreads, depth_history=depths, staleness_history=stale,
+            )
+        )  # fmt: skip
+    return time.perf_counter() - t0, out
+
+
+def bench_rolling(n: int, vol_window: int = 50) -> tuple[float, list[dict]]:
+    engine = RollingFeatureEngine(vol_window)
+    out = []
+    t0 = time.perf_counter()
+    for bid, ask, bd, ad, last, now in _ticks(n):
+        out.append(engine.update(bid, ask, bd, ad, None, None, last, now))
+    return time.perf_counter() - t0, out
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    t_ref, _ = bench_build_features(n)
+    t_inc, _ = bench_rolling(n)
+    print(f"ticks={n}")
+    print(f"build_features:       {t_ref / n * 1e6:8.1f} us/tick")
+    print(f"RollingFeatureEngine: {t_inc / n * 1e6:8.1f} us/tick")
+    print(f"speedup: {t_ref / t_inc:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
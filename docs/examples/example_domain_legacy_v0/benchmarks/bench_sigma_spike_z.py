@@ -0,0 +1,78 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark + equivalence: sigma_spike_z loop (previous) vs sliding-window kernel vs stream.
+
+Example domain only. Expect max rel diff up to ~1e-7 (kernel) / ~2e-8 (stream) on
+tick-rounded mids; the default random-walk mids here are not rounded. Run with mdm_engine_legacy importable as mdm_engine.features:
+    python bench_sigma_spike_z.py [ticks] [short] [long]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from mdm_engine.features.kernels import SigmaSpikeZStream, sigma_spike_z
+
+
+def sigma_spike_z_loop(
+    mid_history: list[float], short_steps: int, long_steps: int, eps: float = 1e-9
+) -> float:
+    """Previous implementation (np.std per short window): O(long*short) per call."""
+    if len(mid_history) < max(short_steps, long_steps) + 2:
+        return 0.0
+    arr = np.maximum(np.array(mid_history[-long_steps - 2 :], dtype=float), eps)
+    rets = np.diff(np.log(arr))
+    if len(rets) < short_steps:
+        return 0.0
+    sigma_short = float(np.std(rets[-short_steps:]))
+    vals = [
+        float(np.std(rets[i : i + short_steps]))
+        for i in range(len(rets) - short_steps + 1)
+    ]
+    mu_l, std_l = float(np.mean(vals)), float(np.std(vals))
+    if std_l < eps:
+        return 0.0
+    return (sigma_short - mu_l) / (std_l + eps)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    short = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    long = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    rng = random.Random(1)
+    mids: list[float] = []
+    mid = 0.5
+    for t in range(n):
+        mid = max(0.01, mid + rng.gauss(0, 0.002 * (3 if (t // 300) % 2 else 1)))
+        mids.append(mid)
+
+    results = {}
+    timings = {}
+    for name, fn in (("loop", sigma_spike_z_loop), ("kernel", sigma_spike_z)):
+        t0 = time.perf_counter()
+        results[name] = [fn(mids[: i + 1], short, long) for i in range(n)]
+        timings[name] = time.perf_counter() - t0
+    stream = SigmaSpikeZStream(short, long)
+    t0 = time.perf_counter()
+    results["stream"] = [stream.push_mid(m) for m in mids]
+    timings["stream"] = time.perf_counter() - t0
+
+    ref = np.array(results["loop"])
+    print(f"ticks={n} short={short} long={long}")
+    for name in ("loop", "kernel", "stream"):
+        diff = np.max(
+            np.abs(np.array(results[name]) - ref) / np.maximum(1.0, np.abs(ref))
+        )
+        print(
+            f"{name:7s} {timings[name] / n * 1e6:8.1f} us/tick  "
+            f"speedup {timings['loop'] / timings[name]:6.1f}x  max rel diff {diff:.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
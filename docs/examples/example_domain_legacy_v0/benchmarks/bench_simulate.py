@@ -0,0 +1,40 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: MicrostructureSim.step() loop vs vectorized simulate(n_steps, n_paths).
+
+Example domain only. Run with mdm_engine_legacy importable as mdm_engine.sim:
+    python bench_simulate.py [steps] [paths]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from mdm_engine.sim.microstructure_sim import MicrostructureSim
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    paths = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    sim = MicrostructureSim(seed=1)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        sim.step()
+    t_step = time.perf_counter() - t0
+
+    sim = MicrostructureSim(seed=1)
+    t0 = time.perf_counter()
+    book = sim.simulate(n, paths)
+    t_vec = time.perf_counter() - t0
+    assert (book["ask"] > book["bid"]).all()
+
+    print(f"steps={n} paths={paths}")
+    print(f"step():     {n / t_step:12,.0f} steps/s")
+    print(f"simulate(): {n * paths / t_vec:12,.0f} steps/s")
+    print(f"speedup: {t_step / t_vec * paths:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
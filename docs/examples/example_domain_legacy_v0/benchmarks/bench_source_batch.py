@@ -0,0 +1,57 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: SyntheticSource next_event() per call vs next_events() / next_columns() batches.
+
+Example domain only. Run with mdm_engine_legacy importable as mdm_engine.sim:
+    python bench_source_batch.py [events] [batch]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from mdm_engine.sim.microstructure_sim import MicrostructureSim
+from mdm_engine.sim.synthetic_source import SyntheticSource
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    book = MicrostructureSim(seed=1).simulate(n)[0]
+
+    src = SyntheticSource.from_block(book)
+    t0 = time.perf_counter()
+    count = 0
+    while src.next_event() is not None:
+        count += 1
+    t_event = time.perf_counter() - t0
+    assert count == n
+
+    src = SyntheticSource.from_block(book)
+    t0 = time.perf_counter()
+    count = 0
+    while events := src.next_events(batch):
+        count += len(events)
+    t_events = time.perf_counter() - t0
+    assert count == n
+
+    src = SyntheticSource.from_block(book)
+    t0 = time.perf_counter()
+    count = 0
+    while (cols := src.next_columns(batch)) is not None:
+        count += len(cols["mid"])
+    t_cols = time.perf_counter() - t0
+    assert count == n
+
+    print(f"events={n} batch={batch}")
+    print(f"next_event():   {n / t_event:14,.0f} events/s")
+    print(
+        f"next_events():  {n / t_events:14,.0f} events/s  ({t_event / t_events:.1f}x)"
+    )
+    print(f"next_columns(): {n / t_cols:14,.0f} events/s  ({t_event / t_cols:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: MIT
 """Feature builder: mid, spread, depth, imbalance, sigma, staleness."""
 
+from mdm_engine.features.batch import build_features_batch
 from mdm_engine.features.feature_builder import build_features
+from mdm_engine.features.rolling import RollingFeatureEngine
 
-__all__ = ["build_features"]
+__all__ = ["RollingFeatureEngine", "build_features", "build_features_batch"]
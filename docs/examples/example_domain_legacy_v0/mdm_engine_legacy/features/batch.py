@@ -0,0 +1,149 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Multi-instrument feature builder: one vectorized pass over (instruments x levels) book arrays.
+
+Per row, same formulas as build_features with top_n levels; output is a columnar table
+(dict of 1-D arrays, one entry per instrument) that DecisionEngine.propose_batch accepts."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def _as_2d(a: np.ndarray | list, name: str) -> np.ndarray:
+    arr = np.asarray(a, dtype=float)
+    if arr.ndim == 1:
+        arr = arr[:, None]
+    if arr.ndim != 2:
+        raise ValueError(f"{name} must be (instruments x levels)")
+    return arr
+
+
+def _row_std(rets: np.ndarray) -> np.ndarray:
+    """Population std per row ignoring NaN (NaN-padded ragged histories); 0 for empty rows."""
+    valid = ~np.isnan(rets)
+    n = valid.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    r = np.where(valid, rets, 0.0)
+    mean = r.sum(axis=1) / safe_n
+    dev = np.where(valid, rets - mean[:, None], 0.0)
+    return np.where(n > 0, np.sqrt((dev * dev).sum(axis=1) / safe_n), 0.0)
+
+
+def build_features_batch(
+    bid_px: np.ndarray,
+    bid_sz: np.ndarray,
+    ask_px: np.ndarray,
+    ask_sz: np.ndarray,
+    mid_history: np.ndarray | None = None,
+    vol_window: int = 0,
+    last_event_ts_ms: np.ndarray | int | None = None,
+    now_ms: np.ndarray | int | None = None,
+    eps: float = 1e-9,
+    imbalance_lambda: float = 0.7,
+    tick_size: float = 0.01,
+    fee_ticks: float = 0.0,
+    slippage_ticks: float = 0.5,
+    buffer_ticks: float = 0.5,
+) -> dict[str, np.ndarray]:
+    """
+    Book features for many instruments at once.
+
+    Args:
+        bid_px, bid_sz, ask_px, ask_sz: (instruments x levels); level 0 is best. Missing levels
+            must have size 0 (price may be NaN).
+        mid_history: (instruments x T) past mids, oldest first; ragged rows left-padded with NaN.
+        vol_window: returns used for sigma (as build_features); 0 disables sigma.
+        last_event_ts_ms, now_ms: scalars or per-instrument arrays (adds staleness_ms).
+
+    Returns:
+        Columnar table: mid, bid, ask, spread, spread_bps, depth, bid_depth, ask_depth, imbalance,
+        imbalance_w, microprice, microprice_alpha_ticks, vwap_bid, vwap_ask, pressure_ticks,
+        sigma, cost_ticks (+ staleness_ms).
+    """
+    bid_px = _as_2d(bid_px, "bid_px")
+    bid_sz = _as_2d(bid_sz, "bid_sz")
+    ask_px = _as_2d(ask_px, "ask_px")
+    ask_sz = _as_2d(ask_sz, "ask_sz")
+    if bid_px.shape != bid_sz.shape or ask_px.shape != ask_sz.shape:
+        raise ValueError("price and size arrays must have the same shape per side")
+    if bid_px.shape[0] != ask_px.shape[0]:
+        raise ValueError("bid and ask arrays must have the same number of instruments")
+    n_inst = bid_px.shape[0]
+    tick = max(tick_size, 1e-12)
+
+    bid = bid_px[:, 0]
+    ask = ask_px[:, 0]
+    mid = np.where(
+        (bid > 0) & (ask > 0), (bid + ask) / 2.0, np.where(bid != 0, bid, ask)
+    )
+    spread = np.maximum(0.0, ask - bid)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spread_bps = np.where(mid >= eps, spread / mid * 10000.0, 0.0)
+
+    depth_bid = bid_sz.sum(axis=1)
+    depth_ask = ask_sz.sum(axis=1)
+    total = depth_bid + depth_ask
+    with np.errstate(divide="ignore", invalid="ignore"):
+        imbalance = np.where(total >= eps, (depth_bid - depth_ask) / total, 0.0)
+
+    # Weighted imbalance: w_i = exp(-lambda*(i-1)), i = 1..levels
+    w_b = np.exp(-imbalance_lambda * np.arange(bid_sz.shape[1]))
+    w_a = np.exp(-imbalance_lambda * np.arange(ask_sz.shape[1]))
+    Bw = bid_sz @ w_b
+    Aw = ask_sz @ w_a
+    total_w = Bw + Aw
+    with np.errstate(divide="ignore", invalid="ignore"):
+        imbalance_w = np.where(total_w < eps, 0.0, (Bw - Aw) / total_w)
+
+    # Microprice from best level
+    B1 = bid_sz[:, 0]
+    A1 = ask_sz[:, 0]
+    microprice = (ask * B1 + bid * A1) / (A1 + B1 + eps)
+    microprice_alpha_ticks = (microprice - mid) / tick
+
+    # VWAP and pressure (missing levels: size 0, NaN price ignored)
+    pq_b = np.where(bid_sz != 0, np.nan_to_num(bid_px) * bid_sz, 0.0).sum(axis=1)
+    pq_a = np.where(ask_sz != 0, np.nan_to_num(ask_px) * ask_sz, 0.0).sum(axis=1)
+    vwap_bid = pq_b / (depth_bid + eps)
+    vwap_ask = pq_a / (depth_ask + eps)
+    pressure_ticks = ((mid - vwap_bid) - (vwap_ask - mid)) / tick
+
+    # Sigma from mid returns (last vol_window returns per row)
+    sigma = np.zeros(n_inst)
+    if mid_history is not None and vol_window > 0:
+        hist = _as_2d(mid_history, "mid_history")
+        if hist.shape[0] != n_inst:
+            raise ValueError("mid_history must have one row per instrument")
+        window = hist[:, -vol_window - 1 :]
+        if window.shape[1] >= 2:
+            rets = np.diff(np.log(np.maximum(window, eps)), axis=1)
+            sigma = _row_std(rets)
+
+    out: dict[str, np.ndarray] = {
+        "mid": mid,
+        "bid": bid,
+        "ask": ask,
+        "spread": spread,
+        "spread_bps": spread_bps,
+        "depth": total,
+        "bid_depth": depth_bid,
+        "ask_depth": depth_ask,
+        "imbalance": imbalance,
+        "imbalance_w": imbalance_w,
+        "microprice": microprice,
+        "microprice_alpha_ticks": microprice_alpha_ticks,
+        "vwap_bid": vwap_bid,
+        "vwap_ask": vwap_ask,
+        "pressure_ticks": pressure_ticks,
+        "sigma": sigma,
+        "cost_ticks": np.full(n_inst, fee_ticks + slippage_ticks + buffer_ticks),
+    }
+    if last_event_ts_ms is not None and now_ms is not None:
+        out["staleness_ms"] = np.broadcast_to(
+            np.asarray(now_ms, dtype=np.int64)
+            - np.asarray(last_event_ts_ms, dtype=np.int64),
+            (n_inst,),
+        ).copy()
+    return out
@@ -10,6 +10,8 @@ import math
 import numpy as np
 from typing import Any
 
+from mdm_engine.features.kernels import sigma_spike_z
+
 
 def _weighted_imbalance(
     top_n_bids: list[tuple[float, float]],
@@ -62,28 +64,10 @@ def _sigma_spike_z(
     long_steps: int,
     eps: float = 1e-9,
 ) -> float:
-    """z_t = (sigma_short - mean(sigma_long)) / (std(sigma_long) + eps)."""
-    if len(mid_history) < max(short_steps, long_steps) + 2:
-        return 0.0
-    arr = np.array(mid_history[-long_steps - 2 :], dtype=float)
-    arr = np.maximum(arr, eps)
-    rets = np.diff(np.log(arr))
-    if len(rets) < short_steps:
-        return 0.0
-    # Rolling sigma over short window for last step
-    sigma_short = float(np.std(rets[-short_steps:]))
-    # Sigma over full long window for distribution
-    sigma_long_vals = [
-        float(np.std(rets[i : i + short_steps]))
-        for i in range(len(rets) - short_steps + 1)
-    ]
-    if not sigma_long_vals:
-        return 0.0
-    mu_l = float(np.mean(sigma_long_vals))
-    std_l = float(np.std(sigma_long_vals))
-    if std_l < eps:
-        return 0.0
-    return (sigma_short - mu_l) / (std_l + eps)
+    """z_t = (sigma_short - mean(sigma_long)) / (std(sigma_long) + eps).
+
+    Sliding-window kernel (cumulative sums): O(long) per call instead of O(long*short)."""
+    return sigma_spike_z(mid_history, short_steps, long_steps, eps)
 
 
 def _rolling_5m_aggregates(
@@ -120,32 +104,18 @@ def _rolling_5m_aggregates(
     }
 
 
-def build_features(
+def _book_features(
     bid: float,
     ask: float,
     bid_depth: float,
     ask_depth: float,
     top_n_bids: list[tuple[float, float]] | None,
     top_n_asks: list[tuple[float, float]] | None,
-    mid_history: list[float],
-    vol_window: int,
-    last_event_ts_ms: int,
-    now_ms: int,
-    eps: float = 1e-9,
-    spread_history: list[float] | None = None,
-    depth_history: list[float] | None = None,
-    staleness_history: list[int] | None = None,
-    window_5m_steps: int = 300,
-    imbalance_lambda: float = 0.7,
-    tick_size: float = 0.01,
-    sigma_short_steps: int = 20,
-    sigma_long_steps: int = 100,
-    fee_ticks: float = 0.0,
-    slippage_ticks: float = 0.5,
-    buffer_ticks: float = 0.5,
+    imbalance_lambda: float,
+    tick_size: float,
+    eps: float,
 ) -> dict[str, Any]:
-    """Mid, spread, depth, imbalance (simple + weighted), sigma, staleness, 5m regime,
-    microprice, vwap, pressure, sigma_spike_z, cost_ticks."""
+    """Snapshot-only features (no history): mid, spread, depth, imbalance, microprice, vwap."""
     # Single-level fallback when top_n not provided
     bids_levels = top_n_bids if top_n_bids else [(bid, bid_depth)]
     asks_levels = top_n_asks if top_n_asks else [(ask, ask_depth)]
@@ -180,6 +150,65 @@ def build_features(
         bids_levels, asks_levels, mid, tick_size, eps
     )
 
+    return {
+        "mid": mid,
+        "bid": bid,
+        "ask": ask,
+        "spread": spread,
+        "spread_bps": spread / mid * 10000.0 if mid >= eps else 0.0,
+        "depth": depth,
+        "bid_depth": depth_bid,
+        "ask_depth": depth_ask,
+        "imbalance": imbalance,
+        "imbalance_w": imbalance_w,
+        "microprice": microprice,
+        "microprice_alpha_ticks": microprice_alpha_ticks,
+        "vwap_bid": vwap_bid,
+        "vwap_ask": vwap_ask,
+        "pressure_ticks": pressure_ticks,
+    }
+
+
+def build_features(
+    bid: float,
+    ask: float,
+    bid_depth: float,
+    ask_depth: float,
+    top_n_bids: list[tuple[float, float]] | None,
+    top_n_asks: list[tuple[float, float]] | None,
+    mid_history: list[float],
+    vol_window: int,
+    last_event_ts_ms: int,
+    now_ms: int,
+    eps: float = 1e-9,
+    spread_history: list[float] | None = None,
+    depth_history: list[float] | None = None,
+    staleness_history: list[int] | None = None,
+    window_5m_steps: int = 300,
+    imbalance_lambda: float = 0.7,
+    tick_size: float = 0.01,
+    sigma_short_steps: int = 20,
+    sigma_long_steps: int = 100,
+    fee_ticks: float = 0.0,
+    slippage_ticks: float = 0.5,
+    buffer_ticks: float = 0.5,
+) -> dict[str, Any]:
+    """Mid, spread, depth, imbalance (simple + weighted), sigma, staleness, 5m regime,
+    microprice, vwap, pressure, sigma_spike_z, cost_ticks."""
+    out = _book_features(
+        bid,
+        ask,
+        bid_depth,
+        ask_depth,
+        top_n_bids,
+        top_n_asks,
+        imbalance_lambda,
+        tick_size,
+        eps,
+    )
+    spread = out["spread"]
+    depth = out["depth"]
+
     # Sigma from mid returns
     if len(mid_history) >= 2 and vol_window > 0:
         arr = np.array(mid_history[-vol_window - 1 :], dtype=float)
@@ -197,29 +226,12 @@ def build_features(
     cost_ticks = fee_ticks + slippage_ticks + buffer_ticks
     staleness_ms = now_ms - last_event_ts_ms
 
-    out: dict[str, Any] = {
-        "mid": mid,
-        "bid": bid,
-        "ask": ask,
-        "spread": spread,
-        "spread_bps": spread / mid * 10000.0 if mid >= eps else 0.0,
-        "depth": depth,
-        "bid_depth": depth_bid,
-        "ask_depth": depth_ask,
-        "imbalance": imbalance,
-        "imbalance_w": imbalance_w,
-        "microprice": microprice,
-        "microprice_alpha_ticks": microprice_alpha_ticks,
-        "vwap_bid": vwap_bid,
-        "vwap_ask": vwap_ask,
-        "pressure_ticks": pressure_ticks,
-        "sigma": sigma,
-        "sigma_spike_z": sigma_spike_z,
-        "cost_ticks": cost_ticks,
-        "staleness_ms": staleness_ms,
-        "last_event_ts_ms": last_event_ts_ms,
-        "now_ms": now_ms,
-    }
+    out["sigma"] = sigma
+    out["sigma_spike_z"] = sigma_spike_z
+    out["cost_ticks"] = cost_ticks
+    out["staleness_ms"] = staleness_ms
+    out["last_event_ts_ms"] = last_event_ts_ms
+    out["now_ms"] = now_ms
 
     # 5m rolling regime aggregates (for regime filter)
     if (
@@ -0,0 +1,169 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Sliding-window variance kernels: vectorized rolling std (cumulative sums) and streaming stats.
+
+sigma_spike_z: z_t = (sigma_short - mean(sigma_long)) / (std(sigma_long) + eps), where sigma_long
+is the series of short-window sigmas across the long window (see feature_builder)."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+import numpy as np
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Population std of every length-`window` slice of x (len(x) - window + 1 values), O(len(x)).
+
+    Cumulative sums of centered values and their squares; centering on mean(x) limits cancellation.
+    Matches np.std per slice to ~1e-12 relative, but a constant slice (e.g. zero returns of a
+    tick-rounded mid) comes out at ~1e-9 instead of exactly 0.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x) - window + 1
+    if window <= 0 or n <= 0:
+        return np.empty(0, dtype=float)
+    xc = x - x.mean()
+    c1 = np.concatenate(([0.0], np.cumsum(xc)))
+    c2 = np.concatenate(([0.0], np.cumsum(xc * xc)))
+    s1 = c1[window:] - c1[:n]
+    s2 = c2[window:] - c2[:n]
+    mean = s1 / window
+    return np.sqrt(np.maximum(s2 / window - mean * mean, 0.0))
+
+
+def sigma_spike_z_returns(
+    rets: np.ndarray, short_steps: int, eps: float = 1e-9
+) -> float:
+    """
+    sigma_spike_z over log returns of the long window (vectorized, O(len(rets))).
+
+    Within ~1e-7 of the np.std-per-window loop (relative, floor 1) on tick-rounded mids, where
+    the ~1e-9 std of flat windows is amplified by the small std of the sigmas.
+    """
+    if short_steps <= 0 or len(rets) < short_steps:
+        return 0.0
+    sigma_long_vals = rolling_std(rets, short_steps)
+    if len(sigma_long_vals) == 0:
+        return 0.0
+    sigma_short = float(sigma_long_vals[-1])
+    mu_l = float(np.mean(sigma_long_vals))
+    std_l = float(np.std(sigma_long_vals))
+    if std_l < eps:
+        return 0.0
+    return (sigma_short - mu_l) / (std_l + eps)
+
+
+def sigma_spike_z(
+    mid_history: list[float] | np.ndarray,
+    short_steps: int,
+    long_steps: int,
+    eps: float = 1e-9,
+) -> float:
+    """sigma_spike_z from mids (same contract as feature_builder._sigma_spike_z)."""
+    if len(mid_history) < max(short_steps, long_steps) + 2:
+        return 0.0
+    arr = np.asarray(mid_history[-long_steps - 2 :], dtype=float)
+    rets = np.diff(np.log(np.maximum(arr, eps)))
+    return sigma_spike_z_returns(rets, short_steps, eps)
+
+
+class SlidingStats:
+    """
+    Mean/population std over the newest `window` pushed values; amortized O(1) per push.
+
+    Running sums are centered on a recent window mean, re-derived exactly every `window` pushes
+    (O(window) every `window` pushes), so cancellation stays bounded by the spread of nearby values.
+    """
+
+    def __init__(self, window: int):
+        self.window = max(1, window)
+        self._vals: deque[float] = deque()
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._shift: float | None = None
+        self._since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self._vals)
+
+    def push(self, x: float) -> None:
+        if self._shift is None:
+            self._shift = x
+        if len(self._vals) == self.window:
+            y = self._vals.popleft() - self._shift
+            self._sum -= y
+            self._sumsq -= y * y
+        self._vals.append(x)
+        xc = x - self._shift
+        self._sum += xc
+        self._sumsq += xc * xc
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self.resync()
+
+    def resync(self) -> None:
+        """Re-center on the window mean and recompute sums exactly."""
+        n = len(self._vals)
+        self._shift = math.fsum(self._vals) / n if n else 0.0
+        self._sum = math.fsum(v - self._shift for v in self._vals)
+        self._sumsq = math.fsum((v - self._shift) ** 2 for v in self._vals)
+        self._since_resync = 0
+
+    def mean(self) -> float:
+        n = len(self._vals)
+        return self._shift + self._sum / n if n else 0.0
+
+    def std(self) -> float:
+        n = len(self._vals)
+        if n == 0:
+            return 0.0
+        m = self._sum / n
+        return math.sqrt(max(0.0, self._sumsq / n - m * m))
+
+
+class SigmaSpikeZStream:
+    """
+    Streaming sigma_spike_z: O(1) per new mid (or log return).
+
+    Keeps the short-window return stats and the last (long - short + 2) short-window sigmas,
+    i.e. exactly the values the batch kernel derives from the last long + 2 mids.
+    """
+
+    def __init__(self, short_steps: int, long_steps: int, eps: float = 1e-9):
+        self.short_steps = short_steps
+        self.long_steps = long_steps
+        self.eps = eps
+        self.n_returns = 0
+        self._last_log_mid: float | None = None
+        self._short = SlidingStats(max(1, short_steps))
+        self._sigmas = SlidingStats(max(1, long_steps - short_steps + 2))
+
+    def push_mid(self, mid: float) -> float:
+        """Add one mid; return the current z."""
+        log_mid = math.log(max(mid, self.eps))
+        if self._last_log_mid is not None:
+            self.push_return(log_mid - self._last_log_mid)
+        self._last_log_mid = log_mid
+        return self.value()
+
+    def push_return(self, r: float) -> None:
+        """Add one log return (for callers that already maintain returns)."""
+        self.n_returns += 1
+        self._short.push(r)
+        if self.n_returns >= self.short_steps:
+            self._sigmas.push(self._short.std())
+
+    def value(self) -> float:
+        short, long = self.short_steps, self.long_steps
+        if short <= 0 or short > long + 1:
+            return 0.0
+        if self.n_returns < max(short, long) + 1:
+            return 0.0
+        std_l = self._sigmas.std()
+        if std_l < self.eps:
+            return 0.0
+        return (self._short.std() - self._sigmas.mean()) / (std_l + self.eps)
@@ -0,0 +1,364 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Stateful rolling feature engine: same output as build_features, O(log n) per tick.
+
+One shared log-return ring buffer feeds sliding Welford accumulators (sigma, sigma_5m);
+two-heap quantile windows give spread median and depth p10 (O(log n)); a monotonic deque
+gives staleness max; sigma_spike_z is streamed (SigmaSpikeZStream) from the same returns."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import deque
+from typing import Any
+
+import numpy as np
+
+from mdm_engine.features.feature_builder import _book_features
+from mdm_engine.features.kernels import SigmaSpikeZStream
+
+
+class ReturnRing:
+    """Fixed-capacity ring of floats; last(k) is a contiguous zero-copy view (mirrored buffer)."""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._buf = np.zeros(2 * self.capacity, dtype=float)
+        self._head = 0
+        self.count = 0
+
+    def append(self, x: float) -> None:
+        h = self._head
+        self._buf[h] = x
+        self._buf[h + self.capacity] = x
+        self._head = (h + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def ago(self, k: int) -> float:
+        """Value appended k steps before the newest (k=0 -> newest); k < count."""
+        return float(self._buf[(self._head - 1 - k) % self.capacity])
+
+    def last(self, k: int) -> np.ndarray:
+        """View of the newest min(k, count) values, oldest first."""
+        k = min(k, self.count)
+        end = (self._head - 1) % self.capacity + self.capacity + 1
+        return self._buf[end - k : end]
+
+
+class SlidingMoments:
+    """Welford mean/variance over the newest `window` values of a shared ReturnRing."""
+
+    def __init__(self, ring: ReturnRing, window: int, resync_every: int = 10_000):
+        self.ring = ring
+        self.window = max(0, window)
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._resync_every = resync_every
+        self._since_resync = 0
+
+    def on_append(self, x: float) -> None:
+        """Call right after ring.append(x): add x, drop the value leaving the window."""
+        if self.window == 0:
+            return
+        if self.n == self.window:
+            y = self.ring.ago(self.window)
+            self.n -= 1
+            if self.n == 0:
+                self.mean = 0.0
+                self._m2 = 0.0
+            else:
+                d = y - self.mean
+                self.mean -= d / self.n
+                self._m2 -= d * (y - self.mean)
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self._m2 += d * (x - self.mean)
+        self._since_resync += 1
+        if self._since_resync >= self._resync_every:
+            self.resync()
+
+    def resync(self) -> None:
+        """Recompute exactly from the ring (bounds floating-point drift; amortized O(1))."""
+        vals = self.ring.last(self.n)
+        self.mean = float(np.mean(vals)) if self.n else 0.0
+        self._m2 = float(np.sum((vals - self.mean) ** 2)) if self.n else 0.0
+        self._since_resync = 0
+
+    def std(self) -> float:
+        """Population std (ddof=0, as np.std)."""
+        if self.n == 0:
+            return 0.0
+        return math.sqrt(max(0.0, self._m2) / self.n)
+
+
+class QuantileWindow:
+    """
+    q-th percentile of the newest `window` values (np.percentile linear method; q=50 is
+    np.median), O(log n) per push.
+
+    Two heaps split at the percentile's lower rank: a max-heap of the k smallest values and
+    a min-heap of the rest. Entries carry their sequence number, so a value leaving the
+    window is dropped lazily once it surfaces; the heaps are compacted when dead entries
+    outnumber the window (amortized O(1)).
+    """
+
+    def __init__(self, window: int, q: float):
+        self.window = max(1, window)
+        self.q = q
+        self._t = 0  # sequence number of the next value
+        self._lo: list[tuple[float, int]] = []  # (-value, -seq)
+        self._hi: list[tuple[float, int]] = []  # (value, seq)
+        self._n_lo = 0  # live entries in _lo / _hi
+        self._n_hi = 0
+        self._in_lo = bytearray(self.window)  # seq % window -> entry is in _lo
+
+    def __len__(self) -> int:
+        return min(self._t, self.window)
+
+    def _prune(self, start: int) -> None:
+        lo, hi = self._lo, self._hi
+        while lo and -lo[0][1] < start:
+            heapq.heappop(lo)
+        while hi and hi[0][1] < start:
+            heapq.heappop(hi)
+
+    def push(self, x: float) -> None:
+        t, w = self._t, self.window
+        in_lo = self._in_lo
+        if t >= w:  # seq t - w leaves; its slot is reused by t
+            if in_lo[t % w]:
+                self._n_lo -= 1
+            else:
+                self._n_hi -= 1
+        self._t = t + 1
+        start = self._t - w
+        lo, hi = self._lo, self._hi
+        self._prune(start)
+        if lo and x < -lo[0][0]:
+            heapq.heappush(lo, (-x, -t))
+            in_lo[t % w] = 1
+            self._n_lo += 1
+        else:
+            heapq.heappush(hi, (x, t))
+            in_lo[t % w] = 0
+            self._n_hi += 1
+        k = math.floor((self._n_lo + self._n_hi - 1) * self.q / 100.0) + 1
+        while self._n_lo > k:
+            v, s = heapq.heappop(lo)
+            heapq.heappush(hi, (-v, -s))
+            in_lo[-s % w] = 0
+            self._n_lo -= 1
+            self._n_hi += 1
+            self._prune(start)
+        while self._n_lo < k:
+            v, s = heapq.heappop(hi)
+            heapq.heappush(lo, (-v, -s))
+            in_lo[s % w] = 1
+            self._n_lo += 1
+            self._n_hi -= 1
+            self._prune(start)
+        if len(lo) + len(hi) > 2 * w:
+            self._lo = [e for e in lo if -e[1] >= start]
+            self._hi = [e for e in hi if e[1] >= start]
+            heapq.heapify(self._lo)
+            heapq.heapify(self._hi)
+
+    def value(self) -> float:
+        n = self._n_lo + self._n_hi
+        if n == 0:
+            return 0.0
+        h = (n - 1) * self.q / 100.0
+        a = -self._lo[0][0]  # rank floor(h)
+        b = self._hi[0][0] if self._n_hi else a  # rank floor(h) + 1 (clamped)
+        if self.q == 50 and n % 2 == 0:
+            return (a + b) / 2.0
+        return a + (h - math.floor(h)) * (b - a)
+
+
+class WindowMax:
+    """Sliding-window max via monotonic deque (amortized O(1))."""
+
+    def __init__(self, window: int):
+        self.window = max(1, window)
+        self._t = 0
+        self._dq: deque[tuple[int, float]] = deque()
+
+    def push(self, x: float) -> None:
+        dq = self._dq
+        while dq and dq[-1][1] <= x:
+            dq.pop()
+        dq.append((self._t, x))
+        if dq[0][0] <= self._t - self.window:
+            dq.popleft()
+        self._t += 1
+
+    def max(self, default: float = 0) -> float:
+        return self._dq[0][1] if self._dq else default
+
+
+class RollingFeatureEngine:
+    """
+    Incremental build_features: push one (mid, spread, depth, staleness) per tick, then read
+    features. Equivalent to build_features with the pushed values as the history lists.
+
+    regime_5m=False mirrors calling build_features without spread/depth/staleness histories.
+    """
+
+    def __init__(
+        self,
+        vol_window: int,
+        window_5m_steps: int = 300,
+        sigma_short_steps: int = 20,
+        sigma_long_steps: int = 100,
+        imbalance_lambda: float = 0.7,
+        tick_size: float = 0.01,
+        fee_ticks: float = 0.0,
+        slippage_ticks: float = 0.5,
+        buffer_ticks: float = 0.5,
+        eps: float = 1e-9,
+        regime_5m: bool = True,
+    ):
+        self.vol_window = vol_window
+        self.window_5m_steps = window_5m_steps
+        self.sigma_short_steps = sigma_short_steps
+        self.sigma_long_steps = sigma_long_steps
+        self.imbalance_lambda = imbalance_lambda
+        self.tick_size = tick_size
+        self.cost_ticks = fee_ticks + slippage_ticks + buffer_ticks
+        self.eps = eps
+        self.regime_5m = regime_5m
+        self.n_mids = 0
+        self._last_log_mid: float | None = None
+        # +1: a window of w returns reads the value leaving it (w steps back) on append.
+        ring_cap = max(vol_window + 1, window_5m_steps, 2)
+        self.returns = ReturnRing(ring_cap)
+        self._sigma = SlidingMoments(self.returns, max(0, vol_window))
+        self._sigma_5m = SlidingMoments(self.returns, max(0, window_5m_steps - 1))
+        self._spreads = QuantileWindow(window_5m_steps, 50)
+        self._depths = QuantileWindow(window_5m_steps, 10)
+        self._staleness = WindowMax(window_5m_steps)
+        self._spike = SigmaSpikeZStream(sigma_short_steps, sigma_long_steps, eps)
+
+    def push(
+        self,
+        mid: float,
+        spread: float | None = None,
+        depth: float | None = None,
+        staleness_ms: int | None = None,
+    ) -> None:
+        """Append one history step (mid, and the 5m inputs when regime_5m)."""
+        log_mid = math.log(max(mid, self.eps))
+        if self._last_log_mid is not None:
+            r = log_mid - self._last_log_mid
+            self.returns.append(r)
+            self._sigma.on_append(r)
+            self._sigma_5m.on_append(r)
+            self._spike.push_return(r)
+        self._last_log_mid = log_mid
+        self.n_mids += 1
+        if self.regime_5m:
+            self._spreads.push(float(spread or 0.0))
+            self._depths.push(float(depth or 0.0))
+            self._staleness.push(int(staleness_ms or 0))
+
+    def sigma(self) -> float:
+        if self.n_mids < 2 or self.vol_window <= 0:
+            return 0.0
+        return self._sigma.std()
+
+    def sigma_spike_z(self) -> float:
+        return self._spike.value()
+
+    def regime_aggregates(self) -> dict[str, float]:
+        """sigma_5m, spread_med_5m, depth_p10_5m, staleness_max_5m (as _rolling_5m_aggregates)."""
+        n = min(self.n_mids, self.window_5m_steps)
+        if n < 2:
+            return {
+                "sigma_5m": 0.0,
+                "spread_med_5m": 0.0,
+                "depth_p10_5m": float("inf"),
+                "staleness_max_5m": 0,
+            }
+        return {
+            "sigma_5m": self._sigma_5m.std(),
+            "spread_med_5m": self._spreads.value(),
+            "depth_p10_5m": self._depths.value(),
+            "staleness_max_5m": int(self._staleness.max(0)),
+        }
+
+    def features(
+        self,
+        bid: float,
+        ask: float,
+        bid_depth: float,
+        ask_depth: float,
+        top_n_bids: list[tuple[float, float]] | None,
+        top_n_asks: list[tuple[float, float]] | None,
+        last_event_ts_ms: int,
+        now_ms: int,
+    ) -> dict[str, Any]:
+        """Features for the current snapshot against the pushed history (no push)."""
+        out = _book_features(
+            bid,
+            ask,
+            bid_depth,
+            ask_depth,
+            top_n_bids,
+            top_n_asks,
+            self.imbalance_lambda,
+            self.tick_size,
+            self.eps,
+        )
+        staleness_ms = now_ms - last_event_ts_ms
+        sigma = self.sigma()
+        out["sigma"] = sigma
+        out["sigma_spike_z"] = self.sigma_spike_z()
+        out["cost_ticks"] = self.cost_ticks
+        out["staleness_ms"] = staleness_ms
+        out["last_event_ts_ms"] = last_event_ts_ms
+        out["now_ms"] = now_ms
+        if self.regime_5m:
+            out.update(self.regime_aggregates())
+        else:
+            out["sigma_5m"] = sigma
+            out["spread_med_5m"] = out["spread"]
+            out["depth_p10_5m"] = out["depth"]
+            out["staleness_max_5m"] = staleness_ms
+        return out
+
+    def update(
+        self,
+        bid: float,
+        ask: float,
+        bid_depth: float,
+        ask_depth: float,
+        top_n_bids: list[tuple[float, float]] | None,
+        top_n_asks: list[tuple[float, float]] | None,
+        last_event_ts_ms: int,
+        now_ms: int,
+    ) -> dict[str, Any]:
+        """Push this snapshot's mid/spread/depth/staleness, then return its features."""
+        mid = (bid + ask) / 2.0 if (bid > 0 and ask > 0) else bid or ask
+        depth_b = sum(q for _, q in top_n_bids) if top_n_bids else bid_depth
+        depth_a = sum(q for _, q in top_n_asks) if top_n_asks else ask_depth
+        self.push(
+            mid,
+            max(0.0, ask - bid),
+            depth_b + depth_a,
+            now_ms - last_event_ts_ms,
+        )
+        return self.features(
+            bid,
+            ask,
+            bid_depth,
+            ask_depth,
+            top_n_bids,
+            top_n_asks,
+            last_event_ts_ms,
+            now_ms,
+        )
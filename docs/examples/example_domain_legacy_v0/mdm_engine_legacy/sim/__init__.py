@@ -3,8 +3,8 @@
 # SPDX-License-Identifier: MIT
 """Sim: microstructure sim, synthetic source, paper broker."""
 
-from mdm_engine.sim.microstructure_sim import MicrostructureSim
+from mdm_engine.sim.microstructure_sim import BOOK_DTYPE, MicrostructureSim
 from mdm_engine.sim.synthetic_source import SyntheticSource
 from mdm_engine.sim.paper_broker import PaperBroker
 
-__all__ = ["MicrostructureSim", "SyntheticSource", "PaperBroker"]
+__all__ = ["MicrostructureSim", "SyntheticSource", "PaperBroker", "BOOK_DTYPE"]
@@ -0,0 +1,123 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Typed append buffers for long sim runs: growable arrays, optional fixed-capacity ring,
+downsampled equity curve with O(1) running summary."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+
+class ArrayBuffer:
+    """
+    Append-only numpy buffer (any dtype, incl. structured).
+
+    Unbounded: capacity doubles (amortized O(1) append). maxlen: ring of the newest maxlen
+    values, written twice (mirrored) so view() is always a contiguous zero-copy slice.
+    """
+
+    def __init__(self, dtype: Any = np.float64, maxlen: int | None = None):
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self.maxlen = maxlen
+        self._buf = np.zeros(2 * maxlen if maxlen else 64, dtype=dtype)
+        self._n = 0
+        self._head = 0
+        self.total = 0  # values ever appended (including evicted)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, value: Any) -> None:
+        self.total += 1
+        cap = self.maxlen
+        if cap is None:
+            if self._n == len(self._buf):
+                grown = np.zeros(2 * len(self._buf), dtype=self._buf.dtype)
+                grown[: self._n] = self._buf
+                self._buf = grown
+            self._buf[self._n] = value
+            self._n += 1
+            return
+        h = self._head
+        self._buf[h] = value
+        self._buf[h + cap] = value
+        self._head = (h + 1) % cap
+        if self._n < cap:
+            self._n += 1
+
+    def view(self) -> np.ndarray:
+        """Read-only view of the retained values, oldest first (no copy)."""
+        if self.maxlen is None:
+            out = self._buf[: self._n]
+        else:
+            end = self._head + self.maxlen if self._n == self.maxlen else self._n
+            out = self._buf[end - self._n : end]
+        out = out.view()
+        out.flags.writeable = False
+        return out
+
+    def clear(self) -> None:
+        self._n = 0
+        self._head = 0
+        self.total = 0
+
+
+class EquityCurve:
+    """
+    Equity per tick: keeps every `every`-th point (ArrayBuffer, optional maxlen ring) and
+    running stats over all points (count, last, min, max, mean, max_drawdown).
+
+    Iterable/indexable like the list it replaces.
+    """
+
+    def __init__(self, maxlen: int | None = None, every: int = 1):
+        self.every = max(1, every)
+        self._points = ArrayBuffer(np.float64, maxlen)
+        self.count = 0
+        self.last = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._sum = 0.0
+        self.max_drawdown = 0.0
+
+    def append(self, equity: float) -> None:
+        if self.count % self.every == 0:
+            self._points.append(equity)
+        self.count += 1
+        self.last = equity
+        self._sum += equity
+        self.min = min(self.min, equity)
+        self.max = max(self.max, equity)
+        self.max_drawdown = max(self.max_drawdown, self.max - equity)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._points.view().tolist())
+
+    def __getitem__(self, index):
+        return self._points.view()[index]
+
+    def view(self) -> np.ndarray:
+        """Retained points as a read-only array (no copy)."""
+        return self._points.view()
+
+    def summary(self) -> dict[str, float]:
+        """Running stats over all points (including downsampled/evicted); O(1)."""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "last": self.last,
+            "min": self.min,
+            "max": self.max,
+            "mean": self._sum / self.count,
+            "max_drawdown": self.max_drawdown,
+        }
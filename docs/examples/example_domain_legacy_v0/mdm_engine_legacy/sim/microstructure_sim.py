@@ -8,6 +8,19 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
+import numpy as np
+
+# simulate() output: one record per (path, step), same fields as BookSnapshot.
+BOOK_DTYPE = np.dtype(
+    [
+        ("ts_ms", np.int64),
+        ("bid", np.float64),
+        ("ask", np.float64),
+        ("bid_depth", np.float64),
+        ("ask_depth", np.float64),
+    ]
+)
+
 
 @dataclass
 class BookSnapshot:
@@ -36,6 +49,7 @@ class MicrostructureSim:
         self.spread_min = spread_min
         self.vol = vol
         self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
         self.fee_bps = fee_bps
         self.dt_ms = max(1, dt_ms)
         self._ts_ms = 0
@@ -60,6 +74,48 @@ class MicrostructureSim:
             ts_ms=self._ts_ms,
         )
 
+    def simulate(self, n_steps: int, n_paths: int = 1) -> np.ndarray:
+        """
+        Vectorized steps for independent paths (numpy Generator, self.np_rng).
+
+        Same dynamics, tick rounding and ask > bid rule as step(); every path starts from the
+        current mid and clock. With n_paths == 1 the sim continues from the path's last step,
+        so consecutive calls chain like step().
+
+        Returns:
+            Structured array of BOOK_DTYPE, shape (n_paths, n_steps).
+        """
+        n_steps = max(0, int(n_steps))
+        n_paths = max(1, int(n_paths))
+        rng = self.np_rng
+        shape = (n_paths, n_steps)
+        out = np.empty(shape, dtype=BOOK_DTYPE)
+        if n_steps == 0:
+            return out
+
+        # mid_t = max(0.01, mid_{t-1} + z_t): Lindley recursion in closed form,
+        # mid_t = 0.01 + S_t + max(mid_0 - 0.01, -min_{s<=t} S_s), S = cumsum(z).
+        floor = 0.01
+        walk = np.cumsum(rng.normal(0.0, self.vol, shape), axis=1)
+        lift = np.maximum(self.mid - floor, -np.minimum.accumulate(walk, axis=1))
+        mid = floor + walk + lift
+
+        half = (self.spread_min + rng.uniform(0.0, 0.02, shape)) / 2.0
+        tick = self.tick_size
+        bid = np.round((mid - half) / tick) * tick
+        ask = np.round((mid + half) / tick) * tick
+        ask = np.where(ask <= bid, bid + tick, ask)
+
+        out["ts_ms"] = self._ts_ms + self.dt_ms * np.arange(1, n_steps + 1)
+        out["bid"] = bid
+        out["ask"] = ask
+        out["bid_depth"] = np.maximum(10.0, 100.0 + rng.normal(0.0, 20.0, shape))
+        out["ask_depth"] = np.maximum(10.0, 100.0 + rng.normal(0.0, 20.0, shape))
+        if n_paths == 1:
+            self.mid = float(mid[0, -1])
+            self._ts_ms = int(out["ts_ms"][0, -1])
+        return out
+
     def try_fill(
         self,
         side: str,
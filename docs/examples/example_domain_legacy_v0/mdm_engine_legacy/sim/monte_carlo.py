@@ -0,0 +1,222 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Monte Carlo runner: sim stack (MicrostructureSim, PaperBroker, OrderManager, DecisionEngine)
+over many seeds in a process pool.
+
+Seeds are SeedSequence children (reproducible for any worker count); workers return compact
+RunSummary records (no state), merged into per-metric distribution stats."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+import numpy as np
+from decision_schema.types import Action
+
+from mdm_engine.execution.order_manager import OrderManager
+from mdm_engine.features.rolling import RollingFeatureEngine
+from mdm_engine.mdm.decision_engine import DecisionEngine
+from mdm_engine.sim.microstructure_sim import MicrostructureSim
+from mdm_engine.sim.paper_broker import PaperBroker
+
+
+@dataclass
+class RunConfig:
+    """
+    One scenario; must be picklable (model: top-level function).
+
+    model is required: the core reference model reads generic keys (signal_1), not the book
+    features built here, so it would never ACT. Pass e.g. reference_model_legacy's
+    compute_proposal_reference.
+    """
+
+    model: Callable[..., Any]
+    steps: int = 1000
+    market_id: str = "sim"
+    initial_cash: float = 1000.0
+    size_usd: float = 1.0
+    vol_window: int = 50
+    engine_kwargs: dict[str, Any] = field(default_factory=dict)
+    sim_kwargs: dict[str, Any] = field(default_factory=dict)
+    order_kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RunSummary:
+    """Compact per-run result (what crosses the process boundary)."""
+
+    run_index: int
+    steps: int
+    act_count: int
+    fills_count: int
+    realized_pnl: float
+    final_equity: float
+    equity_mean: float
+    equity_min: float
+    equity_max: float
+    max_drawdown: float
+    position_open_count: int
+    position_close_count: int
+
+
+@dataclass
+class MonteCarloResult:
+    """Per-run summaries (in run order), merged stats, pool size and wall time."""
+
+    summaries: list[RunSummary]
+    stats: dict[str, dict[str, float]]
+    workers: int
+    elapsed_s: float
+
+
+def run_one(
+    config: RunConfig, seed: np.random.SeedSequence, run_index: int = 0
+) -> RunSummary:
+    """One seeded run of the sim stack; returns its summary only."""
+    sim_seed = int(seed.generate_state(1, dtype=np.uint64)[0])
+    sim = MicrostructureSim(seed=sim_seed, **config.sim_kwargs)
+    broker = PaperBroker(
+        initial_cash=config.initial_cash,
+        sim=sim,
+        equity_maxlen=1,
+        fill_records_maxlen=1,
+    )
+    orders = OrderManager(broker, tick_size=sim.tick_size, **config.order_kwargs)
+    engine = DecisionEngine(**config.engine_kwargs)
+    engine.swap_model(config.model, provider="monte_carlo")
+    features = RollingFeatureEngine(config.vol_window, tick_size=sim.tick_size)
+    market_id = config.market_id
+
+    books = sim.simulate(config.steps)[0]
+    act_count = 0
+    mid = sim.mid
+    for ts_ms, bid, ask, bid_depth, ask_depth in zip(
+        books["ts_ms"].tolist(),
+        books["bid"].tolist(),
+        books["ask"].tolist(),
+        books["bid_depth"].tolist(),
+        books["ask_depth"].tolist(),
+    ):
+        feats = features.update(
+            bid, ask, bid_depth, ask_depth, None, None, ts_ms, ts_ms
+        )
+        mid = feats["mid"]
+        broker.set_book(feats)
+        proposal = engine.propose(feats)
+        if proposal.action == Action.ACT:
+            act_count += 1
+            params = proposal.params or {}
+            half = feats["spread"] / 4.0
+            orders.set_quotes(
+                market_id,
+                params.get("bid_quote", mid - half),
+                params.get("ask_quote", mid + half),
+                params.get("size_usd", config.size_usd),
+                ts_ms,
+            )
+        elif proposal.action == Action.EXIT:
+            orders.cancel_all(market_id)
+            broker.flatten_position(market_id, mid)
+        for fill in broker.process_fills(ts_ms):
+            orders.on_fill(fill["market_id"], ts_ms)
+    broker.flatten_position(market_id, mid)
+
+    state = broker.get_state(equity="summary")
+    equity = state["equity_summary"]
+    if equity["count"] == 0:
+        cash = config.initial_cash
+        equity = {
+            "last": cash,
+            "min": cash,
+            "max": cash,
+            "mean": cash,
+            "max_drawdown": 0.0,
+        }
+    return RunSummary(
+        run_index=run_index,
+        steps=config.steps,
+        act_count=act_count,
+        fills_count=state["fills_count"],
+        realized_pnl=state["realized_pnl"],
+        final_equity=equity["last"],
+        equity_mean=equity["mean"],
+        equity_min=equity["min"],
+        equity_max=equity["max"],
+        max_drawdown=equity["max_drawdown"],
+        position_open_count=state["position_open_count"],
+        position_close_count=state["position_close_count"],
+    )
+
+
+def _run_chunk(
+    config: RunConfig, seeds: list[np.random.SeedSequence], start: int
+) -> list[RunSummary]:
+    return [run_one(config, s, start + i) for i, s in enumerate(seeds)]
+
+
+def merge_summaries(summaries: list[RunSummary]) -> dict[str, dict[str, float]]:
+    """Per-metric distribution stats: mean, std, min, p05, p50, p95, max."""
+    if not summaries:
+        return {}
+    names = [f.name for f in fields(RunSummary) if f.name != "run_index"]
+    table = np.array([[getattr(s, n) for n in names] for s in summaries], dtype=float)
+    p05, p50, p95 = np.percentile(table, [5, 50, 95], axis=0)
+    mean, std = table.mean(axis=0), table.std(axis=0)
+    lo, hi = table.min(axis=0), table.max(axis=0)
+    return {
+        n: {
+            "mean": float(mean[j]),
+            "std": float(std[j]),
+            "min": float(lo[j]),
+            "p05": float(p05[j]),
+            "p50": float(p50[j]),
+            "p95": float(p95[j]),
+            "max": float(hi[j]),
+        }
+        for j, n in enumerate(names)
+    }
+
+
+def run_monte_carlo(
+    config: RunConfig,
+    n_runs: int,
+    seed: int | None = 0,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> MonteCarloResult:
+    """
+    Run n_runs seeded scenarios and merge their summaries.
+
+    Args:
+        seed: root of SeedSequence(seed).spawn(n_runs); run i always gets child i.
+        workers: process count (None = os.cpu_count(); <= 1 runs in-process).
+        chunk_size: runs per task (default: about 4 tasks per worker).
+    """
+    children = np.random.SeedSequence(seed).spawn(n_runs)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    t0 = time.perf_counter()
+    if workers <= 1 or n_runs <= 1:
+        summaries = _run_chunk(config, children, 0)
+        workers = 1
+    else:
+        chunk = chunk_size or max(1, n_runs // (workers * 4))
+        starts = range(0, n_runs, chunk)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_chunk, config, children[s : s + chunk], s)
+                for s in starts
+            ]
+            summaries = [s for f in futures for s in f.result()]
+    return MonteCarloResult(
+        summaries=summaries,
+        stats=merge_summaries(summaries),
+        workers=workers,
+        elapsed_s=time.perf_counter() - t0,
+    )
@@ -8,9 +8,24 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
-from mdm_engine.adapters.base import Broker
+import numpy as np
+
+from mdm_engine.adapters.base import Broker, OrderRequest
+from mdm_engine.sim.buffers import ArrayBuffer, EquityCurve
 from mdm_engine.sim.microstructure_sim import MicrostructureSim, BookSnapshot
 
+# Persistent fill records (adverse_selection): market_id interned, side as index into SIDES.
+SIDES = ("bid", "ask")
+FILL_DTYPE = np.dtype(
+    [
+        ("fill_ts_ms", np.int64),
+        ("fill_mid", np.float64),
+        ("side", np.uint8),
+        ("qty", np.float64),
+        ("market", np.int32),
+    ]
+)
+
 
 @dataclass
 class PaperState:
@@ -19,7 +34,7 @@ class PaperState:
     cost_basis: dict[str, float] = field(
         default_factory=dict
     )  # cost paid for current position
-    equity_curve: list[float] = field(default_factory=list)
+    equity_curve: EquityCurve = field(default_factory=EquityCurve)
     realized_pnl: float = 0.0
     fill_events: list[dict] = field(default_factory=list)
     # Cumulative counters for summary
@@ -28,41 +43,174 @@ class PaperState:
     position_close_count: int = 0
 
 
+class MarkToMarket:
+    """
+    Running exposure (sum |pos| * mid) and mark value (sum pos * mid) over markets; O(1) per
+    position or mid change. Markets without their own mid use the shared default mid, kept as
+    sums of |pos| and pos so a default-mid change is O(1) too.
+    """
+
+    def __init__(self, positions: dict[str, float], resync_every: int = 10_000):
+        self.positions = positions
+        self.mids: dict[str, float] = {}
+        self.default_mid = 0.5
+        self._own_exposure = 0.0
+        self._own_mark = 0.0
+        self._default_abs = 0.0
+        self._default_pos = 0.0
+        self._resync_every = resync_every
+        self._updates = 0
+
+    def mid(self, market_id: str) -> float:
+        return self.mids.get(market_id, self.default_mid)
+
+    def exposure(self) -> float:
+        return self._own_exposure + self._default_abs * self.default_mid
+
+    def mark(self) -> float:
+        return self._own_mark + self._default_pos * self.default_mid
+
+    def on_position(self, market_id: str, old: float, new: float) -> None:
+        """Position of market_id changed old -> new (call after updating positions)."""
+        mid = self.mids.get(market_id)
+        if mid is None:
+            self._default_abs += abs(new) - abs(old)
+            self._default_pos += new - old
+        else:
+            self._own_exposure += (abs(new) - abs(old)) * mid
+            self._own_mark += (new - old) * mid
+        self._tick()
+
+    def set_mid(self, market_id: str, mid: float) -> None:
+        """Per-market mid (first call moves the market off the default mid)."""
+        pos = self.positions.get(market_id, 0.0)
+        old = self.mids.get(market_id)
+        if old is None:
+            self._default_abs -= abs(pos)
+            self._default_pos -= pos
+            old = 0.0
+        self.mids[market_id] = mid
+        self._own_exposure += abs(pos) * (mid - old)
+        self._own_mark += pos * (mid - old)
+        self._tick()
+
+    def _tick(self) -> None:
+        self._updates += 1
+        if self._updates >= self._resync_every:
+            self.resync()
+
+    def resync(self) -> None:
+        """Recompute the sums from positions (bounds float drift; O(markets), amortized O(1))."""
+        own_e = own_m = def_a = def_p = 0.0
+        for m, pos in self.positions.items():
+            mid = self.mids.get(m)
+            if mid is None:
+                def_a += abs(pos)
+                def_p += pos
+            else:
+                own_e += abs(pos) * mid
+                own_m += pos * mid
+        self._own_exposure, self._own_mark = own_e, own_m
+        self._default_abs, self._default_pos = def_a, def_p
+        self._updates = 0
+
+
 class PaperBroker(Broker):
-    """Simulate fills from book; track cash, inventory, cost basis, PnL, lifecycle counters."""
+    """
+    Simulate fills from book; track cash, inventory, cost basis, PnL, lifecycle counters.
+
+    Memory is bounded on request: equity_maxlen / fill_records_maxlen keep only the newest
+    values (ring), equity_every keeps every k-th equity point (summary stats still see all).
+
+    set_book(book, market_id) keeps a per-market book table; exposure and equity are running
+    totals (MarkToMarket). Markets without their own book use the last unkeyed book's mid.
+    version increments on every state change (fill, close, mid move); snapshot() is rebuilt
+    only when it changed. replace_order re-prices a live order (supports_replace);
+    submit_orders / cancel_orders take a whole batch in one call (supports_bulk).
+    """
+
+    supports_replace = True
+    supports_bulk = True
 
     def __init__(
         self,
         initial_cash: float = 1000.0,
         sim: MicrostructureSim | None = None,
+        equity_maxlen: int | None = None,
+        equity_every: int = 1,
+        fill_records_maxlen: int | None = None,
     ):
-        self._state = PaperState(cash=initial_cash)
+        self._state = PaperState(
+            cash=initial_cash, equity_curve=EquityCurve(equity_maxlen, equity_every)
+        )
         self._sim = sim or MicrostructureSim()
         self._book: dict[str, Any] = {}
-        self._fill_records: list[
-            dict[str, Any]
-        ] = []  # persistent for adverse_selection (fill_ts_ms, fill_mid, side, qty)
+        self._books: dict[str, dict[str, Any]] = {}
+        self._marks = MarkToMarket(self._state.positions)
+        self.version = 0
+        self._snapshot: dict[str, Any] | None = None
+        self._snapshot_version = -1
+        self._open_orders: dict[str, tuple[str, str, bool]] = {}
+        # persistent for adverse_selection (fill_ts_ms, fill_mid, side, qty, market)
+        self._fill_records = ArrayBuffer(FILL_DTYPE, fill_records_maxlen)
+        self._market_ids: list[str] = []
+        self._market_codes: dict[str, int] = {}
 
-    def set_book(self, book: dict[str, Any]) -> None:
-        """Update current book snapshot for fill simulation."""
-        self._book = book
+    def set_book(self, book: dict[str, Any], market_id: str | None = None) -> None:
+        """Update current book snapshot for fill simulation (market_id: that market's book)."""
+        marks = self._marks
+        mid = book.get("mid")
+        if mid is None:
+            mid = 0.5
+        if market_id is None:
+            self._book = book
+            if mid != marks.default_mid:
+                marks.default_mid = mid
+                self.version += 1
+            return
+        self._books[market_id] = book
+        if marks.mids.get(market_id) != mid:
+            marks.set_mid(market_id, mid)
+            self.version += 1
+
+    def _set_position(self, market_id: str, pos: float) -> None:
+        positions = self._state.positions
+        old = positions.get(market_id, 0.0)
+        positions[market_id] = pos
+        self._marks.on_position(market_id, old, pos)
+        self.version += 1
 
-    def get_state(self) -> dict[str, Any]:
+    def equity(self) -> float:
+        """Cash + realized PnL + positions marked at their mids (O(1))."""
         state = self._state
-        positions = dict(state.positions)
-        exposure = sum(
-            abs(v) * (self._book.get("mid") or 0.5) for v in positions.values()
-        )
-        return {
+        return state.cash + state.realized_pnl + self._marks.mark()
+
+    def get_state(self, equity: str = "list") -> dict[str, Any]:
+        """
+        Broker state. equity selects how the equity curve is returned:
+        "list" (equity_curve copy, default), "view" (equity_curve as read-only array, no copy),
+        "summary" (equity_summary: count/last/min/max/mean/max_drawdown, O(1)).
+        """
+        state = self._state
+        out = {
+            "version": self.version,
             "cash": state.cash,
-            "positions": positions,
+            "positions": dict(state.positions),
             "realized_pnl": state.realized_pnl,
-            "equity_curve": list(state.equity_curve),
-            "exposure_usd": exposure,
+            "exposure_usd": self._marks.exposure(),
             "fills_count": state.fills_count,
             "position_open_count": state.position_open_count,
             "position_close_count": state.position_close_count,
         }
+        if equity == "list":
+            out["equity_curve"] = list(state.equity_curve)
+        elif equity == "view":
+            out["equity_curve"] = state.equity_curve.view()
+        elif equity == "summary":
+            out["equity_summary"] = state.equity_curve.summary()
+        else:
+            raise ValueError(f"Unknown equity mode: {equity!r}")
+        return out
 
     def submit_order(
         self,
@@ -73,14 +221,17 @@ class PaperBroker(Broker):
         post_only: bool,
     ) -> dict[str, Any]:
         """Simulate fill; update position, cost_basis, and lifecycle counters."""
-        if not self._book:
-            return {"order_id": f"paper-{market_id}-{side}", "filled": False}
+        order_id = f"paper-{market_id}-{side}"
+        self._open_orders[order_id] = (market_id, side, post_only)
+        current = self._books.get(market_id, self._book)
+        if not current:
+            return {"order_id": order_id, "filled": False}
         book = BookSnapshot(
-            bid=self._book["bid"],
-            ask=self._book["ask"],
-            bid_depth=self._book.get("bid_depth", 100.0),
-            ask_depth=self._book.get("ask_depth", 100.0),
-            ts_ms=self._book.get("ts_ms", 0),
+            bid=current["bid"],
+            ask=current["ask"],
+            bid_depth=current.get("bid_depth", 100.0),
+            ask_depth=current.get("ask_depth", 100.0),
+            ts_ms=current.get("ts_ms", 0),
         )
         filled, fill_price = self._sim.try_fill(
             side,
@@ -88,7 +239,7 @@ class PaperBroker(Broker):
             size_usd,
             book,
             post_only,
-            imbalance=self._book.get("imbalance", 0.0),
+            imbalance=current.get("imbalance", 0.0),
             depth=book.bid_depth + book.ask_depth,
         )
         if filled and fill_price > 0:
@@ -97,15 +248,15 @@ class PaperBroker(Broker):
                 size = -size
             prev_pos = self._state.positions.get(market_id, 0.0)
             prev_cost = self._state.cost_basis.get(market_id, 0.0)
-            self._state.positions[market_id] = prev_pos + size
+            self._set_position(market_id, prev_pos + size)
             self._state.cost_basis[market_id] = prev_cost + fill_price * size
             self._state.fills_count += 1
             if prev_pos == 0.0 and prev_pos + size != 0.0:
                 self._state.position_open_count += 1
-            ts_ms = self._book.get("ts_ms", 0)
+            ts_ms = current.get("ts_ms", 0)
             fill_mid = (
-                (self._book.get("bid", 0.0) + self._book.get("ask", 0.0)) / 2.0
-                if self._book.get("bid") is not None
+                (current.get("bid", 0.0) + current.get("ask", 0.0)) / 2.0
+                if current.get("bid") is not None
                 else fill_price
             )
             self._state.fill_events.append(
@@ -117,48 +268,123 @@ class PaperBroker(Broker):
                     "size": size,
                 }
             )
+            code = self._market_codes.get(market_id)
+            if code is None:
+                code = self._market_codes[market_id] = len(self._market_ids)
+                self._market_ids.append(market_id)
             self._fill_records.append(
-                {
-                    "fill_ts_ms": ts_ms,
-                    "fill_mid": fill_mid,
-                    "side": side,
-                    "qty": size_usd,
-                    "market_id": market_id,
-                }
+                (ts_ms, fill_mid, 0 if side == "bid" else 1, size_usd, code)
             )
-        return {"order_id": f"paper-{market_id}-{side}", "filled": filled}
+        return {"order_id": order_id, "filled": filled}
+
+    def replace_order(
+        self, order_id: str, price: float, size_usd: float
+    ) -> dict[str, Any]:
+        """Re-price a live order (same fill simulation as submit_order)."""
+        order = self._open_orders.get(order_id)
+        if order is None:
+            return {"order_id": order_id, "error": "unknown_order"}
+        market_id, side, post_only = order
+        return self.submit_order(market_id, side, price, size_usd, post_only)
 
     def flatten_position(self, market_id: str, mid: float | None = None) -> float:
         """Close position at mid; book realized PnL. Returns PnL from this flatten."""
         pos = self._state.positions.get(market_id, 0.0)
         cost = self._state.cost_basis.get(market_id, 0.0)
         if mid is None:
-            mid = self._book.get("mid", 0.5)
+            mid = self._marks.mid(market_id)
         pnl = pos * mid - cost
         self._state.realized_pnl += pnl
         if pos != 0.0:
             self._state.position_close_count += 1
+        self._set_position(market_id, 0.0)
         self._state.positions.pop(market_id, None)
         self._state.cost_basis.pop(market_id, None)
         return pnl
 
+    def snapshot(self) -> dict[str, Any]:
+        """
+        State without the equity curve (current equity instead); rebuilt only when version
+        changed, else the same dict is returned (treat as read-only).
+        """
+        if self._snapshot is None or self._snapshot_version != self.version:
+            state = self._state
+            self._snapshot = {
+                "version": self.version,
+                "cash": state.cash,
+                "positions": dict(state.positions),
+                "realized_pnl": state.realized_pnl,
+                "exposure_usd": self._marks.exposure(),
+                "equity": self.equity(),
+                "fills_count": state.fills_count,
+                "position_open_count": state.position_open_count,
+                "position_close_count": state.position_close_count,
+            }
+            self._snapshot_version = self.version
+        return self._snapshot
+
     def get_fill_records(self) -> list[dict[str, Any]]:
         """Return copy of persistent fill records for adverse_selection (fill_ts_ms, fill_mid, side, qty)."""
-        return list(self._fill_records)
+        rec = self._fill_records.view()
+        markets = self._market_ids
+        return [
+            {
+                "fill_ts_ms": ts_ms,
+                "fill_mid": fill_mid,
+                "side": SIDES[side],
+                "qty": qty,
+                "market_id": markets[market],
+            }
+            for ts_ms, fill_mid, side, qty, market in zip(
+                rec["fill_ts_ms"].tolist(),
+                rec["fill_mid"].tolist(),
+                rec["side"].tolist(),
+                rec["qty"].tolist(),
+                rec["market"].tolist(),
+            )
+        ]
+
+    def fill_records_array(self) -> tuple[np.ndarray, list[str]]:
+        """Fill records as a read-only FILL_DTYPE array (no copy) and the market_id table."""
+        return self._fill_records.view(), list(self._market_ids)
+
+    def submit_orders(self, orders: list[OrderRequest]) -> list[dict[str, Any]]:
+        """Submit a batch against the current books; one result per leg."""
+        results: list[dict[str, Any]] = []
+        for o in orders:
+            try:
+                results.append(
+                    self.submit_order(
+                        o.market_id, o.side, o.price, o.size_usd, o.post_only
+                    )
+                )
+            except Exception as e:  # noqa: BLE001 - per-leg error, as in Broker.submit_orders
+                results.append({"error": type(e).__name__})
+        return results
 
     def cancel_order(self, order_id: str) -> bool:
+        self._open_orders.pop(order_id, None)
         return True
 
+    def cancel_orders(self, order_ids: list[str]) -> list[bool]:
+        open_orders = self._open_orders
+        for order_id in order_ids:
+            open_orders.pop(order_id, None)
+        return [True] * len(order_ids)
+
     def cancel_all(self, market_id: str | None = None) -> int:
+        if market_id is None:
+            self._open_orders.clear()
+        else:
+            for order_id in [
+                k for k, v in self._open_orders.items() if v[0] == market_id
+            ]:
+                del self._open_orders[order_id]
         return 1
 
     def process_fills(self, now_ms: int) -> list[dict[str, Any]]:
         """Return recent fills and update equity curve."""
         events = list(self._state.fill_events)
         self._state.fill_events.clear()
-        equity = self._state.cash + self._state.realized_pnl
-        for m, pos in self._state.positions.items():
-            mid = self._book.get("mid", 0.5)
-            equity += pos * mid
-        self._state.equity_curve.append(equity)
+        self._state.equity_curve.append(self.equity())
         return events
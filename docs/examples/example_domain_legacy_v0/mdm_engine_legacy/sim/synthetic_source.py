@@ -5,28 +5,128 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from mdm_engine.adapters.base import MarketDataSource
 from mdm_engine.sim.microstructure_sim import MicrostructureSim
 
+_FIELDS = ("ts_ms", "bid", "ask", "bid_depth", "ask_depth", "mid")
+
 
 class SyntheticSource(MarketDataSource):
-    """Yield book events from MicrostructureSim until steps exhausted."""
+    """
+    Yield book events from MicrostructureSim until steps exhausted.
+
+    block_size > 0 streams from blocks pre-generated by sim.simulate() instead of one
+    sim.step() per event; from_block() streams an already simulated path. Both serve
+    next_events() / next_columns() natively from the block (supports_batch); columns are
+    read-only slices of the block.
+    """
 
-    def __init__(self, sim: MicrostructureSim, steps: int):
+    def __init__(self, sim: MicrostructureSim | None, steps: int, block_size: int = 0):
         self.sim = sim
         self.steps = steps
+        self.block_size = block_size
+        self.supports_batch = block_size > 0 or sim is None
         self._step = 0
+        self._cols: dict[str, np.ndarray] = {}
+        self._rows: list[tuple] | None = None
+        self._n_block = 0
+        self._pos = 0
 
-    def next_event(self) -> dict | None:
+    @classmethod
+    def from_block(cls, book: np.ndarray) -> SyntheticSource:
+        """Stream one simulated path (1-D BOOK_DTYPE array, e.g. sim.simulate(n, k)[i])."""
+        src = cls(None, len(book))
+        src._load(book)
+        return src
+
+    def _load(self, book: np.ndarray) -> None:
+        cols = {name: np.ascontiguousarray(book[name]) for name in _FIELDS[:-1]}
+        cols["mid"] = (cols["bid"] + cols["ask"]) / 2.0
+        for col in cols.values():
+            col.flags.writeable = False
+        self._cols = cols
+        self._rows = None  # built on the first row-wise read of this block
+        self._n_block = len(book)
+        self._pos = 0
+
+    def _row_list(self) -> list[tuple]:
+        if self._rows is None:
+            # Column-wise tolist(): plain Python scalars without per-record numpy access.
+            self._rows = list(zip(*(self._cols[k].tolist() for k in _FIELDS)))
+        return self._rows
+
+    def _available(self) -> int:
+        """Events left in the loaded block (the next block is simulated when it ran out)."""
         if self._step >= self.steps:
+            return 0
+        if self._pos >= self._n_block and self.block_size > 0 and self.sim is not None:
+            self._load(
+                self.sim.simulate(min(self.block_size, self.steps - self._step))[0]
+            )
+        return min(self._n_block - self._pos, self.steps - self._step)
+
+    def next_event(self) -> dict | None:
+        if self._available() > 0:
+            ts_ms, bid, ask, bid_depth, ask_depth, mid = self._row_list()[self._pos]
+            self._pos += 1
+        elif self._step < self.steps and self.sim is not None:
+            book = self.sim.step()
+            ts_ms, bid, ask = book.ts_ms, book.bid, book.ask
+            bid_depth, ask_depth = book.bid_depth, book.ask_depth
+            mid = (bid + ask) / 2.0
+        else:
             return None
-        book = self.sim.step()
         self._step += 1
         return {
-            "ts_ms": book.ts_ms,
-            "bid": book.bid,
-            "ask": book.ask,
-            "bid_depth": book.bid_depth,
-            "ask_depth": book.ask_depth,
-            "mid": (book.bid + book.ask) / 2.0,
+            "ts_ms": ts_ms,
+            "bid": bid,
+            "ask": ask,
+            "bid_depth": bid_depth,
+            "ask_depth": ask_depth,
+            "mid": mid,
         }
+
+    def next_events(self, max_n: int) -> list[dict]:
+        if not self.supports_batch:
+            return super().next_events(max_n)
+        out: list[dict] = []
+        while len(out) < max_n and (n := min(max_n - len(out), self._available())):
+            pos = self._pos
+            out.extend(
+                {
+                    "ts_ms": ts_ms,
+                    "bid": bid,
+                    "ask": ask,
+                    "bid_depth": bid_depth,
+                    "ask_depth": ask_depth,
+                    "mid": mid,
+                }
+                for ts_ms, bid, ask, bid_depth, ask_depth, mid in self._row_list()[
+                    pos : pos + n
+                ]
+            )
+            self._pos = pos + n
+            self._step += n
+        return out
+
+    def next_columns(self, max_n: int) -> dict[str, np.ndarray] | None:
+        if not self.supports_batch:
+            return super().next_columns(max_n)
+        parts: list[dict[str, np.ndarray]] = []
+        total = 0
+        while total < max_n and (n := min(max_n - total, self._available())):
+            pos = self._pos
+            parts.append({k: col[pos : pos + n] for k, col in self._cols.items()})
+            self._pos = pos + n
+            self._step += n
+            total += n
+        if not parts:
+            return None
+        if len(parts) == 1:
+            return parts[0]
+        cols = {k: np.concatenate([p[k] for p in parts]) for k in _FIELDS}
+        for col in cols.values():
+            col.flags.writeable = False
+        return cols
@@ -1,8 +1,15 @@
 # Decision Ecosystem — mdm-engine
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Adapters: market data source and broker interfaces."""
+"""Adapters: market data source and broker interfaces (sync and async), bridges."""
 
-from mdm_engine.adapters.base import MarketDataSource, Broker
+from mdm_engine.adapters.base import MarketDataSource, Broker, AsyncBroker
+from mdm_engine.adapters.bridge import AsyncToSyncBroker, SyncToAsyncBroker
 
-__all__ = ["MarketDataSource", "Broker"]
+__all__ = [
+    "MarketDataSource",
+    "Broker",
+    "AsyncBroker",
+    "SyncToAsyncBroker",
+    "AsyncToSyncBroker",
+]
@@ -3,21 +3,98 @@
 # SPDX-License-Identifier: MIT
 """MarketDataSource and Broker abstract interfaces."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+# Events pulled per next_events() call when iterating a supports_batch source.
+ITER_BATCH = 256
+
 
 class MarketDataSource(ABC):
-    """Source of market events (book snapshots, etc.)."""
+    """
+    Source of market events (book snapshots, etc.).
+
+    Besides next_event(): next_events(max_n) (list of dicts), next_columns(max_n) (one 1-D
+    array per field) and iteration (for / async for). The defaults are built on next_event();
+    supports_batch marks sources with native batch methods, which consumers then pull in
+    batches instead of one event per call.
+    """
+
+    supports_batch: bool = False
 
     @abstractmethod
     def next_event(self) -> dict[str, Any] | None:
         """Return next event or None if exhausted."""
         ...
 
+    def next_events(self, max_n: int) -> list[dict[str, Any]]:
+        """Up to max_n events (fewer only when exhausted; [] when done)."""
+        out: list[dict[str, Any]] = []
+        next_event = self.next_event
+        for _ in range(max_n):
+            event = next_event()
+            if event is None:
+                break
+            out.append(event)
+        return out
+
+    def next_columns(self, max_n: int) -> dict[str, np.ndarray] | None:
+        """Up to max_n events as columns (keys of the first event); None when exhausted."""
+        events = self.next_events(max_n)
+        if not events:
+            return None
+        return {k: np.asarray([e.get(k) for e in events]) for k in events[0]}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if not self.supports_batch:
+            while (event := self.next_event()) is not None:
+                yield event
+            return
+        while events := self.next_events(ITER_BATCH):
+            yield from events
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        """Yields control to the event loop after each pull (one event, or one batch)."""
+        n = ITER_BATCH if self.supports_batch else 1
+        while events := self.next_events(n):
+            for event in events:
+                yield event
+            await asyncio.sleep(0)
+
+
+@dataclass(frozen=True)
+class OrderRequest:
+    """One leg of a bulk submit_orders call."""
+
+    market_id: str
+    side: str
+    price: float
+    size_usd: float
+    post_only: bool = True
+
+
+def _leg_error(e: BaseException) -> dict[str, Any]:
+    return {"error": type(e).__name__}
+
 
 class Broker(ABC):
-    """Broker interface: submit/cancel orders, get state (no secrets in interface)."""
+    """
+    Broker interface: submit/cancel orders, get state (no secrets in interface).
+
+    Optional capabilities (callers check the flag):
+    - supports_replace: replace_order() amends in one round-trip (else cancel + submit).
+    - supports_bulk: submit_orders() / cancel_orders() are native batch requests. Without it
+      they are still callable and fall back to one call per order.
+    Bulk results are per leg, in request order; a failed leg carries "error".
+    """
+
+    supports_replace: bool = False
+    supports_bulk: bool = False
 
     @abstractmethod
     def get_state(self) -> dict[str, Any]:
@@ -41,6 +118,36 @@ class Broker(ABC):
         """Cancel order; return True if accepted."""
         ...
 
+    def replace_order(
+        self, order_id: str, price: float, size_usd: float
+    ) -> dict[str, Any]:
+        """Amend price/size of an open order; return result (order_id or error)."""
+        return {"order_id": order_id, "error": "replace_unsupported"}
+
+    def submit_orders(self, orders: list[OrderRequest]) -> list[dict[str, Any]]:
+        """Submit several orders; one result per leg (fallback: one submit_order each)."""
+        results = []
+        for o in orders:
+            try:
+                results.append(
+                    self.submit_order(
+                        o.market_id, o.side, o.price, o.size_usd, o.post_only
+                    )
+                )
+            except Exception as e:  # noqa: BLE001 - a failed leg must not abort the batch
+                results.append(_leg_error(e))
+        return results
+
+    def cancel_orders(self, order_ids: list[str]) -> list[bool]:
+        """Cancel several orders; one accepted flag per leg (fallback: one cancel_order each)."""
+        results = []
+        for order_id in order_ids:
+            try:
+                results.append(bool(self.cancel_order(order_id)))
+            except Exception:  # noqa: BLE001 - a failed leg must not abort the batch
+                results.append(False)
+        return results
+
     @abstractmethod
     def cancel_all(self, market_id: str | None = None) -> int:
         """Cancel all (optionally for market); return count."""
@@ -50,3 +157,67 @@ class Broker(ABC):
     def process_fills(self, now_ms: int) -> list[dict[str, Any]]:
         """Process pending fills up to now_ms; return list of fill events."""
         ...
+
+
+class AsyncBroker(ABC):
+    """Asyncio mirror of Broker: same methods and results, awaitable (legs can overlap)."""
+
+    supports_replace: bool = False
+    supports_bulk: bool = False
+
+    @abstractmethod
+    async def get_state(self) -> dict[str, Any]:
+        """Cash, positions, exposure, etc. (redacted)."""
+        ...
+
+    @abstractmethod
+    async def submit_order(
+        self,
+        market_id: str,
+        side: str,
+        price: float,
+        size_usd: float,
+        post_only: bool,
+    ) -> dict[str, Any]:
+        """Submit order; return result (order_id or error)."""
+        ...
+
+    async def replace_order(
+        self, order_id: str, price: float, size_usd: float
+    ) -> dict[str, Any]:
+        """Amend price/size of an open order; return result (order_id or error)."""
+        return {"order_id": order_id, "error": "replace_unsupported"}
+
+    @abstractmethod
+    async def cancel_order(self, order_id: str) -> bool:
+        """Cancel order; return True if accepted."""
+        ...
+
+    async def submit_orders(self, orders: list[OrderRequest]) -> list[dict[str, Any]]:
+        """Submit several orders; one result per leg (fallback: submit_order legs gathered)."""
+        results = await asyncio.gather(
+            *(
+                self.submit_order(o.market_id, o.side, o.price, o.size_usd, o.post_only)
+                for o in orders
+            ),
+            return_exceptions=True,
+        )
+        return [_leg_error(r) if isinstance(r, BaseException) else r for r in results]
+
+    async def cancel_orders(self, order_ids: list[str]) -> list[bool]:
+        """Cancel several orders; one accepted flag per leg (fallback: cancel_order legs gathered)."""
+        results = await asyncio.gather(
+            *(self.cancel_order(order_id) for order_id in order_ids),
+            return_exceptions=True,
+        )
+        return [False if isinstance(r, BaseException) else bool(r) for r in results]
+
+    @abstractmethod
+    async def cancel_all(self, market_id: str | None = None) -> int:
+        """Cancel all (optionally for market); return count."""
+        ...
+
+    @abstractmethod
+    async def process_fills(self, now_ms: int) -> list[dict[str, Any]]:
+        """Process pending fills up to now_ms; return list of fill events."""
+        ...
@@ -0,0 +1,149 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Adapters between sync Broker and AsyncBroker (either side can drive the other)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Executor
+from typing import Any, TypeVar
+
+from mdm_engine.adapters.base import AsyncBroker, Broker, OrderRequest
+
+T = TypeVar("T")
+
+
+class SyncToAsyncBroker(AsyncBroker):
+    """
+    AsyncBroker over a sync Broker: each call runs in a worker thread (default executor, or
+    `executor`), so blocking legs overlap under asyncio.gather.
+    """
+
+    def __init__(self, broker: Broker, executor: Executor | None = None):
+        self.broker = broker
+        self.executor = executor
+        self.supports_replace = broker.supports_replace
+        self.supports_bulk = broker.supports_bulk
+        if hasattr(broker, "flatten_position"):  # optional extension (see execute)
+
+            async def flatten_position(market_id: str, mid: float | None = None) -> Any:
+                return await self._call(broker.flatten_position, market_id, mid)
+
+            self.flatten_position = flatten_position
+
+    async def _call(self, fn, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    async def get_state(self) -> dict[str, Any]:
+        return await self._call(self.broker.get_state)
+
+    async def submit_order(
+        self,
+        market_id: str,
+        side: str,
+        price: float,
+        size_usd: float,
+        post_only: bool,
+    ) -> dict[str, Any]:
+        return await self._call(
+            self.broker.submit_order, market_id, side, price, size_usd, post_only
+        )
+
+    async def replace_order(
+        self, order_id: str, price: float, size_usd: float
+    ) -> dict[str, Any]:
+        return await self._call(self.broker.replace_order, order_id, price, size_usd)
+
+    async def cancel_order(self, order_id: str) -> bool:
+        return await self._call(self.broker.cancel_order, order_id)
+
+    async def submit_orders(self, orders: list[OrderRequest]) -> list[dict[str, Any]]:
+        return await self._call(self.broker.submit_orders, orders)
+
+    async def cancel_orders(self, order_ids: list[str]) -> list[bool]:
+        return await self._call(self.broker.cancel_orders, order_ids)
+
+    async def cancel_all(self, market_id: str | None = None) -> int:
+        return await self._call(self.broker.cancel_all, market_id)
+
+    async def process_fills(self, now_ms: int) -> list[dict[str, Any]]:
+        return await self._call(self.broker.process_fills, now_ms)
+
+
+class AsyncToSyncBroker(Broker):
+    """
+    Sync Broker over an AsyncBroker: calls block on a private event loop thread (or on
+    `loop`, which must run in another thread). close() stops the private loop.
+    """
+
+    def __init__(
+        self, broker: AsyncBroker, loop: asyncio.AbstractEventLoop | None = None
+    ):
+        self.broker = broker
+        self.supports_replace = broker.supports_replace
+        self.supports_bulk = broker.supports_bulk
+        if hasattr(broker, "flatten_position"):  # optional extension (see execute)
+
+            def flatten_position(market_id: str, mid: float | None = None) -> Any:
+                return self._run(broker.flatten_position(market_id, mid))
+
+            self.flatten_position = flatten_position
+        self._thread: threading.Thread | None = None
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=loop.run_forever, name="async-broker-loop", daemon=True
+            )
+            self._thread.start()
+        self.loop = loop
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def get_state(self) -> dict[str, Any]:
+        return self._run(self.broker.get_state())
+
+    def submit_order(
+        self,
+        market_id: str,
+        side: str,
+        price: float,
+        size_usd: float,
+        post_only: bool,
+    ) -> dict[str, Any]:
+        return self._run(
+            self.broker.submit_order(market_id, side, price, size_usd, post_only)
+        )
+
+    def replace_order(
+        self, order_id: str, price: float, size_usd: float
+    ) -> dict[str, Any]:
+        return self._run(self.broker.replace_order(order_id, price, size_usd))
+
+    def cancel_order(self, order_id: str) -> bool:
+        return self._run(self.broker.cancel_order(order_id))
+
+    def submit_orders(self, orders: list[OrderRequest]) -> list[dict[str, Any]]:
+        return self._run(self.broker.submit_orders(orders))
+
+    def cancel_orders(self, order_ids: list[str]) -> list[bool]:
+        return self._run(self.broker.cancel_orders(order_ids))
+
+    def cancel_all(self, market_id: str | None = None) -> int:
+        return self._run(self.broker.cancel_all(market_id))
+
+    def process_fills(self, now_ms: int) -> list[dict[str, Any]]:
+        return self._run(self.broker.process_fills(now_ms))
+
+    def close(self) -> None:
+        """Stop the private loop thread (no-op for a caller-supplied loop)."""
+        if self._thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        self._thread = None
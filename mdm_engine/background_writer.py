@@ -0,0 +1,234 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Background writer thread: bounded queue, group commit, durability and backpressure policies."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import IO, Any
+
+DURABILITY = ("none", "flush", "fsync")
+BACKPRESSURE = ("block", "drop_oldest", "drop")
+
+
+class BackgroundWriter:
+    """
+    put() enqueues an item and returns at once; one writer thread drains up to max_batch
+    items, serializes them with encode(item) (str or bytes, matching the file), writes the
+    group with a single write() and then applies durability once per group:
+    "none" (left in the file buffer), "flush" (file.flush) or "fsync" (flush + os.fsync).
+
+    When maxsize items are queued, backpressure decides: "block" waits for room,
+    "drop_oldest" evicts the oldest queued item, "drop" discards the new one. Both drop
+    policies count into stats()["dropped"].
+
+    linger_s > 0 lets the thread wait up to that long after the first queued item for a
+    group of max_batch items before committing: fewer, larger groups at the cost of up to
+    linger_s latency; flush() / sync() / close() cut the wait short.
+
+    flush() waits until everything put so far is written and flushed; sync() also fsyncs
+    the file. close() drains the queue, joins the thread and closes the file. An exception
+    raised while encoding or writing is re-raised once, by the next put(), flush() or
+    close().
+    """
+
+    def __init__(
+        self,
+        file: IO,
+        encode: Callable[[Any], str | bytes],
+        maxsize: int = 10_000,
+        max_batch: int = 1024,
+        durability: str = "flush",
+        backpressure: str = "block",
+        name: str = "trace-writer",
+        linger_s: float = 0.0,
+    ):
+        if durability not in DURABILITY:
+            raise ValueError(f"Unknown durability: {durability!r}")
+        if backpressure not in BACKPRESSURE:
+            raise ValueError(f"Unknown backpressure policy: {backpressure!r}")
+        if maxsize <= 0 or max_batch <= 0:
+            raise ValueError("maxsize and max_batch must be positive")
+        if linger_s < 0:
+            raise ValueError("linger_s must be >= 0")
+        self.file = file
+        self.encode = encode
+        self.maxsize = maxsize
+        self.max_batch = max_batch
+        self.durability = durability
+        self.backpressure = backpressure
+        self.linger_s = linger_s
+        self._queue: deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._closing = False
+        self._closed = False
+        self._error: BaseException | None = None
+        self._put_seq = 0  # items accepted (incl. later evicted)
+        self._done_seq = 0  # items written, evicted or failed
+        self._wanted_seq = 0  # flush()/sync() waiting for items up to here
+        self.written = 0
+        self.dropped = 0
+        self.groups = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.commit_ms_total = 0.0
+        self.commit_ms_max = 0.0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item: Any) -> bool:
+        """Enqueue item; False if it was dropped (backpressure="drop")."""
+        with self._cond:
+            self._raise_pending()
+            if self._closing:
+                raise ValueError("writer is closed")
+            queue = self._queue
+            if len(queue) >= self.maxsize:
+                if self.backpressure == "drop":
+                    self.dropped += 1
+                    return False
+                if self.backpressure == "drop_oldest":
+                    queue.popleft()
+                    self.dropped += 1
+                    self._done_seq += 1
+                else:
+                    while len(queue) >= self.maxsize and not self._closing:
+                        self._cond.wait()
+                    if self._closing:
+                        raise ValueError("writer is closed")
+            queue.append(item)
+            self._put_seq += 1
+            self.max_depth = max(self.max_depth, len(queue))
+            self._cond.notify_all()
+        return True
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        cond, queue = self._cond, self._queue
+        while True:
+            with cond:
+                while not queue and not self._closing:
+                    cond.wait()
+                if not queue:
+                    return
+                if self.linger_s:
+                    self._linger()
+                n = min(len(queue), self.max_batch)
+                items = [queue.popleft() for _ in range(n)]
+                cond.notify_all()  # room for blocked producers
+            self._commit(items)
+            with cond:
+                self._done_seq += n
+                cond.notify_all()
+
+    def _linger(self) -> None:
+        """Wait (holding _cond) for a full group, until linger_s passes or a flush is wanted."""
+        full = min(self.max_batch, self.maxsize)
+        deadline = time.monotonic() + self.linger_s
+        while (
+            len(self._queue) < full
+            and not self._closing
+            and self._wanted_seq <= self._done_seq
+        ):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._cond.wait(remaining)
+
+    def _commit(self, items: list[Any]) -> None:
+        chunks = []
+        for item in items:
+            try:
+                chunks.append(self.encode(item))
+            except Exception as e:  # noqa: BLE001 - re-raised by the next put/flush/close
+                self._fail(e)
+        if not chunks:
+            return
+        t0 = time.perf_counter()
+        try:
+            with self._io_lock:
+                self.file.write(chunks[0][:0].join(chunks))
+                if self.durability != "none":
+                    self.file.flush()
+                    if self.durability == "fsync":
+                        os.fsync(self.file.fileno())
+        except Exception as e:  # noqa: BLE001 - re-raised by the next put/flush/close
+            self._fail(e)
+            return
+        ms = (time.perf_counter() - t0) * 1000.0
+        self.commit_ms_total += ms
+        self.commit_ms_max = max(self.commit_ms_max, ms)
+        self.written += len(chunks)
+        self.groups += 1
+
+    def _fail(self, e: Exception) -> None:
+        with self._cond:
+            self.errors += 1
+            if self._error is None:
+                self._error = e
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until items put so far are written, then flush the file; False on timeout."""
+        with self._cond:
+            target = self._put_seq
+            self._wanted_seq = max(self._wanted_seq, target)
+            self._cond.notify_all()
+            if not self._cond.wait_for(lambda: self._done_seq >= target, timeout):
+                return False
+            self._raise_pending()
+        with self._io_lock:
+            if not self._closed:
+                self.file.flush()
+        return True
+
+    def sync(self, timeout: float | None = None) -> bool:
+        """flush(), then fsync the file so everything put so far is durable."""
+        if not self.flush(timeout):
+            return False
+        with self._io_lock:
+            if not self._closed:
+                os.fsync(self.file.fileno())
+        return True
+
+    def close(self) -> None:
+        """Drain the queue, stop the thread, flush (fsync if configured) and close the file."""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
+        with self._io_lock:
+            self.file.flush()
+            if self.durability == "fsync":
+                os.fsync(self.file.fileno())
+            self.file.close()
+            self._closed = True
+        with self._cond:
+            self._raise_pending()
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and counters (written, dropped, groups, errors, commit latency)."""
+        with self._cond:
+            return {
+                "depth": len(self._queue),
+                "max_depth": self.max_depth,
+                "written": self.written,
+                "dropped": self.dropped,
+                "groups": self.groups,
+                "errors": self.errors,
+                "commit_ms_mean": self.commit_ms_total / self.groups
+                if self.groups
+                else 0.0,
+                "commit_ms_max": self.commit_ms_max,
+            }
@@ -1,9 +1,10 @@
 # Decision Ecosystem — mdm-engine
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Execution: executor, order manager."""
+"""Execution: executor (sync and async), order manager."""
 
+from mdm_engine.execution.async_executor import AsyncExecutor
 from mdm_engine.execution.executor import Executor
 from mdm_engine.execution.order_manager import OrderManager
 
-__all__ = ["Executor", "OrderManager"]
+__all__ = ["AsyncExecutor", "Executor", "OrderManager"]
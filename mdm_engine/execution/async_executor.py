@@ -0,0 +1,78 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Execute final_action via AsyncBroker; independent legs run concurrently (asyncio.gather)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from decision_schema.types import Action
+from decision_schema.types import FinalDecision as FinalAction
+
+from mdm_engine.adapters.base import AsyncBroker
+from mdm_engine.execution.executor import act_legs
+
+
+async def execute_async(
+    broker: AsyncBroker,
+    final_action: FinalAction,
+    market_id: str,
+    mid: float | None = None,
+    ordered_exit: bool = True,
+) -> dict[str, Any]:
+    """
+    Same contract as execute(): ACT -> submit bid and ask together (submit_orders);
+    EXIT -> cancel first, then close (ordered_exit=False: both at once, which lets resting
+    orders execute while the position is being closed);
+    CANCEL / STOP -> cancel all. ACT results are reported per leg in result["legs"].
+    """
+    result: dict[str, Any] = {
+        "action": final_action.action.value,
+        "orders": [],
+        "cancels": 0,
+    }
+    if (
+        final_action.action == Action.ACT
+        and getattr(final_action, "bid_quote", None) is not None
+        and getattr(final_action, "ask_quote", None) is not None
+        and getattr(final_action, "size_usd", None)
+    ):
+        # Native bulk: one round-trip; fallback: the two legs gathered.
+        result["legs"] = await broker.submit_orders(act_legs(final_action, market_id))
+        result["orders"] = ["bid", "ask"]
+    elif final_action.action == Action.EXIT:
+        flatten = getattr(broker, "flatten_position", None)
+        if flatten is None:
+            result["cancels"] = await broker.cancel_all(market_id)
+        elif ordered_exit:
+            result["cancels"] = await broker.cancel_all(market_id)
+            await flatten(market_id, mid)
+        else:
+            result["cancels"], _ = await asyncio.gather(
+                broker.cancel_all(market_id), flatten(market_id, mid)
+            )
+    elif final_action.action == Action.CANCEL:
+        result["cancels"] = await broker.cancel_all(market_id)
+    elif final_action.action == Action.STOP:
+        result["cancels"] = await broker.cancel_all(None)
+    return result
+
+
+class AsyncExecutor:
+    """Thin wrapper around execute_async."""
+
+    def __init__(self, broker: AsyncBroker, ordered_exit: bool = True):
+        self.broker = broker
+        self.ordered_exit = ordered_exit
+
+    async def run(
+        self,
+        final_action: FinalAction,
+        market_id: str,
+        mid: float | None = None,
+    ) -> dict[str, Any]:
+        return await execute_async(
+            self.broker, final_action, market_id, mid, self.ordered_exit
+        )
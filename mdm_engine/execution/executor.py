@@ -7,17 +7,34 @@ from __future__ import annotations
 
 from typing import Any
 
-from mdm_engine.adapters.base import Broker
+from mdm_engine.adapters.base import Broker, OrderRequest
 from decision_schema.types import Action, FinalDecision as FinalAction
 
 
+def act_legs(final_action: FinalAction, market_id: str) -> list[OrderRequest]:
+    """Bid and ask legs of an ACT action (bid first)."""
+    size_usd = getattr(final_action, "size_usd", 0)
+    post_only = getattr(final_action, "post_only", False)
+    return [
+        OrderRequest(
+            market_id, "bid", getattr(final_action, "bid_quote"), size_usd, post_only
+        ),
+        OrderRequest(
+            market_id, "ask", getattr(final_action, "ask_quote"), size_usd, post_only
+        ),
+    ]
+
+
 def execute(
     broker: Broker,
     final_action: FinalAction,
     market_id: str,
     mid: float | None = None,
 ) -> dict[str, Any]:
-    """Execute final action: ACT -> submit bid/ask; EXIT -> cancel then close; CANCEL -> cancel all."""
+    """
+    Execute final action: ACT -> submit bid/ask; EXIT -> cancel then close; CANCEL -> cancel all.
+    ACT results are reported per leg in result["legs"].
+    """
     result: dict[str, Any] = {
         "action": final_action.action.value,
         "orders": [],
@@ -29,20 +46,8 @@ def execute(
         and getattr(final_action, "ask_quote", None) is not None
         and getattr(final_action, "size_usd", None)
     ):
-        broker.submit_order(
-            market_id,
-            "bid",
-            getattr(final_action, "bid_quote"),
-            getattr(final_action, "size_usd", 0),
-            getattr(final_action, "post_only", False),
-        )
-        broker.submit_order(
-            market_id,
-            "ask",
-            getattr(final_action, "ask_quote"),
-            getattr(final_action, "size_usd", 0),
-            getattr(final_action, "post_only", False),
-        )
+        # One bulk request when the broker supports it, else one submit_order per leg.
+        result["legs"] = broker.submit_orders(act_legs(final_action, market_id))
         result["orders"] = ["bid", "ask"]
     elif final_action.action == Action.EXIT:
         result["cancels"] = broker.cancel_all(market_id)
@@ -1,14 +1,22 @@
 # Decision Ecosystem — mdm-engine
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Post-only quoting: cancel/replace only when needed; order aging; min requote."""
+"""Post-only quoting: amend only the side that moved; order aging; min requote; per-market state."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Any
 
-from mdm_engine.adapters.base import Broker
+from mdm_engine.adapters.base import Broker, OrderRequest
+
+REPLACE_WINDOW_MS = 60_000
+SIDES = ("bid", "ask")
+# Leg errors meaning the venue no longer holds the order (nothing left to amend).
+ORDER_GONE_ERRORS = frozenset(
+    {"unknown_order", "not_found", "filled", "already_filled", "expired"}
+)
 
 
 @dataclass
@@ -22,8 +30,37 @@ class OrderRecord:
     created_ms: int
 
 
+@dataclass(slots=True)
+class QuoteState:
+    """Per-market quote state: live order per side, last refresh/fill, replacement window."""
+
+    bid: OrderRecord | None = None
+    ask: OrderRecord | None = None
+    last_refresh_ms: int = 0
+    last_fill_ms: int | None = None
+    # Timestamps of successful replacements in the last REPLACE_WINDOW_MS (pruned on
+    # every append; len <= budget when max_replacements_per_min is set).
+    replacements: deque[int] = field(default_factory=deque)
+
+
+def _prune(window: deque[int], now_ms: int) -> None:
+    while window and window[0] <= now_ms - REPLACE_WINDOW_MS:
+        window.popleft()
+
+
 class OrderManager:
-    """Cancel/replace when quote changes; avoid over-cancel via refresh_ms and min_requote_ticks."""
+    """
+    Requote per market only when the quote moved; avoid over-cancel via refresh_ms and
+    min_requote_ticks. A moved side is amended alone (broker.replace_order when
+    supports_replace, else cancel_orders + submit_orders); results per side in "legs".
+    A side whose replace fails or whose cancel is not confirmed keeps its old order (it is
+    still tracked and retried on the next call); nothing is submitted for it. A replace
+    error in ORDER_GONE_ERRORS drops the side instead (the next call places a fresh order).
+    Only replacements that went through count against the budget.
+
+    max_replacements_per_min (> 0): replacements per market in a sliding 60 s window;
+    post_fill_cooldown_ms (> 0): no requote of a market for that long after on_fill().
+    """
 
     def __init__(
         self,
@@ -43,15 +80,49 @@ class OrderManager:
         self.post_fill_cooldown_ms = post_fill_cooldown_ms
         self.max_replacements_per_min = max_replacements_per_min
         self.orders: dict[str, OrderRecord] = {}
+        self.markets: dict[str, QuoteState] = {}
         self.last_refresh_ms: int = 0
-        self._last_bid: float | None = None
-        self._last_ask: float | None = None
 
-    def order_stale(self, now_ms: int) -> bool:
-        """True if current quote is older than order_ttl_ms (0 = never stale)."""
+    def order_stale(self, now_ms: int, market_id: str | None = None) -> bool:
+        """True if the quote (of market_id, else the latest) is older than order_ttl_ms (0 = never)."""
         if self.order_ttl_ms <= 0:
             return False
-        return (now_ms - self.last_refresh_ms) >= self.order_ttl_ms
+        state = self.markets.get(market_id) if market_id is not None else None
+        last = state.last_refresh_ms if state is not None else self.last_refresh_ms
+        return (now_ms - last) >= self.order_ttl_ms
+
+    def on_fill(
+        self,
+        market_id: str,
+        now_ms: int,
+        side: str | None = None,
+        order_id: str | None = None,
+    ) -> None:
+        """
+        Record a fill (starts post_fill_cooldown_ms for the market). With side or order_id
+        the filled order is forgotten, so the next set_quotes places a fresh one.
+        """
+        state = self._state(market_id)
+        state.last_fill_ms = now_ms
+        for s in SIDES:
+            record = getattr(state, s)
+            if record is not None and (s == side or record.order_id == order_id):
+                self.orders.pop(record.order_id, None)
+                setattr(state, s, None)
+
+    def replacements_in_window(self, market_id: str, now_ms: int) -> int:
+        """Replacements of market_id in the last 60 s."""
+        state = self.markets.get(market_id)
+        if state is None:
+            return 0
+        _prune(state.replacements, now_ms)
+        return len(state.replacements)
+
+    def _state(self, market_id: str) -> QuoteState:
+        state = self.markets.get(market_id)
+        if state is None:
+            state = self.markets[market_id] = QuoteState()
+        return state
 
     def set_quotes(
         self,
@@ -63,7 +134,7 @@ class OrderManager:
         effective_refresh_ms: int | None = None,
     ) -> dict[str, Any]:
         """
-        Replace only if |new - old| > min_requote_ticks * tick_size (or no previous quote).
+        Amend a side only if |new - old| >= min_requote_ticks * tick_size (or no live order).
         Use effective_refresh_ms when throttled (e.g. from DMC cancel_rate guard).
         """
         refresh_ms = (
@@ -71,30 +142,134 @@ class OrderManager:
             if effective_refresh_ms is not None
             else self.refresh_ms
         )
+        state = self._state(market_id)
         min_move = self.min_requote_ticks * self.tick_size
-        skip_requote = False
-        force_replace = self.order_stale(now_ms)
+        force_replace = self.order_stale(now_ms, market_id)
+        quotes = {"bid": bid_quote, "ask": ask_quote}
+        changed = [
+            side
+            for side in SIDES
+            if getattr(state, side) is None
+            or force_replace
+            or abs(quotes[side] - getattr(state, side).price) >= min_move
+        ]
+        has_orders = state.bid is not None or state.ask is not None
+        reason = None
+        if not changed:
+            reason = "unchanged"
+        elif has_orders and not force_replace:
+            if (now_ms - state.last_refresh_ms) < refresh_ms:
+                reason = "refresh"
+            elif (
+                self.post_fill_cooldown_ms > 0
+                and state.last_fill_ms is not None
+                and (now_ms - state.last_fill_ms) < self.post_fill_cooldown_ms
+            ):
+                reason = "cooldown"
+        n_replace = sum(1 for side in changed if getattr(state, side) is not None)
         if (
-            self._last_bid is not None
-            and self._last_ask is not None
-            and not force_replace
+            reason is None
+            and n_replace
+            and self.max_replacements_per_min > 0
+            and self.replacements_in_window(market_id, now_ms) + n_replace
+            > self.max_replacements_per_min
         ):
-            if (
-                abs(bid_quote - self._last_bid) < min_move
-                and abs(ask_quote - self._last_ask) < min_move
-            ):
-                skip_requote = True
-            if (now_ms - self.last_refresh_ms) < refresh_ms:
-                skip_requote = True
-        if skip_requote:
-            return {"cancel_count": 0, "submitted": 0, "skipped": True}
-        self.broker.cancel_all(market_id)
-        self.broker.submit_order(market_id, "bid", bid_quote, size_usd, True)
-        self.broker.submit_order(market_id, "ask", ask_quote, size_usd, True)
+            reason = "replace_budget"
+        if reason is not None:
+            return {
+                "cancel_count": 0,
+                "submitted": 0,
+                "replaced": 0,
+                "skipped": True,
+                "reason": reason,
+            }
+
+        # Replace in place when supported; otherwise one bulk cancel + one bulk submit
+        # (per-order fallback inside Broker when not supports_bulk). A side is submitted
+        # only once its cancel is confirmed.
+        legs: dict[str, dict[str, Any]] = {}
+        new_sides: list[str] = []
+        cancel_sides: list[str] = []
+        replaced = 0
+        for side in changed:
+            old = getattr(state, side)
+            if old is None:
+                new_sides.append(side)
+                continue
+            if not self.broker.supports_replace:
+                cancel_sides.append(side)
+                continue
+            replaced += 1
+            try:
+                legs[side] = self.broker.replace_order(
+                    old.order_id, quotes[side], size_usd
+                )
+            except Exception as e:  # noqa: BLE001 - reported per leg, like bulk legs
+                legs[side] = {"error": type(e).__name__}
+        cancelled = (
+            self.broker.cancel_orders(
+                [getattr(state, side).order_id for side in cancel_sides]
+            )
+            if cancel_sides
+            else []
+        )
+        submit_sides = new_sides.copy()
+        for side, ok in zip(cancel_sides, cancelled):
+            if ok:
+                submit_sides.append(side)
+            else:
+                legs[side] = {"error": "cancel_rejected", "cancelled": False}
+        if submit_sides:
+            submits = [
+                OrderRequest(market_id, side, quotes[side], size_usd, True)
+                for side in submit_sides
+            ]
+            for req, res in zip(submits, self.broker.submit_orders(submits)):
+                legs[req.side] = res
+        for side, ok in zip(cancel_sides, cancelled):
+            if ok:
+                legs[side] = {**legs[side], "cancelled": True}
+        for side in changed:
+            old = getattr(state, side)
+            res = legs.get(side) or {}
+            error = res.get("error")
+            if old is not None:
+                if side in submit_sides or error is None:
+                    _prune(state.replacements, now_ms)
+                    state.replacements.append(now_ms)
+                elif error not in ORDER_GONE_ERRORS:
+                    continue  # replace failed / cancel not confirmed: old order stays live
+                self.orders.pop(old.order_id, None)
+            order_id = res.get("order_id")
+            if not order_id or error is not None:
+                # Failed leg: no live order on that side; the next call places it again.
+                setattr(state, side, None)
+                continue
+            record = OrderRecord(str(order_id), side, quotes[side], size_usd, now_ms)
+            setattr(state, side, record)
+            self.orders[record.order_id] = record
+        state.last_refresh_ms = now_ms
         self.last_refresh_ms = now_ms
-        self._last_bid = bid_quote
-        self._last_ask = ask_quote
-        return {"cancel_count": 1, "submitted": 2, "skipped": False}
+        return {
+            "cancel_count": len(cancel_sides),
+            "submitted": len(submit_sides),
+            "replaced": replaced,
+            "skipped": False,
+            "legs": legs,
+        }
 
     def cancel_all(self, market_id: str | None = None) -> int:
-        return self.broker.cancel_all(market_id)
+        """Cancel via broker and forget live orders (next set_quotes places fresh ones)."""
+        count = self.broker.cancel_all(market_id)
+        if market_id is None:
+            targets = list(self.markets.values())
+        else:
+            state = self.markets.get(market_id)
+            targets = [state] if state is not None else []
+        for state in targets:
+            for side in SIDES:
+                old = getattr(state, side)
+                if old is not None:
+                    self.orders.pop(old.order_id, None)
+                    setattr(state, side, None)
+        return count
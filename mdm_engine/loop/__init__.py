@@ -1,8 +1,13 @@
 # Decision Ecosystem — mdm-engine
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Event loop: moved to docs/examples. Core is propose-only."""
+"""Event loop: pipelined asyncio runtime (modulation injected; no DMC import)."""
 
-# run_loop removed from package (was importing dmc_core). See docs/examples/README.md.
+from mdm_engine.loop.run_loop import (
+    PipelinedLoop,
+    StepMetrics,
+    passthrough_modulate,
+    run_loop,
+)
 
-__all__: list[str] = []
+__all__ = ["PipelinedLoop", "StepMetrics", "passthrough_modulate", "run_loop"]
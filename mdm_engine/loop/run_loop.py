@@ -0,0 +1,273 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Pipelined event loop: source -> features/propose -> modulate/execute -> trace (asyncio)."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import inspect
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.types import Proposal
+
+from mdm_engine.adapters.base import MarketDataSource
+from mdm_engine.mdm.decision_engine import DecisionEngine
+from mdm_engine.security.redaction import redact_dict
+from mdm_engine.trace.trace_logger import TraceLogger
+
+# modulate(proposal, context) -> (final_decision, mismatch); e.g. DMC's modulate with a bound policy.
+Modulator = Callable[[Proposal, dict[str, Any]], tuple[Any, Any]]
+
+_DONE = object()
+_METRIC_KEYS = ("feature_latency_ms", "mdm_latency_ms", "latency_ms")
+
+
+def passthrough_modulate(
+    proposal: Proposal, context: dict[str, Any]
+) -> tuple[Any, None]:
+    """No guard: the proposal is executed as proposed."""
+    return proposal, None
+
+
+def _wall_ms() -> float:
+    return time.time() * 1000.0
+
+
+def _as_dict(obj: Any) -> dict[str, Any]:
+    if isinstance(obj, dict):
+        return obj
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return dict(vars(obj))
+
+
+@dataclass(slots=True)
+class StepMetrics:
+    """Latency of one step (docs/FORMULAS.md), ms."""
+
+    step: int
+    event_ts_ms: float
+    feature_latency_ms: float  # feature_end_ts - event_ts_ms
+    mdm_latency_ms: float  # mdm_end_ts - feature_end_ts
+    latency_ms: float  # trace time - event_ts_ms
+
+
+@dataclass(slots=True)
+class _Step:
+    step: int
+    event: dict[str, Any]
+    event_ts_ms: float
+    feature_end_ms: float = 0.0
+    mdm_end_ms: float = 0.0
+    proposal: Any = None
+    final: Any = None
+    mismatch: Any = None
+    context: dict[str, Any] | None = None
+
+
+class PipelinedLoop:
+    """
+    Event loop as four asyncio stages joined by bounded queues (queue_size each):
+
+        source -> score (features + DecisionEngine.propose) -> execute (modulate + executor)
+        -> trace (TraceLogger)
+
+    Stages overlap wherever one awaits: the trace of step N is written (in a worker thread,
+    offload_trace; skipped by default for a background TraceLogger, whose write() only
+    enqueues) while step N+1 is scored; an executor whose run() is a coroutine
+    (AsyncExecutor) does not block scoring. Full queues apply backpressure to the source;
+    a supports_batch source is read with next_events(queue_size).
+    Event and context are redacted here before tracing, unless the TraceLogger redacts
+    itself (redact=True; with background=True that runs on its writer thread).
+
+    features: event -> features mapping (default: the event itself). modulate: injectable
+    guard (default passthrough_modulate; no DMC import here). Latencies use clock_ms
+    (default wall clock) and are measured from the time the loop read the event. Set
+    event_ts_key (e.g. "ts_ms") only when the source stamps events on the clock_ms time base
+    (epoch ms for the wall clock); simulated time such as SyntheticSource's ts_ms would put
+    the clock offset into every latency. A missing key falls back to the read time.
+    The newest metrics_maxlen StepMetrics are kept.
+    """
+
+    def __init__(
+        self,
+        source: MarketDataSource,
+        engine: DecisionEngine,
+        executor: Any = None,
+        trace: TraceLogger | None = None,
+        run_id: str = "run",
+        market_id: str = "default",
+        modulate: Modulator | None = None,
+        features: Callable[[dict[str, Any]], Mapping[str, Any]] | None = None,
+        queue_size: int = 64,
+        event_ts_key: str | None = None,
+        clock_ms: Callable[[], float] | None = None,
+        offload_source: bool = False,
+        offload_trace: bool | None = None,
+        metrics_maxlen: int | None = 10_000,
+    ):
+        if queue_size <= 0:
+            raise ValueError("queue_size must be positive")
+        self.source = source
+        self.engine = engine
+        self.executor = executor
+        self.trace = trace
+        self.run_id = run_id
+        self.market_id = market_id
+        self.modulate = modulate or passthrough_modulate
+        self.features = features
+        self.queue_size = queue_size
+        self.event_ts_key = event_ts_key
+        self.clock_ms = clock_ms or _wall_ms
+        self.offload_source = offload_source
+        if offload_trace is None:
+            offload_trace = not getattr(trace, "background", False)
+        self.offload_trace = offload_trace
+        self.metrics: deque[StepMetrics] = deque(maxlen=metrics_maxlen)
+        self.steps = 0
+
+    async def run(self, max_steps: int | None = None) -> dict[str, Any]:
+        """Run until the source is exhausted (or max_steps); return summary()."""
+        scored: asyncio.Queue = asyncio.Queue(self.queue_size)
+        executed: asyncio.Queue = asyncio.Queue(self.queue_size)
+        traced: asyncio.Queue = asyncio.Queue(self.queue_size)
+        t0 = self.clock_ms()
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._ingest(scored, max_steps))
+                tg.create_task(self._score(scored, executed))
+                tg.create_task(self._execute(executed, traced))
+                tg.create_task(self._trace(traced))
+        except ExceptionGroup as eg:
+            # A failing stage cancels the others; surface its own exception.
+            raise eg.exceptions[0] from None
+        return self.summary(elapsed_ms=self.clock_ms() - t0)
+
+    async def _ingest(self, out: asyncio.Queue, max_steps: int | None) -> None:
+        step = 0
+        ts_key = self.event_ts_key
+        source = self.source
+        # supports_batch: up to queue_size events per pull instead of one call per event.
+        pull_n = self.queue_size if source.supports_batch else 1
+        while max_steps is None or step < max_steps:
+            n = pull_n if max_steps is None else min(pull_n, max_steps - step)
+            if self.offload_source:
+                events = await asyncio.to_thread(source.next_events, n)
+            elif n == 1:
+                event = source.next_event()
+                events = [event] if event is not None else []
+            else:
+                events = source.next_events(n)
+            if not events:
+                break
+            now = self.clock_ms()
+            for event in events:
+                ts = event.get(ts_key) if ts_key is not None else None
+                await out.put(_Step(step, event, float(ts) if ts is not None else now))
+                step += 1
+                if not self.offload_source:
+                    await asyncio.sleep(0)  # let downstream stages take this step now
+        await out.put(_DONE)
+
+    async def _score(self, inp: asyncio.Queue, out: asyncio.Queue) -> None:
+        features_fn = self.features
+        while (item := await inp.get()) is not _DONE:
+            features = features_fn(item.event) if features_fn else item.event
+            item.feature_end_ms = self.clock_ms()
+            item.proposal = self.engine.propose(features)
+            item.mdm_end_ms = self.clock_ms()
+            await out.put(item)
+        await out.put(_DONE)
+
+    async def _execute(self, inp: asyncio.Queue, out: asyncio.Queue) -> None:
+        while (item := await inp.get()) is not _DONE:
+            item.context = {
+                "now_ms": item.mdm_end_ms,
+                "last_event_ts_ms": item.event_ts_ms,
+                "step": item.step,
+                "feature_latency_ms": item.feature_end_ms - item.event_ts_ms,
+                "mdm_latency_ms": item.mdm_end_ms - item.feature_end_ms,
+            }
+            item.final, item.mismatch = self.modulate(item.proposal, item.context)
+            if self.executor is not None:
+                result = self.executor.run(
+                    item.final, self.market_id, item.event.get("mid")
+                )
+                if inspect.isawaitable(result):
+                    await result
+            await out.put(item)
+        await out.put(_DONE)
+
+    async def _trace(self, inp: asyncio.Queue) -> None:
+        while (item := await inp.get()) is not _DONE:
+            latency_ms = self.clock_ms() - item.event_ts_ms
+            self.metrics.append(
+                StepMetrics(
+                    item.step,
+                    item.event_ts_ms,
+                    item.context["feature_latency_ms"],
+                    item.context["mdm_latency_ms"],
+                    latency_ms,
+                )
+            )
+            self.steps += 1
+            if self.trace is None:
+                continue
+            if getattr(self.trace, "redact", False):
+                event, context = item.event, item.context
+            else:
+                event, context = redact_dict(item.event), redact_dict(item.context)
+            packet = PacketV2(
+                run_id=self.run_id,
+                step=item.step,
+                input=event,
+                external=context,
+                mdm=_as_dict(item.proposal),
+                final_action=_as_dict(item.final),
+                latency_ms=int(latency_ms),
+                mismatch=_as_dict(item.mismatch) if item.mismatch is not None else None,
+            )
+            if self.offload_trace:
+                await asyncio.to_thread(self.trace.write, packet)
+            else:
+                self.trace.write(packet)
+
+    def summary(self, elapsed_ms: float | None = None) -> dict[str, Any]:
+        """Steps run and mean/p50/p95/max of each latency over the retained metrics."""
+        out: dict[str, Any] = {"steps": self.steps}
+        if elapsed_ms is not None:
+            out["elapsed_ms"] = elapsed_ms
+        if self.metrics:
+            for key in _METRIC_KEYS:
+                values = np.fromiter(
+                    (getattr(m, key) for m in self.metrics), np.float64
+                )
+                p50, p95 = np.percentile(values, [50, 95])
+                out[key] = {
+                    "mean": float(values.mean()),
+                    "p50": float(p50),
+                    "p95": float(p95),
+                    "max": float(values.max()),
+                }
+        return out
+
+
+def run_loop(
+    source: MarketDataSource,
+    executor: Any = None,
+    engine: DecisionEngine | None = None,
+    trace: TraceLogger | None = None,
+    max_steps: int | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Run a PipelinedLoop to completion (blocking); kwargs go to PipelinedLoop."""
+    loop = PipelinedLoop(source, engine or DecisionEngine(), executor, trace, **kwargs)
+    return asyncio.run(loop.run(max_steps))
@@ -5,5 +5,16 @@
 
 from mdm_engine.mdm.reference_model_generic import compute_proposal_reference
 from mdm_engine.mdm.decision_engine import DecisionEngine
+from mdm_engine.mdm.model_registry import register_model, unregister_model
+from mdm_engine.mdm.proposal_batch import ProposalBatch
+from mdm_engine.mdm.feature_schema import FeatureSchema, FeatureVector
 
-__all__ = ["compute_proposal_reference", "DecisionEngine"]
+__all__ = [
+    "compute_proposal_reference",
+    "DecisionEngine",
+    "register_model",
+    "unregister_model",
+    "ProposalBatch",
+    "FeatureSchema",
+    "FeatureVector",
+]
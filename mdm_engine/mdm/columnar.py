@@ -0,0 +1,62 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Columnar features: dict of 1-D arrays (one per key) or 2-D array plus key layout."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+Columns = dict[str, np.ndarray]
+
+
+def as_columns(
+    features: Mapping[str, Any] | np.ndarray,
+    keys: Sequence[str] | None = None,
+) -> tuple[Columns, int]:
+    """
+    Normalize columnar input to (columns, n_rows).
+
+    features: dict of equal-length 1-D arrays, or a 2-D array (n_rows, n_keys) with keys.
+    Raises ValueError on ragged columns, missing/mismatched keys or empty input.
+    """
+    if isinstance(features, np.ndarray):
+        if features.ndim != 2:
+            raise ValueError("2-D features array required (n_rows, n_keys)")
+        if keys is None or len(keys) != features.shape[1]:
+            raise ValueError("keys must name every column of the 2-D features array")
+        arr = np.asarray(features, dtype=float)
+        return {k: arr[:, j] for j, k in enumerate(keys)}, arr.shape[0]
+    if not features:
+        raise ValueError("columnar features require at least one column")
+    columns: Columns = {}
+    n: int | None = None
+    for k, v in features.items():
+        col = np.asarray(v, dtype=float)
+        if col.ndim != 1:
+            raise ValueError(f"column {k!r} must be 1-D")
+        if n is None:
+            n = col.shape[0]
+        elif col.shape[0] != n:
+            raise ValueError(f"column {k!r} has {col.shape[0]} rows, expected {n}")
+        columns[k] = col
+    return columns, int(n or 0)
+
+
+def column(columns: Columns, key: str, default: float, n: int) -> np.ndarray:
+    """Column by key, or a constant array of default (mirrors features.get(key, default))."""
+    col = columns.get(key)
+    if col is None:
+        return np.full(n, default, dtype=float)
+    return col
+
+
+def iter_rows(columns: Columns, n: int) -> Iterator[dict[str, float]]:
+    """Yield one plain dict per row (scalar fallback for models without a batch path)."""
+    keys = list(columns)
+    values = [columns[k].tolist() for k in keys]
+    for i in range(n):
+        yield {k: vals[i] for k, vals in zip(keys, values)}
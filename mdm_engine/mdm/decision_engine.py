@@ -5,55 +5,191 @@
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+import numpy as np
+
 from decision_schema.types import Proposal
+from mdm_engine.mdm.columnar import Columns, as_columns, iter_rows
+from mdm_engine.mdm.feature_schema import FeatureSchema, FeatureVector
+from mdm_engine.mdm.model_registry import (
+    PROVIDER_REFERENCE,
+    BatchModelFn,
+    ModelFn,
+    ModelResolution,
+    batch_model_of,
+    resolve_model,
+)
+from mdm_engine.mdm.proposal_batch import ProposalBatch
 from mdm_engine.mdm.reference_model_generic import (
     compute_proposal_reference,
-    compute_proposal_private,
+    REFERENCE_SCHEMA,
+    compute_proposal_reference_batch,
+    compute_proposal_reference_values,
+    fail_closed_proposal,
+    run_private_model,
 )
 
+_REFERENCE_VALUE_KEYS = ("signal_1", "state_scalar_a", "state_scalar_b")
+
 
 class DecisionEngine:
     """
     MDM Decision Engine: generates proposals from features.
 
     Uses private model hook if available (mdm_engine.mdm._private.model.compute_proposal_private),
-    otherwise falls back to reference implementation.
+    otherwise falls back to reference implementation. The model is resolved once at construction
+    (see model_registry); model_provider selects an explicitly registered or entry-point model.
+    lean=True: reference proposals skip params/features_summary dicts (action, confidence, reasons).
+    feature_schema: fixed layout for FeatureVector input (validated here, not per propose()).
     """
 
     def __init__(
         self,
         confidence_threshold: float = 0.5,
         signal_threshold: float = 0.1,
+        model_provider: str | None = None,
+        lean: bool = False,
+        feature_schema: FeatureSchema | None = None,
         **kwargs,  # Passed to private model if available
     ):
         self.confidence_threshold = confidence_threshold
         self.signal_threshold = signal_threshold
+        self.lean = lean
+        if feature_schema is not None and not isinstance(feature_schema, FeatureSchema):
+            raise TypeError("feature_schema must be a FeatureSchema")
+        self.feature_schema = feature_schema
+        # Slots resolved once: per tick the reference path reads values by index, not by key.
+        self._reference_reader = (
+            feature_schema.reader(
+                _REFERENCE_VALUE_KEYS,
+                {k: REFERENCE_SCHEMA.default(k) for k in _REFERENCE_VALUE_KEYS},
+            )
+            if feature_schema is not None
+            else None
+        )
         self._private_kwargs = kwargs
+        self._model: ModelResolution = resolve_model(model_provider)
+        self._swap_count = 0
+
+    @property
+    def model_stats(self) -> dict[str, Any]:
+        """Chosen provider, resolution time (ms) and number of hot swaps."""
+        model = self._model
+        return {
+            "provider": model.provider,
+            "resolve_ms": model.resolve_ms,
+            "swap_count": self._swap_count,
+        }
+
+    def swap_model(
+        self,
+        fn: ModelFn | None,
+        provider: str = "swap",
+        batch_fn: BatchModelFn | None = None,
+    ) -> None:
+        """
+        Atomically replace the resolved model while the engine is running (None = reference).
+
+        A single attribute rebind: concurrent propose() calls see either the old or the new model.
+        """
+        self._model = ModelResolution(
+            provider=provider if fn is not None else PROVIDER_REFERENCE,
+            fn=fn,
+            batch_fn=(batch_fn or batch_model_of(fn)) if fn is not None else None,
+        )
+        self._swap_count += 1
 
-    def propose(self, features: dict[str, Any]) -> Proposal:
+    def propose(self, features: Mapping[str, Any]) -> Proposal:
         """
-        Generate proposal from features.
+        Generate proposal from features (dict or FeatureVector).
 
         Tries private model hook first, falls back to reference.
         On private hook error: fail-closed (safe HOLD).
         """
-        # Try private model
-        proposal = compute_proposal_private(features, **self._private_kwargs)
-        if proposal is not None:
-            # Check if it's a fail-closed HOLD from error
-            if (
-                proposal.action.value == "HOLD"
-                and "private_hook_error" in proposal.reasons
-            ):
-                # Already fail-closed, return as-is
+        fn = self._model.fn
+        if fn is not None:
+            proposal = run_private_model(fn, features, **self._private_kwargs)
+            if proposal is not None:
                 return proposal
-            return proposal
+
+        if (
+            self._reference_reader is not None
+            and type(features) is FeatureVector
+            and features.schema is self.feature_schema
+        ):
+            s1, scale_a, scale_b = self._reference_reader(features.values)
+            return compute_proposal_reference_values(
+                s1,
+                scale_a,
+                scale_b,
+                self.confidence_threshold,
+                self.signal_threshold,
+                self.lean,
+            )
 
         # Fall back to reference (private hook not available - expected)
         return compute_proposal_reference(
             features,
             confidence_threshold=self.confidence_threshold,
             signal_threshold=self.signal_threshold,
+            lean=self.lean,
         )
+
+    def propose_batch(
+        self,
+        features: Mapping[str, Any] | np.ndarray,
+        keys: Sequence[str] | FeatureSchema | None = None,
+    ) -> ProposalBatch:
+        """
+        Generate one proposal per row of columnar features (as a compact ProposalBatch).
+
+        features: dict of equal-length 1-D arrays, or 2-D array (n_rows, n_keys) with keys
+            (a FeatureSchema works as keys; defaults to the engine's feature_schema).
+        Reference model: scored in one vectorized pass (same results as propose()).
+        Private model: its batch entry point if it opts in, else propose() semantics per row.
+        """
+        if keys is None and isinstance(features, np.ndarray):
+            keys = self.feature_schema
+        if isinstance(keys, FeatureSchema):
+            keys = keys.names
+        columns, n = as_columns(features, keys)
+        model = self._model
+        if model.fn is None:
+            return self._reference_batch(columns, n)
+        if model.batch_fn is not None:
+            return self._private_batch(model.batch_fn, columns, n)
+        return ProposalBatch.from_proposals(
+            [self.propose(row) for row in iter_rows(columns, n)]
+        )
+
+    def _reference_batch(self, columns: Columns, n: int) -> ProposalBatch:
+        return compute_proposal_reference_batch(
+            columns,
+            n,
+            confidence_threshold=self.confidence_threshold,
+            signal_threshold=self.signal_threshold,
+            lean=self.lean,
+        )
+
+    def _private_batch(
+        self, batch_fn: BatchModelFn, columns: Columns, n: int
+    ) -> ProposalBatch:
+        """Batch hook; rows it returns None for use reference. On error: fail-closed per row."""
+        try:
+            out = list(batch_fn(columns, **self._private_kwargs))
+            if len(out) != n:
+                raise ValueError(f"batch model returned {len(out)} rows, expected {n}")
+        except Exception as e:  # noqa: BLE001 - any hook error fails closed
+            logging.getLogger(__name__).warning(
+                "Private MDM batch hook error, failing closed: %s", type(e).__name__
+            )
+            return ProposalBatch.from_proposals(
+                [fail_closed_proposal(e) for _ in range(n)]
+            )
+        if any(p is None for p in out):
+            reference = self._reference_batch(columns, n)
+            out = [p if p is not None else r for p, r in zip(out, reference)]
+        return ProposalBatch.from_proposals(out)
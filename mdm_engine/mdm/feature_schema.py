@@ -0,0 +1,135 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Fixed-layout features: FeatureSchema (name -> slot, validated once) and FeatureVector (array('d')).
+
+FeatureVector is a Mapping by feature name, so code written against features dicts keeps working;
+adapters write slots directly (vec.values[i] = x with i = schema.index(name) computed once).
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any
+
+
+class FeatureSchema:
+    """Ordered feature names with per-slot defaults; validated at construction."""
+
+    __slots__ = ("_defaults", "_index", "names")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        defaults: Mapping[str, float] | None = None,
+    ):
+        names = tuple(names)
+        if not names:
+            raise ValueError("FeatureSchema requires at least one feature name")
+        for name in names:
+            if not isinstance(name, str) or not name:
+                raise ValueError(f"Invalid feature name: {name!r}")
+        if len(set(names)) != len(names):
+            raise ValueError("FeatureSchema names must be unique")
+        defaults = dict(defaults or {})
+        unknown = set(defaults) - set(names)
+        if unknown:
+            raise ValueError(f"Defaults for unknown features: {sorted(unknown)}")
+        values = [float(defaults.get(name, 0.0)) for name in names]
+        if not all(math.isfinite(v) for v in values):
+            raise ValueError("FeatureSchema defaults must be finite")
+        self.names: tuple[str, ...] = names
+        self._index: dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._defaults = array("d", values)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __repr__(self) -> str:
+        return f"FeatureSchema({list(self.names)!r})"
+
+    def index(self, name: str) -> int:
+        """Slot index of name (KeyError if not in schema)."""
+        return self._index[name]
+
+    def slot(self, name: str) -> int | None:
+        """Slot index of name, or None if not in schema."""
+        return self._index.get(name)
+
+    def default(self, name: str) -> float:
+        """Default value of a slot."""
+        return self._defaults[self._index[name]]
+
+    def reader(
+        self, names: Sequence[str], defaults: Mapping[str, float] | None = None
+    ) -> Callable[[Sequence[float]], tuple[float, ...]]:
+        """
+        Compile a values -> tuple reader for names (resolved to slots once).
+
+        Names absent from this schema read as defaults[name] (or 0.0).
+        """
+        names = tuple(names)
+        slots = [self._index.get(name) for name in names]
+        if all(i is not None for i in slots):
+            if len(slots) == 1:
+                i0 = slots[0]
+                return lambda values: (values[i0],)
+            return operator.itemgetter(*slots)
+        fallback = [float((defaults or {}).get(name, 0.0)) for name in names]
+        pairs = list(zip(slots, fallback))
+        return lambda values: tuple(values[i] if i is not None else d for i, d in pairs)
+
+    def new_vector(self) -> FeatureVector:
+        """Vector with every slot at its default (one array copy, no per-key work)."""
+        return FeatureVector(self, array("d", self._defaults))
+
+    def vector_from(self, features: Mapping[str, Any]) -> FeatureVector:
+        """Vector from a features dict; keys outside the schema are ignored."""
+        vec = self.new_vector()
+        values = vec.values
+        for name, i in self._index.items():
+            if name in features:
+                values[i] = float(features[name])
+        return vec
+
+
+class FeatureVector(Mapping[str, float]):
+    """Feature values in schema slot order (array('d')); Mapping view by feature name."""
+
+    __slots__ = ("schema", "values")
+
+    def __init__(self, schema: FeatureSchema, values: array | None = None):
+        if values is None:
+            values = array("d", schema._defaults)
+        elif len(values) != len(schema):
+            raise ValueError(
+                f"FeatureVector has {len(values)} values, schema has {len(schema)}"
+            )
+        self.schema = schema
+        self.values = values
+
+    def __getitem__(self, name: str) -> float:
+        return self.values[self.schema._index[name]]
+
+    def __setitem__(self, name: str, value: float) -> None:
+        self.values[self.schema._index[name]] = value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.names)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"FeatureVector({self.to_dict()!r})"
+
+    def to_dict(self) -> dict[str, float]:
+        """Plain dict copy (e.g. for traces)."""
+        return dict(zip(self.schema.names, self.values))
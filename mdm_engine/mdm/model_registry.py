@@ -0,0 +1,134 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Model provider registry: resolve the proposal model once (private hook, explicit, entry point).
+
+Resolution happens at DecisionEngine construction; propose() only calls the resolved callable.
+Python does not cache failed imports, so probing the private hook per call is avoided here.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+
+from decision_schema.types import Proposal
+
+ModelFn = Callable[..., Proposal | None]
+# Batch opt-in: fn(columns: dict[str, np.ndarray], **kwargs) -> sequence of Proposal | None
+BatchModelFn = Callable[..., Sequence[Proposal | None]]
+
+ENTRY_POINT_GROUP = "mdm_engine.models"
+PRIVATE_HOOK_MODULE = "mdm_engine.mdm._private.model"
+PRIVATE_HOOK_ATTR = "compute_proposal_private"
+PRIVATE_HOOK_BATCH_ATTR = "compute_proposal_private_batch"
+BATCH_ATTR = "batch"
+
+PROVIDER_REFERENCE = "reference"
+PROVIDER_PRIVATE = "private_hook"
+
+_registry: dict[str, tuple[ModelFn, BatchModelFn | None]] = {}
+_registry_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ModelResolution:
+    """Resolved model: provider label, callable (None = reference), batch opt-in, resolution time."""
+
+    provider: str
+    fn: ModelFn | None
+    resolve_ms: float = 0.0
+    batch_fn: BatchModelFn | None = None
+
+
+def batch_model_of(fn: ModelFn | None) -> BatchModelFn | None:
+    """Batch entry point a model opts into via a callable `batch` attribute (else None)."""
+    batch_fn = getattr(fn, BATCH_ATTR, None)
+    return batch_fn if callable(batch_fn) else None
+
+
+def register_model(
+    name: str,
+    fn: ModelFn,
+    replace: bool = False,
+    batch_fn: BatchModelFn | None = None,
+) -> None:
+    """
+    Register a model callable under name; raise ValueError if taken (unless replace).
+
+    batch_fn (or a `batch` attribute on fn) opts the model into DecisionEngine.propose_batch.
+    """
+    with _registry_lock:
+        if name in _registry and not replace:
+            raise ValueError(f"Model provider {name!r} already registered")
+        _registry[name] = (fn, batch_fn or batch_model_of(fn))
+
+
+def unregister_model(name: str) -> ModelFn | None:
+    """Remove a registered model; return it (or None if absent)."""
+    with _registry_lock:
+        entry = _registry.pop(name, None)
+    return entry[0] if entry is not None else None
+
+
+def registered_models() -> list[str]:
+    """Names of explicitly registered models (entry points not included)."""
+    with _registry_lock:
+        return sorted(_registry)
+
+
+def load_private_hook() -> ModelFn | None:
+    """Import mdm_engine.mdm._private.model once; None if missing (expected in public builds)."""
+    return _load_private_hook()[0]
+
+
+def _load_private_hook() -> tuple[ModelFn | None, BatchModelFn | None]:
+    try:
+        module = importlib.import_module(PRIVATE_HOOK_MODULE)
+    except ImportError:
+        return None, None
+    fn = getattr(module, PRIVATE_HOOK_ATTR, None)
+    batch_fn = getattr(module, PRIVATE_HOOK_BATCH_ATTR, None) or batch_model_of(fn)
+    return fn, batch_fn if fn is not None else None
+
+
+def _load_entry_point(name: str) -> ModelFn | None:
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        if ep.name == name:
+            return ep.load()
+    return None
+
+
+def resolve_model(name: str | None = None) -> ModelResolution:
+    """
+    Resolve a model provider.
+
+    name=None: private hook if present, otherwise reference (fn=None).
+    name given: explicit registry first, then entry points in group "mdm_engine.models".
+    Raises LookupError if a named provider cannot be found (fail at construction, not per call).
+    """
+    t0 = time.perf_counter()
+    if name is None:
+        fn, batch_fn = _load_private_hook()
+        provider = PROVIDER_PRIVATE if fn is not None else PROVIDER_REFERENCE
+    else:
+        with _registry_lock:
+            fn, batch_fn = _registry.get(name, (None, None))
+        provider = f"registry:{name}"
+        if fn is None:
+            fn = _load_entry_point(name)
+            batch_fn = batch_model_of(fn)
+            provider = f"entry_point:{name}"
+        if fn is None:
+            raise LookupError(f"No model provider named {name!r}")
+    return ModelResolution(
+        provider=provider,
+        fn=fn,
+        resolve_ms=(time.perf_counter() - t0) * 1000.0,
+        batch_fn=batch_fn,
+    )
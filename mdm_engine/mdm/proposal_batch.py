@@ -0,0 +1,158 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+ProposalBatch: columnar proposals (action codes, confidences, reason bitmask in typed arrays).
+
+Proposal objects are built only when a row is indexed; readers of action/confidence stay on arrays.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+from decision_schema.types import Action, Proposal
+
+ACTIONS: tuple[Action, ...] = tuple(Action)
+ACTION_CODES: dict[Action, int] = {a: i for i, a in enumerate(ACTIONS)}
+
+# Reason bit i <-> REASONS[i]; decoded in this order (matches reference reason order).
+REASONS: tuple[str, ...] = (
+    "sufficient_scale",
+    "signal_above_threshold",
+    "tight_penalty",
+    "low_confidence",
+    "private_hook_error",
+)
+REASON_BITS: dict[str, int] = {r: 1 << i for i, r in enumerate(REASONS)}
+
+
+def encode_reasons(reasons: Sequence[str]) -> int:
+    """Bitmask of known reasons (unknown reasons are not representable and are dropped)."""
+    bits = 0
+    for r in reasons:
+        bits |= REASON_BITS.get(r, 0)
+    return bits
+
+
+def decode_reasons(bits: int) -> list[str]:
+    """Reason names for a bitmask, in REASONS order."""
+    return [r for i, r in enumerate(REASONS) if bits & (1 << i)]
+
+
+class ProposalBatch(Sequence[Proposal]):
+    """
+    Compact proposal rows: actions (uint8 codes into ACTIONS), confidences (float64),
+    reason_bits (uint8 over REASONS). Indexing a row materializes a decision_schema Proposal.
+
+    components: optional per-row score arrays, attached to ACT rows as params["score_components"]
+    and features_summary unless lean=True (lean rows carry action, confidence, reasons only).
+    """
+
+    __slots__ = (
+        "_components",
+        "_rows",
+        "actions",
+        "confidences",
+        "lean",
+        "reason_bits",
+    )
+
+    def __init__(
+        self,
+        actions: np.ndarray,
+        confidences: np.ndarray,
+        reason_bits: np.ndarray,
+        components: dict[str, np.ndarray] | None = None,
+        lean: bool = False,
+        rows: Sequence[Proposal] | None = None,
+    ):
+        self.actions = np.asarray(actions, dtype=np.uint8)
+        self.confidences = np.asarray(confidences, dtype=np.float64)
+        self.reason_bits = np.asarray(reason_bits, dtype=np.uint8)
+        if not (len(self.actions) == len(self.confidences) == len(self.reason_bits)):
+            raise ValueError(
+                "actions, confidences and reason_bits must have equal length"
+            )
+        self.lean = lean
+        self._components = components
+        self._rows = rows
+
+    @classmethod
+    def from_proposals(cls, proposals: Sequence[Proposal]) -> ProposalBatch:
+        """Wrap already-built proposals (e.g. private models); arrays are derived once."""
+        rows = list(proposals)
+        return cls(
+            actions=np.fromiter(
+                (ACTION_CODES[p.action] for p in rows), dtype=np.uint8, count=len(rows)
+            ),
+            confidences=np.fromiter(
+                (p.confidence for p in rows), dtype=np.float64, count=len(rows)
+            ),
+            reason_bits=np.fromiter(
+                (encode_reasons(p.reasons or []) for p in rows),
+                dtype=np.uint8,
+                count=len(rows),
+            ),
+            rows=rows,
+        )
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return self._take(index)
+        if self._rows is not None:
+            return self._rows[index]
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[Proposal]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"ProposalBatch(n={len(self)}, lean={self.lean})"
+
+    def mask(self, action: Action) -> np.ndarray:
+        """Boolean array: rows whose action is `action`."""
+        return self.actions == ACTION_CODES[action]
+
+    def has_reason(self, reason: str) -> np.ndarray:
+        """Boolean array: rows carrying `reason`."""
+        return (self.reason_bits & REASON_BITS[reason]) != 0
+
+    def action_at(self, index: int) -> Action:
+        """Action of one row without building a Proposal."""
+        return ACTIONS[self.actions[index]]
+
+    def _take(self, index: slice) -> ProposalBatch:
+        components = (
+            {k: v[index] for k, v in self._components.items()}
+            if self._components is not None
+            else None
+        )
+        return ProposalBatch(
+            self.actions[index],
+            self.confidences[index],
+            self.reason_bits[index],
+            components=components,
+            lean=self.lean,
+            rows=self._rows[index] if self._rows is not None else None,
+        )
+
+    def _materialize(self, index: int) -> Proposal:
+        action = ACTIONS[self.actions[index]]
+        confidence = float(self.confidences[index])
+        reasons = decode_reasons(int(self.reason_bits[index]))
+        if action is Action.ACT and not self.lean and self._components is not None:
+            components = {k: float(v[index]) for k, v in self._components.items()}
+            return Proposal(
+                action=action,
+                confidence=confidence,
+                reasons=reasons,
+                params={"score_components": components},
+                features_summary=dict(components),
+            )
+        return Proposal(action=action, confidence=confidence, reasons=reasons)
@@ -9,16 +9,31 @@ INVARIANT 0: No domain vocabulary. Use params for domain-specific data only with
 
 from __future__ import annotations
 
+import functools
+import logging
 import math
+from collections.abc import Callable, Mapping
 from typing import Any
 
+import numpy as np
 from decision_schema.types import Action, Proposal
 
+from mdm_engine.mdm.columnar import Columns, column
+from mdm_engine.mdm.feature_schema import FeatureSchema
+from mdm_engine.mdm.proposal_batch import ACTION_CODES, REASON_BITS, ProposalBatch
+
+# Generic keys read by the reference model, with the defaults it applies when a key is absent.
+REFERENCE_SCHEMA = FeatureSchema(
+    ["signal_0", "signal_1", "state_scalar_a", "state_scalar_b"],
+    defaults={"signal_0": 0.5},
+)
+
 
 def compute_proposal_reference(
-    features: dict[str, Any],
+    features: Mapping[str, Any],
     confidence_threshold: float = 0.5,
     signal_threshold: float = 0.1,
+    lean: bool = False,
 ) -> Proposal:
     """
     Reference MDM: simple scoring from generic signals.
@@ -28,18 +43,35 @@ def compute_proposal_reference(
     (Reference implementation: generic numeric scorer).
 
     Args:
-        features: Generic keys signal_0, signal_1, state_scalar_a, state_scalar_b (optional)
+        features: Generic keys signal_0, signal_1, state_scalar_a, state_scalar_b (optional);
+            a dict or a FeatureVector
         confidence_threshold: Minimum confidence to propose ACT
         signal_threshold: Minimum |signal_1| to propose ACT
+        lean: Skip params/features_summary dicts (action, confidence, reasons only)
 
     Returns:
         Proposal with action, confidence, reasons
     """
     _s0 = features.get("signal_0", 0.5)  # reserved for future use
-    s1 = features.get("signal_1", 0.0)
-    scale_a = features.get("state_scalar_a", 0.0)
-    scale_b = features.get("state_scalar_b", 0.0)
+    return compute_proposal_reference_values(
+        features.get("signal_1", 0.0),
+        features.get("state_scalar_a", 0.0),
+        features.get("state_scalar_b", 0.0),
+        confidence_threshold,
+        signal_threshold,
+        lean,
+    )
+
 
+def compute_proposal_reference_values(
+    s1: float,
+    scale_a: float,
+    scale_b: float,
+    confidence_threshold: float = 0.5,
+    signal_threshold: float = 0.1,
+    lean: bool = False,
+) -> Proposal:
+    """Reference MDM on already-extracted values (no key lookups; used with FeatureVector slots)."""
     scale_score = min(1.0, scale_a / 100.0) if scale_a else 0.0
     signal_score = abs(s1)
     width_penalty = min(1.0, max(0.0, 1.0 - (scale_b or 0) / 1000.0))
@@ -47,15 +79,38 @@ def compute_proposal_reference(
     raw_score = scale_score * 0.4 + signal_score * 0.4 + width_penalty * 0.2
     confidence = 1.0 / (1.0 + math.exp(-5.0 * (raw_score - 0.5)))
 
+    return _reference_proposal(
+        confidence,
+        scale_score,
+        signal_score,
+        width_penalty,
+        confidence >= confidence_threshold and abs(s1) >= signal_threshold,
+        signal_threshold,
+        lean,
+    )
+
+
+def _reference_proposal(
+    confidence: float,
+    scale_score: float,
+    signal_score: float,
+    width_penalty: float,
+    act: bool,
+    signal_threshold: float,
+    lean: bool = False,
+) -> Proposal:
+    """Build the reference Proposal from precomputed score components (scalar and batch)."""
     reasons = []
     if scale_score > 0.5:
         reasons.append("sufficient_scale")
-    if abs(s1) > signal_threshold:
+    if signal_score > signal_threshold:
         reasons.append("signal_above_threshold")
     if width_penalty > 0.7:
         reasons.append("tight_penalty")
 
-    if confidence >= confidence_threshold and abs(s1) >= signal_threshold:
+    if act and lean:
+        return Proposal(action=Action.ACT, confidence=confidence, reasons=reasons)
+    if act:
         return Proposal(
             action=Action.ACT,
             confidence=confidence,
@@ -73,31 +128,119 @@ def compute_proposal_reference(
     )
 
 
-def compute_proposal_private(
-    features: dict[str, Any], **kwargs: Any
-) -> Proposal | None:
+def reference_scores_batch(
+    columns: Columns,
+    n: int,
+    confidence_threshold: float = 0.5,
+    signal_threshold: float = 0.1,
+) -> dict[str, np.ndarray]:
     """
-    Private model hook: import from mdm_engine.mdm._private.model if exists.
+    Vectorized reference scoring over columnar features (same formulas as the scalar path).
 
-    Returns None if not available. On exception: fail-closed (safe HOLD).
+    Returns arrays: scale_score, signal_score, width_penalty, confidence, act (bool).
     """
-    try:
-        from mdm_engine.mdm._private.model import (
-            compute_proposal_private as _private_compute,
+    s1 = column(columns, "signal_1", 0.0, n)
+    scale_a = column(columns, "state_scalar_a", 0.0, n)
+    scale_b = column(columns, "state_scalar_b", 0.0, n)
+
+    scale_score = np.where(scale_a != 0.0, np.minimum(1.0, scale_a / 100.0), 0.0)
+    signal_score = np.abs(s1)
+    width_penalty = np.clip(1.0 - scale_b / 1000.0, 0.0, 1.0)
+
+    raw_score = scale_score * 0.4 + signal_score * 0.4 + width_penalty * 0.2
+    confidence = 1.0 / (1.0 + np.exp(-5.0 * (raw_score - 0.5)))
+    act = (confidence >= confidence_threshold) & (signal_score >= signal_threshold)
+    return {
+        "scale_score": scale_score,
+        "signal_score": signal_score,
+        "width_penalty": width_penalty,
+        "confidence": confidence,
+        "act": act,
+    }
+
+
+def compute_proposal_reference_batch(
+    columns: Columns,
+    n: int,
+    confidence_threshold: float = 0.5,
+    signal_threshold: float = 0.1,
+    lean: bool = False,
+) -> ProposalBatch:
+    """
+    Reference MDM over columnar features, scored in one NumPy pass.
+
+    Returns a ProposalBatch (typed arrays); rows materialize the same Proposal as the scalar path.
+    """
+    scores = reference_scores_batch(columns, n, confidence_threshold, signal_threshold)
+    act = scores["act"]
+    bits = (
+        np.where(scores["scale_score"] > 0.5, REASON_BITS["sufficient_scale"], 0)
+        | np.where(
+            scores["signal_score"] > signal_threshold,
+            REASON_BITS["signal_above_threshold"],
+            0,
         )
+        | np.where(scores["width_penalty"] > 0.7, REASON_BITS["tight_penalty"], 0)
+    )
+    bits = np.where(~act & (bits == 0), REASON_BITS["low_confidence"], bits)
+    return ProposalBatch(
+        actions=np.where(act, ACTION_CODES[Action.ACT], ACTION_CODES[Action.HOLD]),
+        confidences=scores["confidence"],
+        reason_bits=bits,
+        components=None
+        if lean
+        else {
+            "scale_score": scores["scale_score"],
+            "signal_score": scores["signal_score"],
+        },
+        lean=lean,
+    )
 
-        return _private_compute(features, **kwargs)
-    except ImportError:
-        return None
-    except Exception as e:
-        import logging
 
+def run_private_model(
+    fn: Callable[..., Proposal | None], features: Mapping[str, Any], **kwargs: Any
+) -> Proposal | None:
+    """
+    Call a resolved private model. On exception: fail-closed (safe HOLD).
+
+    Returns whatever the model returns (None = defer to reference).
+    """
+    try:
+        return fn(features, **kwargs)
+    except Exception as e:
         logging.getLogger(__name__).warning(
             "Private MDM hook error, using reference: %s", type(e).__name__
         )
-        return Proposal(
-            action=Action.HOLD,
-            confidence=0.0,
-            reasons=["private_hook_error"],
-            features_summary={"error": type(e).__name__},
-        )
+        return fail_closed_proposal(e)
+
+
+def fail_closed_proposal(error: BaseException) -> Proposal:
+    """Safe HOLD returned when a private model raises (reason: private_hook_error)."""
+    return Proposal(
+        action=Action.HOLD,
+        confidence=0.0,
+        reasons=["private_hook_error"],
+        features_summary={"error": type(error).__name__},
+    )
+
+
+@functools.cache
+def _cached_private_hook() -> Callable[..., Proposal | None] | None:
+    from mdm_engine.mdm.model_registry import load_private_hook
+
+    return load_private_hook()
+
+
+def compute_proposal_private(
+    features: dict[str, Any], **kwargs: Any
+) -> Proposal | None:
+    """
+    Private model hook: import from mdm_engine.mdm._private.model if exists.
+
+    The hook is resolved once per process (a missing hook is not re-imported per call).
+    Returns None if not available. On exception: fail-closed (safe HOLD).
+    """
+    fn = _cached_private_hook()
+    if fn is None:
+        return None
+    return run_private_model(fn, features, **kwargs)
@@ -4,8 +4,12 @@
 """Security: secrets, signing, redaction, rate limit, audit."""
 
 from mdm_engine.security.secrets import SecretsProvider, EnvSecretsProvider
-from mdm_engine.security.redaction import redact_dict
-from mdm_engine.security.rate_limit import RateLimiter
+from mdm_engine.security.redaction import RedactedView, redact_dict
+from mdm_engine.security.rate_limit import (
+    KeyedRateLimiter,
+    RateLimiter,
+    ThreadSafeRateLimiter,
+)
 from mdm_engine.security.audit import AuditLogger
 
 __all__ = [
@@ -14,4 +18,7 @@ __all__ = [
     "redact_dict",
     "RateLimiter",
     "AuditLogger",
+    "RedactedView",
+    "ThreadSafeRateLimiter",
+    "KeyedRateLimiter",
 ]
@@ -6,24 +6,106 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
 from typing import Any
 
+from mdm_engine.background_writer import BackgroundWriter
+
+
+def _line(line: str) -> str:
+    return line
+
 
 class AuditLogger:
-    """Append audit events (redacted) to security_audit.jsonl."""
+    """
+    Append audit events (redacted) to security_audit.jsonl.
 
-    def __init__(self, run_dir: Path):
+    Default: each log() writes and flushes its line. batched=True hands lines to a
+    BackgroundWriter (mdm_engine.background_writer, shared with TraceLogger): up to
+    batch_size lines are committed with one write + flush, at most flush_interval_s after
+    the first of them was logged, and log() only serializes and enqueues. A full queue
+    blocks (events are never dropped). sync() (or log(..., sync=True)) returns once
+    everything logged so far is fsynced. stats() reports lines written, batches and flush latency in both modes.
+    """
+
+    def __init__(
+        self,
+        run_dir: Path,
+        batched: bool = False,
+        flush_interval_s: float = 0.05,
+        batch_size: int = 256,
+        queue_size: int = 10_000,
+    ):
         self.run_dir = Path(run_dir)
         self.run_dir.mkdir(parents=True, exist_ok=True)
         self.path = self.run_dir / "security_audit.jsonl"
-        self._file = open(self.path, "a", encoding="utf-8")
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115 - long-lived, closed in close()
+        self.batched = batched
+        self._writer = None
+        if batched:
+            self._writer = BackgroundWriter(
+                self._file,
+                _line,
+                maxsize=queue_size,
+                max_batch=batch_size,
+                name="audit-writer",
+                linger_s=flush_interval_s,
+            )
+        self._lines = 0
+        self._flush_ms_total = 0.0
+        self._flush_ms_max = 0.0
 
-    def log(self, event_type: str, payload: dict[str, Any] | None = None) -> None:
-        """Write one audit line; payload must not contain secrets."""
+    def log(
+        self, event_type: str, payload: dict[str, Any] | None = None, sync: bool = False
+    ) -> None:
+        """Write one audit line; payload must not contain secrets. sync=True: durable now."""
         line = json.dumps({"event": event_type, **(payload or {})}, default=str) + "\n"
+        if self._writer is not None:
+            self._writer.put(line)
+            if sync:
+                self._writer.sync()
+            return
+        t0 = time.perf_counter()
         self._file.write(line)
         self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+        ms = (time.perf_counter() - t0) * 1000.0
+        self._lines += 1
+        self._flush_ms_total += ms
+        self._flush_ms_max = max(self._flush_ms_max, ms)
+
+    def sync(self) -> None:
+        """Block until every event logged so far is written and fsynced."""
+        if self._writer is not None:
+            self._writer.sync()
+        else:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def stats(self) -> dict[str, Any]:
+        """lines_written, batches, flush_ms_mean / flush_ms_max (+ queue depth if batched)."""
+        if self._writer is not None:
+            s = self._writer.stats()
+            return {
+                "lines_written": s["written"],
+                "batches": s["groups"],
+                "flush_ms_mean": s["commit_ms_mean"],
+                "flush_ms_max": s["commit_ms_max"],
+                "depth": s["depth"],
+            }
+        return {
+            "lines_written": self._lines,
+            "batches": self._lines,
+            "flush_ms_mean": self._flush_ms_total / self._lines if self._lines else 0.0,
+            "flush_ms_max": self._flush_ms_max,
+        }
 
     def close(self) -> None:
-        self._file.close()
+        """Close the file (batched: drains pending lines first)."""
+        if self._writer is not None:
+            self._writer.close()
+        else:
+            self._file.close()
@@ -3,10 +3,19 @@
 # SPDX-License-Identifier: MIT
 """RateLimiter (token bucket); exponential backoff with jitter on 429."""
 
-import time
+import asyncio
+import math
 import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 
+_EPS = 1e-9  # float slack when comparing tokens to cost after a computed sleep
+# acquire without timeout on a bucket that never refills re-checks this often
+_MAX_SLEEP = 60.0
+
 
 @dataclass
 class RateLimiter:
@@ -16,6 +25,13 @@ class RateLimiter:
     Initial token policy: default tokens=0.0 (first allow() may deny until refill).
     Set start_full=True so tokens start at capacity; first allow() then succeeds.
     Invariant: 0 <= tokens <= capacity.
+
+    allow(cost) never waits or raises: False when cost tokens are not available (always for
+    rate <= 0 once empty, and for cost > capacity). acquire(cost, timeout) / await
+    acquire_async(...) sleep exactly until cost tokens have refilled (no polling), and return
+    False at once if that is later than timeout (with rate <= 0: never refills, so False for
+    any timeout; without one they wait indefinitely). cost > capacity can never be acquired:
+    ValueError. Not thread-safe; see ThreadSafeRateLimiter.
     """
 
     rate: float  # tokens per second
@@ -34,17 +50,157 @@ class RateLimiter:
         now = time.monotonic()
         self.tokens = min(
             self.capacity,
-            self.tokens + (now - self.last_refill) * self.rate,
+            self.tokens + (now - self.last_refill) * max(self.rate, 0.0),
         )
         self.last_refill = now
 
-    def allow(self) -> bool:
-        """Consume one token if available; return True if allowed."""
+    def _take(self, cost: float) -> float:
+        """
+        Consume cost tokens and return 0.0, or return the seconds until they refill
+        (math.inf if they never will: cost > capacity or rate <= 0).
+        """
         self._refill()
-        if self.tokens >= 1:
-            self.tokens -= 1
-            return True
-        return False
+        if self.tokens + _EPS >= cost:
+            self.tokens = max(0.0, self.tokens - cost)
+            return 0.0
+        if cost > self.capacity or self.rate <= 0:
+            return math.inf
+        return (cost - self.tokens) / self.rate
+
+    def _is_full(self, now: float) -> bool:
+        """True if the bucket is back at capacity by now (does not refill it)."""
+        refill = (now - self.last_refill) * max(self.rate, 0.0)
+        return self.tokens + refill + _EPS >= self.capacity
+
+    def _check_cost(self, cost: float) -> None:
+        if cost > self.capacity:
+            raise ValueError(f"cost {cost} exceeds capacity {self.capacity}")
+
+    def allow(self, cost: float = 1) -> bool:
+        """Consume cost tokens (default one) if available; return True if allowed."""
+        return self._take(cost) == 0.0
+
+    def acquire(self, cost: float = 1, timeout: float | None = None) -> bool:
+        """Block until cost tokens are consumed; False if not possible within timeout."""
+        self._check_cost(cost)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while (wait := self._take(cost)) > 0.0:
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(min(wait, _MAX_SLEEP))
+        return True
+
+    async def acquire_async(
+        self, cost: float = 1, timeout: float | None = None
+    ) -> bool:
+        """acquire() for event loops: awaits asyncio.sleep instead of blocking."""
+        self._check_cost(cost)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while (wait := self._take(cost)) > 0.0:
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(min(wait, _MAX_SLEEP))
+        return True
+
+
+@dataclass
+class ThreadSafeRateLimiter(RateLimiter):
+    """RateLimiter whose refill-and-consume step holds a lock (sleeps do not)."""
+
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def _take(self, cost: float) -> float:
+        with self._lock:
+            return super()._take(cost)
+
+    def _is_full(self, now: float) -> bool:
+        with self._lock:
+            return super()._is_full(now)
+
+
+class KeyedRateLimiter:
+    """
+    One ThreadSafeRateLimiter per key (endpoint, tenant, ...), created on first use.
+
+    Buckets unused for idle_seconds are evicted (default capacity / rate: a bucket idle
+    that long has refilled completely; never for rate <= 0, where a bucket does not refill);
+    max_keys additionally caps the count, evicting the least recently used buckets. With
+    start_full=True a bucket is only evicted once it has refilled to capacity, since a
+    re-created bucket starts full (evicting earlier would reset a spent key); the count
+    can then exceed max_keys until the oldest bucket has refilled. Eviction is amortized
+    over lookups (buckets are kept in last-use order). Thread-safe.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        start_full: bool = False,
+        idle_seconds: float | None = None,
+        max_keys: int | None = None,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.start_full = start_full
+        if idle_seconds is None:
+            idle_seconds = capacity / rate if rate > 0 else math.inf
+        self.idle_seconds = idle_seconds
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[Hashable, ThreadSafeRateLimiter] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def limiter(self, key: Hashable) -> ThreadSafeRateLimiter:
+        """Bucket for key (created if missing); evicts idle buckets."""
+        now = time.monotonic()
+        with self._lock:
+            buckets = self._buckets
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = ThreadSafeRateLimiter(
+                    self.rate, self.capacity, start_full=self.start_full
+                )
+            else:
+                buckets.move_to_end(key)
+            cutoff = now - self.idle_seconds
+            while True:  # stops at bucket (last) at the latest
+                oldest = next(iter(buckets.values()))
+                if (
+                    oldest is bucket
+                    or oldest.last_refill > cutoff
+                    or not self._evictable(oldest, now)
+                ):
+                    break
+                buckets.popitem(last=False)
+            if self.max_keys is not None:
+                while len(buckets) > self.max_keys:
+                    if not self._evictable(next(iter(buckets.values())), now):
+                        break
+                    buckets.popitem(last=False)
+            return bucket
+
+    def _evictable(self, bucket: ThreadSafeRateLimiter, now: float) -> bool:
+        return not self.start_full or bucket._is_full(now)
+
+    def allow(self, key: Hashable, cost: float = 1) -> bool:
+        """RateLimiter.allow on key's bucket."""
+        return self.limiter(key).allow(cost)
+
+    def acquire(
+        self, key: Hashable, cost: float = 1, timeout: float | None = None
+    ) -> bool:
+        """RateLimiter.acquire on key's bucket."""
+        return self.limiter(key).acquire(cost, timeout)
+
+    async def acquire_async(
+        self, key: Hashable, cost: float = 1, timeout: float | None = None
+    ) -> bool:
+        """RateLimiter.acquire_async on key's bucket."""
+        return await self.limiter(key).acquire_async(cost, timeout)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
 
 
 def backoff_with_jitter(
@@ -6,6 +6,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
 from typing import Any
 
 REDACT_KEYS = frozenset(
@@ -26,37 +28,154 @@ REDACT_KEYS = frozenset(
     }
 )
 
+REDACTED = "[REDACTED]"
+VERDICT_CACHE_SIZE = 4096  # key -> sensitive?, per key set
+PLAN_CACHE_SIZE = 1024  # dict shape (key tuple) -> sensitive keys, per key set
+_KEY_NOISE = re.compile(r"[-_\s]")
+
 
 def _redact_value(_: Any) -> str:
-    return "[REDACTED]"
+    return REDACTED
 
 
-def _normalized_key_set(keys: frozenset[str]) -> set[str]:
+def _normalized_key_set(keys: frozenset[str]) -> frozenset[str]:
     """Normalize keys once for matching (lower, no dashes/underscores/spaces)."""
-    return {re.sub(r"[-_\s]", "", x.lower()) for x in keys}
+    return frozenset(_KEY_NOISE.sub("", x.lower()) for x in keys)
+
+
+class _Rules:
+    """Compiled key set with memoized per-key verdicts and per-shape plans (bounded LRU)."""
+
+    def __init__(self, keys: frozenset[str]):
+        self.norm_set = _normalized_key_set(keys)
+        self.sensitive = lru_cache(maxsize=VERDICT_CACHE_SIZE)(self._sensitive)
+        self.plan = lru_cache(maxsize=PLAN_CACHE_SIZE)(self._plan)
+
+    def _sensitive(self, key: Any) -> bool:
+        return isinstance(key, str) and _KEY_NOISE.sub("", key.lower()) in self.norm_set
+
+    def _plan(self, shape: tuple) -> frozenset:
+        """Sensitive keys of a dict with these keys (in this order)."""
+        sensitive = self.sensitive
+        return frozenset(k for k in shape if sensitive(k))
+
+    def shared(self, d: dict[str, Any]) -> dict[str, Any]:
+        """Redacted dict; returns d itself when nothing under it is sensitive."""
+        hits = self.plan(tuple(d))
+        out = None
+        if hits:
+            out = dict(d)
+            for k in hits:
+                out[k] = _redact_value(d[k])
+        for k, v in d.items():
+            if isinstance(v, dict):
+                if hits and k in hits:
+                    continue
+                nv = self.shared(v)
+            elif isinstance(v, list):
+                if hits and k in hits:
+                    continue
+                nv = self._list(v)
+            else:
+                continue
+            if nv is not v:
+                if out is None:
+                    out = dict(d)
+                out[k] = nv
+        return d if out is None else out
+
+    def _list(self, items: list[Any]) -> list[Any]:
+        out = None
+        for i, x in enumerate(items):
+            if isinstance(x, dict):
+                nx = self.shared(x)
+                if nx is not x:
+                    if out is None:
+                        out = list(items)
+                    out[i] = nx
+        return items if out is None else out
+
+    def copied(self, d: dict[str, Any]) -> dict[str, Any]:
+        """Redacted deep copy of dicts (and lists of dicts), sharing nothing with d."""
+        hits = self.plan(tuple(d))
+        out: dict[str, Any] = {}
+        for k, v in d.items():
+            if hits and k in hits:
+                out[k] = _redact_value(v)
+            elif isinstance(v, dict):
+                out[k] = self.copied(v)
+            elif isinstance(v, list):
+                out[k] = [self.copied(x) if isinstance(x, dict) else x for x in v]
+            else:
+                out[k] = v
+        return out
+
+
+@lru_cache(maxsize=32)
+def _rules(keys: frozenset[str]) -> _Rules:
+    return _Rules(keys)
 
 
 def redact_dict(
-    d: dict[str, Any], key_subset: frozenset[str] | None = None
+    d: dict[str, Any], key_subset: frozenset[str] | None = None, shared: bool = False
 ) -> dict[str, Any]:
-    """Copy dict with sensitive keys replaced by [REDACTED]; case-insensitive match."""
+    """
+    Copy dict with sensitive keys replaced by [REDACTED]; case-insensitive match.
+
+    shared=True (for results that are only read, e.g. serialized at once): the top-level
+    dict is still new, but nested dicts/lists with nothing sensitive are shared with d
+    instead of copied.
+    """
     keys = key_subset or REDACT_KEYS
-    norm_set = _normalized_key_set(keys)
-    return _redact_dict_impl(d, norm_set)
-
-
-def _redact_dict_impl(d: dict[str, Any], norm_set: set[str]) -> dict[str, Any]:
-    """Internal: recurse with precomputed normalized key set (avoids per-key set rebuild)."""
-    out: dict[str, Any] = {}
-    for k, v in d.items():
-        if re.sub(r"[-_\s]", "", k.lower()) in norm_set:
-            out[k] = _redact_value(v)
-        elif isinstance(v, dict):
-            out[k] = _redact_dict_impl(v, norm_set)
-        elif isinstance(v, list):
-            out[k] = [
-                _redact_dict_impl(x, norm_set) if isinstance(x, dict) else x for x in v
+    rules = _rules(keys if isinstance(keys, frozenset) else frozenset(keys))
+    if not shared:
+        return rules.copied(d)
+    out = rules.shared(d)
+    return dict(out) if out is d else out
+
+
+class RedactedView(Mapping):
+    """
+    Read-only view of d with sensitive keys reading as [REDACTED]; nothing is copied.
+
+    Redaction happens on access: d[k] and items()/values() yield [REDACTED] for sensitive
+    keys, nested dicts as RedactedView, lists with their dicts wrapped. to_dict() (used
+    when a view is serialized) is redact_dict(d). The view reflects later changes to d.
+    """
+
+    __slots__ = ("_d", "_keys", "_rules")
+
+    def __init__(self, d: Mapping[str, Any], key_subset: frozenset[str] | None = None):
+        keys = key_subset or REDACT_KEYS
+        self._d = d
+        self._keys = keys if isinstance(keys, frozenset) else frozenset(keys)
+        self._rules = _rules(self._keys)
+
+    def _wrap(self, v: Any) -> Any:
+        if isinstance(v, dict):
+            return RedactedView(v, self._keys)
+        if isinstance(v, list):
+            return [
+                RedactedView(x, self._keys) if isinstance(x, dict) else x for x in v
             ]
-        else:
-            out[k] = v
-    return out
+        return v
+
+    def __getitem__(self, key: Any) -> Any:
+        v = self._d[key]
+        if self._rules.sensitive(key):
+            return _redact_value(v)
+        return self._wrap(v)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._d)
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+    def __repr__(self) -> str:
+        return f"RedactedView({self.to_dict()!r})"
+
+    def to_dict(self, shared: bool = False) -> dict[str, Any]:
+        """Redacted plain dict (redact_dict(d, shared=shared))."""
+        d = self._d if isinstance(self._d, dict) else dict(self._d)
+        return redact_dict(d, self._keys, shared=shared)
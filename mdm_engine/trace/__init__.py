@@ -1,8 +1,28 @@
 # Decision Ecosystem — mdm-engine
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Trace: JSONL writer for PacketV2."""
+"""Trace: PacketV2 writers (JSONL / binary, background, rotating), readers and converters."""
 
+from mdm_engine.trace.binary import (
+    BinaryTraceReader,
+    binary_to_jsonl,
+    jsonl_to_binary,
+)
+from mdm_engine.trace.encoder import PacketEncoder
+from mdm_engine.trace.index import TraceReader, build_index
+from mdm_engine.trace.rotation import iter_trace, load_manifest
 from mdm_engine.trace.trace_logger import TraceLogger
+from mdm_engine.trace.writer import BackgroundWriter
 
-__all__ = ["TraceLogger"]
+__all__ = [
+    "BackgroundWriter",
+    "BinaryTraceReader",
+    "PacketEncoder",
+    "TraceLogger",
+    "TraceReader",
+    "binary_to_jsonl",
+    "build_index",
+    "iter_trace",
+    "jsonl_to_binary",
+    "load_manifest",
+]
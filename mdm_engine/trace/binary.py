@@ -0,0 +1,497 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Binary trace format: length-prefixed records, interned keys and shapes, packed numbers."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterator
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from mdm_engine.trace.encoder import PacketEncoder
+
+# File: MAGIC, then records. Record: u32 body length, body = kind byte + payload.
+#   KIND_KEY:    u16 key id + UTF-8 key (interns the next key id)
+#   KIND_SHAPE:  u16 shape id + u16 n + n * (u16 key id, code byte) (interns a dict layout)
+#   KIND_PACKET: one value (a dict)
+# Value: tag byte + payload, little-endian. TAG_SHAPED dicts: u16 shape id, then the
+# numeric fields (codes d/q/? = float64/int64/bool) packed in one block, then a tagged value
+# per "V" field; "N" fields are None and take no bytes. Dicts whose layout cannot be shaped
+# (non-str keys, full tables, ints outside int64) use TAG_MAP: u32 n + n * (u16 key id or
+# KEY_INLINE + u16 length + UTF-8 key, value). Decoded packets equal
+# json.loads(json.dumps(packet.to_dict(), default=str)).
+MAGIC = b"MDMTRC1\n"
+KIND_KEY = 0x4B  # "K"
+KIND_SHAPE = 0x53  # "S"
+KIND_PACKET = 0x50  # "P"
+KEY_INLINE = 0xFFFF
+MAX_SHAPES = 0xFFFF
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3  # int64
+TAG_FLOAT = 4  # float64
+TAG_STR = 5  # u16 length
+TAG_STR32 = 6  # u32 length
+TAG_MAP = 7  # u32 entries
+TAG_LIST = 8  # u32 items
+TAG_BIGINT = 9  # u32 length, decimal digits (outside int64)
+TAG_SHAPED = 10  # u16 shape id
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_REC = struct.Struct("<IB")
+_TAG_I64 = struct.Struct("<Bq")
+_TAG_F64 = struct.Struct("<Bd")
+_TAG_U16 = struct.Struct("<BH")
+_TAG_U32 = struct.Struct("<BI")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_CODES = {float: "d", int: "q", bool: "?", type(None): "N"}
+# encoded str values kept per encoder (repeated ids, actions, reasons)
+_STR_CACHE_MAX = 4096
+
+
+def _json_key(key: Any) -> str:
+    """Dict key as json.dumps writes it (str keys as-is; bool/None/numbers converted)."""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    return str(key)
+
+
+def _getter(idx: list[int]) -> Callable[[tuple], tuple]:
+    if len(idx) > 1:
+        return itemgetter(*idx)
+    if idx:
+        i = idx[0]
+        return lambda vals: (vals[i],)
+    return lambda vals: ()
+
+
+def _record(kind: int, payload: bytes) -> bytes:
+    return _REC.pack(len(payload) + 1, kind) + payload
+
+
+class _Shape:
+    """Decoded layout of one shape id."""
+
+    __slots__ = ("block", "flat", "keys", "n", "num_idx", "value_idx")
+
+    def __init__(self, keys: tuple[str, ...], codes: str):
+        self.keys = keys
+        self.n = len(keys)
+        self.num_idx = [i for i, c in enumerate(codes) if c in "dq?"]
+        self.value_idx = [i for i, c in enumerate(codes) if c == "V"]
+        self.block = struct.Struct("<" + "".join(c for c in codes if c in "dq?"))
+        self.flat = len(self.num_idx) == self.n
+
+
+class BinaryEncoder:
+    """
+    Encodes packet dicts as records; owns the key and shape tables of one file.
+
+    encode() returns the key/shape definitions first needed by this packet followed by the
+    packet record, so any prefix of the written stream is a readable file. Output is built in
+    one reused buffer.
+    """
+
+    def __init__(self, keys: list[str] | None = None, n_shapes: int = 0):
+        self._ids: dict[str, int] = {k: i for i, k in enumerate(keys or ())}
+        self._n_shapes = n_shapes
+        # (keys, value types) -> (TAG_SHAPED + id, block Struct, numeric getter, "V" fields)
+        self._plans: dict[tuple, tuple | None] = {}
+        self._strs: dict[str, bytes] = {}
+        self._buf = bytearray()
+        self._pending: list[bytes] = []
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self._ids)
+
+    def encode(self, packet: dict[str, Any]) -> bytes:
+        out = self._buf
+        out.clear()
+        out += b"\0\0\0\0"
+        out.append(KIND_PACKET)
+        self._value(packet, out)
+        _U32.pack_into(out, 0, len(out) - 4)
+        if not self._pending:
+            return bytes(out)
+        head = b"".join(self._pending)
+        self._pending.clear()
+        return head + out
+
+    def _key_id(self, key: str) -> int | None:
+        kid = self._ids.get(key)
+        if kid is None and len(self._ids) < KEY_INLINE:
+            kid = self._ids[key] = len(self._ids)
+            self._pending.append(_record(KIND_KEY, _U16.pack(kid) + key.encode()))
+        return kid
+
+    def _plan(self, keys: tuple, types: tuple) -> tuple | None:
+        if self._n_shapes >= MAX_SHAPES or any(type(k) is not str for k in keys):
+            return None
+        ids = [self._key_id(k) for k in keys]
+        if None in ids:
+            return None
+        codes = [_CODES.get(t, "V") for t in types]
+        sid = self._n_shapes
+        self._n_shapes += 1
+        payload = bytearray(_U16.pack(sid) + _U16.pack(len(keys)))
+        for kid, code in zip(ids, codes):
+            payload += _U16.pack(kid)
+            payload.append(ord(code))
+        self._pending.append(_record(KIND_SHAPE, bytes(payload)))
+        shape = _Shape(keys, "".join(codes))
+        # "V" fields by type: 1 = str (cached bytes), 2 = plain dict, 0 = anything else.
+        fields = [
+            (i, 1 if issubclass(types[i], str) else 2 if types[i] is dict else 0)
+            for i in shape.value_idx
+        ]
+        return (
+            _TAG_U16.pack(TAG_SHAPED, sid),
+            shape.block,
+            _getter(shape.num_idx),
+            fields,
+        )
+
+    def _str(self, v: str) -> bytes:
+        """Tagged encoding of a str value (memoized for repeated values)."""
+        enc = self._strs.get(v)
+        if enc is None:
+            raw = str.encode(v)
+            if len(raw) < 0x10000:
+                enc = _TAG_U16.pack(TAG_STR, len(raw)) + raw
+            else:
+                enc = _TAG_U32.pack(TAG_STR32, len(raw)) + raw
+            if len(self._strs) >= _STR_CACHE_MAX:
+                self._strs.clear()
+            self._strs[v] = enc
+        return enc
+
+    def _dict(self, d: dict, out: bytearray) -> None:
+        keys = tuple(d)
+        vals = tuple(d.values())
+        sig = (keys, tuple(map(type, vals)))
+        try:
+            plan = self._plans[sig]
+        except KeyError:
+            plan = self._plans[sig] = self._plan(*sig)
+        if plan is not None:
+            head, block, getter, fields = plan
+            try:
+                packed = block.pack(*getter(vals))
+            except struct.error:  # int outside int64
+                pass
+            else:
+                out += head
+                out += packed
+                for i, kind in fields:
+                    if kind == 1:
+                        out += self._strs.get(vals[i]) or self._str(vals[i])
+                    elif kind == 2:
+                        self._dict(vals[i], out)
+                    else:
+                        self._value(vals[i], out)
+                return
+        out += _TAG_U32.pack(TAG_MAP, len(d))
+        for key, item in d.items():
+            if type(key) is not str:
+                key = _json_key(key)
+            kid = self._key_id(key)
+            if kid is None:
+                raw = key.encode()
+                out += _U16.pack(KEY_INLINE)
+                out += _U16.pack(len(raw))
+                out += raw
+            else:
+                out += _U16.pack(kid)
+            self._value(item, out)
+
+    def _value(self, v: Any, out: bytearray) -> None:
+        t = type(v)
+        if t is dict:
+            self._dict(v, out)
+        elif t is float:
+            out += _TAG_F64.pack(TAG_FLOAT, v)
+        elif t is int:
+            if _INT64_MIN <= v <= _INT64_MAX:
+                out += _TAG_I64.pack(TAG_INT, v)
+            else:
+                raw = str(v).encode()
+                out += _TAG_U32.pack(TAG_BIGINT, len(raw))
+                out += raw
+        elif isinstance(v, str):  # incl. str enums (Action): JSON writes their value
+            out += self._strs.get(v) or self._str(v)
+        elif v is None:
+            out.append(TAG_NONE)
+        elif t is bool:
+            out.append(TAG_TRUE if v else TAG_FALSE)
+        elif isinstance(v, (list, tuple)):
+            out += _TAG_U32.pack(TAG_LIST, len(v))
+            for item in v:
+                self._value(item, out)
+        elif isinstance(v, dict):
+            self._dict(dict(v), out)
+        elif isinstance(v, int):
+            self._value(int(v), out)
+        elif isinstance(v, float):
+            self._value(float(v), out)
+        else:
+            self._value(str(v), out)  # json.dumps(default=str)
+
+
+class BinaryDecoder:
+    """Key and shape tables of one file; decodes packet bodies (bytes or memoryview)."""
+
+    def __init__(self):
+        self.keys: list[str] = []
+        self.shapes: list[_Shape] = []
+
+    def add_record(self, kind: int, body: Any) -> None:
+        """Apply a KIND_KEY / KIND_SHAPE record (body includes the kind byte)."""
+        if kind == KIND_KEY:
+            (kid,) = _U16.unpack_from(body, 1)
+            if kid != len(self.keys):
+                raise ValueError(f"key id {kid} out of order")
+            self.keys.append(str(body[3:], "utf-8"))
+        elif kind == KIND_SHAPE:
+            sid, n = _U16.unpack_from(body, 1)[0], _U16.unpack_from(body, 3)[0]
+            if sid != len(self.shapes):
+                raise ValueError(f"shape id {sid} out of order")
+            keys, codes = [], []
+            for j in range(n):
+                (kid,) = _U16.unpack_from(body, 5 + 3 * j)
+                keys.append(self.keys[kid])
+                codes.append(chr(body[7 + 3 * j]))
+            self.shapes.append(_Shape(tuple(keys), "".join(codes)))
+
+    def packet(self, body: Any) -> dict[str, Any]:
+        """Decode one KIND_PACKET record body (kind byte included)."""
+        if body[0] != KIND_PACKET:
+            raise ValueError("not a packet record")
+        return self._decode(body, 1)[0]
+
+    def _decode(self, buf: Any, pos: int) -> tuple[Any, int]:
+        tag = buf[pos]
+        pos += 1
+        if tag == TAG_SHAPED:
+            shape = self.shapes[_U16.unpack_from(buf, pos)[0]]
+            pos += 2
+            nums = shape.block.unpack_from(buf, pos)
+            pos += shape.block.size
+            if shape.flat:
+                return dict(zip(shape.keys, nums)), pos
+            vals: list[Any] = [None] * shape.n
+            for i, x in zip(shape.num_idx, nums):
+                vals[i] = x
+            for i in shape.value_idx:
+                # Inline the common "V" fields: short strings and all-numeric dicts.
+                tag = buf[pos]
+                if tag == TAG_STR:
+                    end = pos + 3 + (buf[pos + 1] | buf[pos + 2] << 8)
+                    vals[i] = str(buf[pos + 3 : end], "utf-8")
+                    pos = end
+                    continue
+                if tag == TAG_SHAPED:
+                    sub = self.shapes[buf[pos + 1] | buf[pos + 2] << 8]
+                    if sub.flat:
+                        vals[i] = dict(
+                            zip(sub.keys, sub.block.unpack_from(buf, pos + 3))
+                        )
+                        pos += 3 + sub.block.size
+                        continue
+                vals[i], pos = self._decode(buf, pos)
+            return dict(zip(shape.keys, vals)), pos
+        if tag == TAG_STR:
+            (n,) = _U16.unpack_from(buf, pos)
+            pos += 2
+            return str(buf[pos : pos + n], "utf-8"), pos + n
+        if tag == TAG_FLOAT:
+            return _F64.unpack_from(buf, pos)[0], pos + 8
+        if tag == TAG_INT:
+            return _I64.unpack_from(buf, pos)[0], pos + 8
+        if tag == TAG_LIST:
+            (n,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            items = []
+            for _ in range(n):
+                item, pos = self._decode(buf, pos)
+                items.append(item)
+            return items, pos
+        if tag == TAG_NONE:
+            return None, pos
+        if tag == TAG_TRUE:
+            return True, pos
+        if tag == TAG_FALSE:
+            return False, pos
+        if tag == TAG_MAP:
+            (n,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            out: dict[str, Any] = {}
+            for _ in range(n):
+                (kid,) = _U16.unpack_from(buf, pos)
+                pos += 2
+                if kid == KEY_INLINE:
+                    (klen,) = _U16.unpack_from(buf, pos)
+                    key = str(buf[pos + 2 : pos + 2 + klen], "utf-8")
+                    pos += 2 + klen
+                else:
+                    key = self.keys[kid]
+                out[key], pos = self._decode(buf, pos)
+            return out, pos
+        if tag in (TAG_STR32, TAG_BIGINT):
+            (n,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            text = str(buf[pos : pos + n], "utf-8")
+            return (int(text) if tag == TAG_BIGINT else text), pos + n
+        raise ValueError(f"Unknown value tag {tag} at offset {pos - 1}")
+
+
+class BinaryTraceReader:
+    """
+    Memory-mapped reader for a binary trace file.
+
+    records() yields (offset, body) with body a memoryview into the map (no copy); iterating
+    the reader yields decoded packet dicts. A truncated final record (crash mid-write) is
+    ignored; after a full pass end_offset is the end of the last complete record.
+    Release views before close().
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")  # noqa: SIM115 - kept open for the map, closed in close()
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+        self._view = memoryview(self._map) if self._map is not None else memoryview(b"")
+        if size and self._view[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a binary trace file")
+        self.decoder = BinaryDecoder()
+        self.end_offset = len(MAGIC) if size else 0
+
+    @property
+    def keys(self) -> list[str]:
+        return self.decoder.keys
+
+    def _scan(self) -> Iterator[tuple[int, memoryview]]:
+        """(offset, body) of every packet record; key/shape records update the decoder."""
+        view = self._view
+        pos, end = len(MAGIC), len(view)
+        self.decoder = decoder = BinaryDecoder()
+        while pos + _REC.size <= end:
+            n, kind = _REC.unpack_from(view, pos)
+            if pos + 4 + n > end:
+                break
+            body = view[pos + 4 : pos + 4 + n]
+            if kind == KIND_PACKET:
+                yield pos, body
+            else:
+                decoder.add_record(kind, body)
+            pos += 4 + n
+        self.end_offset = pos
+
+    def records(self) -> Iterator[tuple[int, memoryview]]:
+        """(file offset, packet body) per packet (tables grow as records pass)."""
+        return self._scan()
+
+    def load_tables(self) -> BinaryDecoder:
+        """Read all key/shape definitions (skips packet bodies)."""
+        for _ in self._scan():
+            pass
+        return self.decoder
+
+    def decode(self, body: memoryview) -> dict[str, Any]:
+        return self.decoder.packet(body)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for _, body in self._scan():
+            yield self.decoder.packet(body)
+
+    def close(self) -> None:
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def iter_binary_stream(f: BinaryIO) -> Iterator[dict[str, Any]]:
+    """Decoded packets from a readable binary stream (e.g. gzip/lzma); torn tail ignored."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a binary trace stream")
+    decoder = BinaryDecoder()
+    while True:
+        head = f.read(_U32.size)
+        if len(head) < _U32.size:
+            return
+        (n,) = _U32.unpack(head)
+        body = f.read(n)
+        if len(body) < n:
+            return
+        if body[0] == KIND_PACKET:
+            yield decoder.packet(body)
+        else:
+            decoder.add_record(body[0], body)
+
+
+def open_binary_for_append(path: Path) -> tuple[BinaryIO, BinaryEncoder]:
+    """
+    Open (or create) a binary trace for appending; the encoder continues its tables.
+
+    A torn final record (crash mid-write) is truncated first, so appended records stay
+    readable.
+    """
+    encoder = BinaryEncoder()
+    if path.exists() and path.stat().st_size:
+        with BinaryTraceReader(path) as reader:
+            tables = reader.load_tables()
+            encoder = BinaryEncoder(tables.keys, len(tables.shapes))
+            end = reader.end_offset
+        if end < path.stat().st_size:
+            os.truncate(path, end)
+    f = open(path, "ab")  # noqa: SIM115 - returned to the caller, who closes it
+    if f.tell() == 0:
+        f.write(MAGIC)
+    return f, encoder
+
+
+def jsonl_to_binary(src: Path | str, dst: Path | str) -> int:
+    """Convert traces.jsonl to the binary format (dst is replaced); returns packets written."""
+    encoder = BinaryEncoder()
+    count = 0
+    with open(src, encoding="utf-8") as fin, open(dst, "wb") as fout:
+        fout.write(MAGIC)
+        for line in fin:
+            if line.strip():
+                fout.write(encoder.encode(json.loads(line)))
+                count += 1
+    return count
+
+
+def binary_to_jsonl(src: Path | str, dst: Path | str) -> int:
+    """Convert a binary trace to JSONL (same lines TraceLogger writes); returns packets."""
+    count = 0
+    encoder = PacketEncoder()
+    with BinaryTraceReader(src) as reader, open(dst, "w", encoding="utf-8") as fout:
+        for packet in reader:
+            fout.write(encoder.encode_value(packet) + "\n")
+            count += 1
+    return count
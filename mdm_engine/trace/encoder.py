@@ -0,0 +1,51 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""PacketV2 JSON encoder: same bytes as json.dumps(packet.to_dict(), default=str), less work."""
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+from typing import Any
+
+_ENUM_CACHE_MAX = 1024
+
+
+class PacketEncoder:
+    """
+    Encodes PacketV2 (or any object with to_dict()) to JSON text.
+
+    json.dumps(obj, default=str) builds a JSONEncoder per call; this keeps one
+    json.JSONEncoder per instance and reuses it. to_dict() is encoded in a single C pass:
+    floats, ints and str-valued enums such as Action stay on the C fast paths, and plain
+    enums that reach default=str are formatted once per member. (Writing the top-level
+    fields from Python with cached key fragments measured slower than one C pass over the
+    to_dict() dict, so keys are left to the encoder.)
+
+    Output is byte-identical to json.dumps(packet.to_dict(), default=str). Not
+    thread-safe: use one instance per writer thread.
+    """
+
+    def __init__(self):
+        self._enums: dict[Enum, str] = {}
+        self._encoder = json.JSONEncoder(default=self._default)
+
+    def _default(self, o: Any) -> str:
+        if isinstance(o, Enum):
+            s = self._enums.get(o)
+            if s is None:
+                s = str(o)
+                if len(self._enums) < _ENUM_CACHE_MAX:
+                    self._enums[o] = s
+            return s
+        return str(o)
+
+    def encode_value(self, obj: Any) -> str:
+        """json.dumps(obj, default=str) with the reused encoder."""
+        return self._encoder.encode(obj)
+
+    def encode(self, packet: Any, newline: bool = False) -> str:
+        """JSON text of packet (plus "\\n" if newline)."""
+        text = self.encode_value(packet.to_dict())
+        return text + "\n" if newline else text
@@ -0,0 +1,203 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Sidecar index for traces.jsonl: byte offset per step, random access by step / range / action."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+
+# <trace>.idx: INDEX_MAGIC, then one fixed 32-byte row per packet, in file order:
+#   step (int64), offset (uint64), length incl. "\n" (uint32), final action (12 bytes, ASCII)
+INDEX_MAGIC = b"MDMIDX1\n"
+INDEX_DTYPE = np.dtype(
+    [("step", "<i8"), ("offset", "<u8"), ("length", "<u4"), ("action", "S12")]
+)
+_ROW = struct.Struct("<qQI12s")
+_loads = json.JSONDecoder().decode
+
+
+def index_path(trace_path: Path | str) -> Path:
+    trace_path = Path(trace_path)
+    return trace_path.with_name(trace_path.name + ".idx")
+
+
+def action_key(final_action: Any) -> bytes:
+    """Index key of a packet's final action (dict or object with .action; enum value)."""
+    if type(final_action) is dict or isinstance(final_action, Mapping):
+        action = final_action.get("action")
+    else:
+        action = getattr(final_action, "action", None)
+    if action is None:
+        return b""
+    return str(getattr(action, "value", action)).encode("ascii", "replace")[:12]
+
+
+class TraceIndexWriter:
+    """Appends index rows as packets are written (buffered; flush() with the trace)."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._file: BinaryIO = open(self.path, "ab")  # noqa: SIM115 - closed in close()
+        if self._file.tell() == 0:
+            self._file.write(INDEX_MAGIC)
+
+    def append(self, step: int, offset: int, length: int, action: bytes) -> None:
+        self._file.write(_ROW.pack(step, offset, length, action))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def load_index(path: Path | str) -> np.ndarray:
+    """Index rows as a structured array (INDEX_DTYPE); a torn final row is ignored."""
+    path = Path(path)
+    with open(path, "rb") as f:
+        if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            raise ValueError(f"{path} is not a trace index")
+        n = (os.fstat(f.fileno()).st_size - len(INDEX_MAGIC)) // INDEX_DTYPE.itemsize
+        return np.fromfile(f, dtype=INDEX_DTYPE, count=n)
+
+
+def _scan_jsonl(trace_path: Path) -> Iterator[tuple[int, int, int, bytes]]:
+    """(step, offset, length, action) per complete line, in one streaming pass."""
+    offset = 0
+    with open(trace_path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                return  # torn tail
+            if line.strip():
+                packet = _loads(line.decode("utf-8"))
+                yield (
+                    packet["step"],
+                    offset,
+                    len(line),
+                    action_key(packet.get("final_action")),
+                )
+            offset += len(line)
+
+
+def build_index(trace_path: Path | str, path: Path | str | None = None) -> int:
+    """Build (or rebuild) the sidecar index of an existing traces.jsonl; returns rows."""
+    trace_path = Path(trace_path)
+    path = Path(path) if path is not None else index_path(trace_path)
+    tmp = path.with_name(path.name + ".tmp")
+    count = 0
+    with open(tmp, "wb") as f:
+        f.write(INDEX_MAGIC)
+        for row in _scan_jsonl(trace_path):
+            f.write(_ROW.pack(*row))
+            count += 1
+    os.replace(tmp, path)
+    return count
+
+
+def index_is_current(trace_path: Path | str, path: Path | str | None = None) -> bool:
+    """True if the index exists and its last row ends where the trace file ends."""
+    trace_path = Path(trace_path)
+    path = Path(path) if path is not None else index_path(trace_path)
+    size = trace_path.stat().st_size if trace_path.exists() else 0
+    if not path.exists():
+        return size == 0
+    try:
+        rows = load_index(path)
+    except ValueError:
+        return False
+    end = int(rows["offset"][-1] + rows["length"][-1]) if len(rows) else 0
+    return end == size
+
+
+class TraceReader:
+    """
+    Random access into traces.jsonl through its sidecar index (<trace>.idx; built in one
+    streaming pass when missing, rebuilt with build_index). get(step), range(start, stop)
+    and by_action(action) read only the matching lines; offsets(action) returns their byte
+    offsets. The trace is memory-mapped at open; rows past its end are ignored, and lines
+    a live logger has not indexed yet are not visible.
+    """
+
+    def __init__(self, trace_path: Path | str):
+        self.path = Path(trace_path)
+        self.index_path = index_path(self.path)
+        if not self.index_path.exists():
+            build_index(self.path, self.index_path)
+        self._file = open(self.path, "rb")  # noqa: SIM115 - kept open for the map, closed in close()
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+        rows = load_index(self.index_path)
+        self.rows = rows[rows["offset"] + rows["length"] <= size]
+        self.steps = self.rows["step"]
+        self._sorted = bool(np.all(self.steps[1:] > self.steps[:-1]))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _read(self, i: int) -> dict[str, Any]:
+        off = int(self.rows["offset"][i])
+        return json.loads(self._map[off : off + int(self.rows["length"][i])])
+
+    def _read_all(self, idx: np.ndarray) -> Iterator[dict[str, Any]]:
+        for i in idx:
+            yield self._read(int(i))
+
+    def get(self, step: int) -> dict[str, Any]:
+        """Packet of this step (first one if steps repeat); KeyError if absent."""
+        if self._sorted:
+            i = int(np.searchsorted(self.steps, step))
+            if i < len(self.steps) and self.steps[i] == step:
+                return self._read(i)
+        else:
+            hits = np.flatnonzero(self.steps == step)
+            if len(hits):
+                return self._read(int(hits[0]))
+        raise KeyError(step)
+
+    def range(self, start: int, stop: int) -> Iterator[dict[str, Any]]:
+        """Packets with start <= step < stop, in file order."""
+        if self._sorted:
+            lo, hi = np.searchsorted(self.steps, [start, stop])
+            return self._read_all(np.arange(lo, hi))
+        return self._read_all(
+            np.flatnonzero((self.steps >= start) & (self.steps < stop))
+        )
+
+    def offsets(self, action: Any = None) -> np.ndarray:
+        """Byte offsets of every packet, or of those whose final action is action."""
+        if action is None:
+            return self.rows["offset"]
+        return self.rows["offset"][
+            self.rows["action"] == action_key({"action": action})
+        ]
+
+    def by_action(self, action: Any) -> Iterator[dict[str, Any]]:
+        """Packets whose final action is action (Action or its value), in file order."""
+        return self._read_all(
+            np.flatnonzero(self.rows["action"] == action_key({"action": action}))
+        )
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self._read_all(np.arange(len(self.rows)))
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,256 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Trace rotation: numbered segments, background compression, manifest, cross-segment reads."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import lzma
+import os
+import re
+import shutil
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+
+from mdm_engine.trace.binary import BinaryTraceReader, iter_binary_stream
+
+# Completed segments: <stem>.<index>.<ext> -> <stem>.<index>.<ext><suffix>
+COMPRESSIONS: dict[str, tuple[str, Callable[..., IO]]] = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+}
+_OPENERS = {suffix: opener for suffix, opener in COMPRESSIONS.values()}
+_COPY_CHUNK = 1 << 20
+
+
+def manifest_path(run_dir: Path | str, stem: str = "traces") -> Path:
+    return Path(run_dir) / f"{stem}.manifest.json"
+
+
+def load_manifest(run_dir: Path | str, stem: str = "traces") -> dict[str, Any]:
+    """Manifest of a rotated trace ({"segments": []} when there is none)."""
+    path = manifest_path(run_dir, stem)
+    if not path.exists():
+        return {"segments": []}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class SegmentedFile:
+    """
+    File-like sink (write/flush/fileno/close) that rolls over to a new numbered segment
+    <stem>.<index:06d><ext> once the current one holds rotate_bytes, or rotate_seconds
+    after it was opened. Rotation happens between write() calls, so a record (or a
+    BackgroundWriter group) never spans two segments. open_segment(path) opens each
+    segment for appending (and may reset per-file state such as a binary encoder).
+
+    Completed segments are listed in <stem>.manifest.json with first/last step, record
+    count, raw bytes and stored bytes; with compress="gzip"|"lzma" a worker thread then
+    replaces each with a compressed copy and updates its entry. Callers report the step
+    of each record with note(step) before writing it. Reopening a run dir continues the
+    numbering after the manifest's last segment.
+
+    fsync=True fsyncs each segment before it is closed: rotation happens inside write(),
+    so the writer's own fsync after that write would land on the next segment.
+    """
+
+    def __init__(
+        self,
+        run_dir: Path,
+        stem: str,
+        ext: str,
+        open_segment: Callable[[Path], IO],
+        rotate_bytes: int | None = None,
+        rotate_seconds: float | None = None,
+        compress: str | None = None,
+        fsync: bool = False,
+    ):
+        if rotate_bytes is None and rotate_seconds is None:
+            raise ValueError("rotate_bytes or rotate_seconds is required")
+        if (rotate_bytes is not None and rotate_bytes <= 0) or (
+            rotate_seconds is not None and rotate_seconds <= 0
+        ):
+            raise ValueError("rotate_bytes and rotate_seconds must be positive")
+        if compress is not None and compress not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compress!r}")
+        self.run_dir = Path(run_dir)
+        self.stem = stem
+        self.ext = ext
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.compress = compress
+        self.fsync = fsync
+        self.manifest_path = manifest_path(self.run_dir, stem)
+        self._open_segment = open_segment
+        self._lock = threading.Lock()
+        self._manifest = load_manifest(self.run_dir, stem)
+        on_disk = [index for index, _ in _segment_files(self.run_dir, stem)]
+        listed = [seg["index"] for seg in self._manifest["segments"]]
+        self.index = max(on_disk + listed, default=-1)
+        self._pool = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-compress")
+            if compress
+            else None
+        )
+        self._pending: list[Future] = []
+        self._file: IO | None = None
+        self._open_next()
+
+    def _open_next(self) -> None:
+        self.index += 1
+        self.path = self.run_dir / f"{self.stem}.{self.index:06d}{self.ext}"
+        self._file = self._open_segment(self.path)
+        self._opened = time.monotonic()
+        self._bytes = self._file.tell()
+        self._first_step: int | None = None
+        self._last_step: int | None = None
+        self._records = 0
+
+    def note(self, step: int) -> None:
+        """Record that the next write() holds the packet of this step."""
+        if self._first_step is None:
+            self._first_step = step
+        self._last_step = step
+        self._records += 1
+
+    def write(self, data: str | bytes) -> int:
+        n = self._file.write(data)
+        # Trace JSONL is ASCII (json.dumps ensure_ascii), so characters == bytes.
+        self._bytes += len(data)
+        if (self.rotate_bytes is not None and self._bytes >= self.rotate_bytes) or (
+            self.rotate_seconds is not None
+            and time.monotonic() - self._opened >= self.rotate_seconds
+        ):
+            self.rotate()
+        return n
+
+    def rotate(self) -> None:
+        """Complete the current segment and start the next one."""
+        self._finish()
+        self._open_next()
+
+    def _finish(self) -> None:
+        if self.fsync:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._file.close()
+        if not self._records:
+            self.path.unlink()
+            return
+        entry = {
+            "index": self.index,
+            "file": self.path.name,
+            "first_step": self._first_step,
+            "last_step": self._last_step,
+            "records": self._records,
+            "bytes": self._bytes,
+            "stored_bytes": self._bytes,
+        }
+        with self._lock:
+            self._manifest["segments"].append(entry)
+            self._write_manifest()
+        if self._pool is not None:
+            self._pending = [f for f in self._pending if not f.done() or f.exception()]
+            self._pending.append(self._pool.submit(self._compress, entry))
+
+    def _compress(self, entry: dict[str, Any]) -> None:
+        suffix, opener = COMPRESSIONS[self.compress]
+        src = self.run_dir / entry["file"]
+        dst = src.with_name(src.name + suffix)
+        tmp = dst.with_name(dst.name + ".tmp")
+        with open(src, "rb") as fin, opener(tmp, "wb") as fout:
+            shutil.copyfileobj(fin, fout, _COPY_CHUNK)
+        os.replace(tmp, dst)
+        with self._lock:
+            entry["file"] = dst.name
+            entry["stored_bytes"] = dst.stat().st_size
+            self._write_manifest()
+        src.unlink()
+
+    def _write_manifest(self) -> None:
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp.write_text(json.dumps(self._manifest, indent=1), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def close(self) -> None:
+        """Complete the last segment and wait for pending compression."""
+        if self._file is None:
+            return
+        self._finish()
+        self._file = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            for future in self._pending:
+                future.result()
+
+
+_SEGMENT_RE = r"^{stem}\.(\d+)\.(jsonl|bin)(\.gz|\.xz)?$"
+
+
+def _segment_files(run_dir: Path, stem: str) -> list[tuple[int, Path]]:
+    """(index, path) of segment files on disk, one per index, by index."""
+    pattern = re.compile(_SEGMENT_RE.format(stem=re.escape(stem)))
+    found: dict[int, Path] = {}
+    for path in run_dir.glob(f"{stem}.*"):
+        m = pattern.match(path.name)
+        if m:
+            # A compressed copy appears only once complete (renamed from .tmp).
+            index = int(m.group(1))
+            if index not in found or m.group(3):
+                found[index] = path
+    return sorted(found.items())
+
+
+def segment_paths(run_dir: Path | str, stem: str = "traces") -> list[Path]:
+    """Trace files of a run in write order: the unrotated file (if any), then segments."""
+    run_dir = Path(run_dir)
+    paths = [
+        run_dir / f"{stem}{ext}"
+        for ext in (".jsonl", ".bin")
+        if (run_dir / f"{stem}{ext}").exists()
+    ]
+    return paths + [path for _, path in _segment_files(run_dir, stem)]
+
+
+def iter_trace_file(path: Path | str) -> Iterator[dict[str, Any]]:
+    """Packets of one trace file: JSONL or binary, plain or compressed; torn tail ignored."""
+    path = Path(path)
+    opener = _OPENERS.get(path.suffix)
+    base = path.with_suffix("") if opener else path
+    if base.suffix == ".bin":
+        if opener is None:
+            with BinaryTraceReader(path) as reader:
+                yield from reader
+        else:
+            with opener(path, "rb") as f:
+                yield from iter_binary_stream(f)
+        return
+    with (opener or open)(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                return
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_trace(run_dir: Path | str, stem: str = "traces") -> Iterator[dict[str, Any]]:
+    """Stream every packet of a run across all its files and segments, in order."""
+    for path in segment_paths(run_dir, stem):
+        if not path.exists():  # compressed (and removed) since it was listed
+            path = next(
+                path.with_name(path.name + suffix)
+                for suffix in _OPENERS
+                if path.with_name(path.name + suffix).exists()
+            )
+        yield from iter_trace_file(path)
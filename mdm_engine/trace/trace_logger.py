@@ -1,55 +1,213 @@
 # Decision Ecosystem — mdm-engine
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""JSONL writer for PacketV2; path = ./runs/<run_id>/traces.jsonl."""
+"""Trace writer for PacketV2; path = ./runs/<run_id>/traces.jsonl (or traces.bin)."""
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from decision_schema.packet_v2 import PacketV2
 
+from mdm_engine.background_writer import BackgroundWriter
+from mdm_engine.security.redaction import RedactedView, redact_dict
+from mdm_engine.trace.binary import open_binary_for_append
+from mdm_engine.trace.encoder import PacketEncoder
+from mdm_engine.trace.index import (
+    TraceIndexWriter,
+    action_key,
+    build_index,
+    index_is_current,
+    index_path,
+)
+from mdm_engine.trace.rotation import SegmentedFile
+
+TRACE_FORMATS = ("jsonl", "binary")
+REDACT_FIELDS = ("input", "external")
+
 
 class TraceLogger:
     """
-    Append PacketV2 as JSONL (input/external must be pre-redacted).
+    Append PacketV2 as JSONL (input/external must be pre-redacted, unless redact=True).
 
     Performance: Flushes every N writes (default: every write for safety, set flush_every_n for batch).
+    format="binary" writes traces.bin instead (see trace.binary: smaller, cheaper numbers;
+    read with BinaryTraceReader, convert with binary_to_jsonl / jsonl_to_binary).
+
+    background=True moves serialization and I/O to a BackgroundWriter thread (group
+    commit; see trace.writer). write() then only enqueues the packet, so packets must not
+    be mutated after write(); flush_every_n is replaced by the durability policy.
+
+    rotate_bytes / rotate_seconds split the trace into numbered segments
+    (traces.000000.jsonl, ...) listed in traces.manifest.json; compress="gzip"|"lzma"
+    compresses completed segments in a worker thread (see trace.rotation; read a run
+    back with iter_trace). path is then the manifest.
+
+    index=True (JSONL, unrotated) appends a sidecar traces.jsonl.idx row per packet (step,
+    byte offset, final action) for TraceReader; an existing trace without a current index
+    is indexed first. Index rows reach disk on flush() / close() (or every flush_every_n).
+
+    redact=True applies redact_dict to input/external as each packet is serialized (on the
+    writer thread with background=True), so callers may pass raw dicts and no unredacted
+    value is written. RedactedView values are written as their to_dict() either way.
     """
 
-    def __init__(self, run_dir: Path, flush_every_n: int = 1):
+    def __init__(
+        self,
+        run_dir: Path,
+        flush_every_n: int = 1,
+        format: str = "jsonl",
+        background: bool = False,
+        queue_size: int = 10_000,
+        max_batch: int = 1024,
+        durability: str = "flush",
+        backpressure: str = "block",
+        rotate_bytes: int | None = None,
+        rotate_seconds: float | None = None,
+        compress: str | None = None,
+        index: bool = False,
+        redact: bool = False,
+    ):
         """
         Initialize trace logger.
 
         Args:
             run_dir: Directory for traces.jsonl
             flush_every_n: Flush every N writes (1 = flush every write, higher = batch flush)
+            format: "jsonl" (traces.jsonl) or "binary" (traces.bin)
+            background: Write on a background thread (group commit)
+            queue_size, max_batch, durability, backpressure: BackgroundWriter settings
+            rotate_bytes, rotate_seconds: Start a new segment at this size / segment age
+            compress: "gzip" or "lzma" for completed segments (requires rotation)
+            index: Maintain the sidecar step/action index (see trace.index)
+            redact: Redact input/external at serialization time (see security.redaction)
         """
+        if format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {format!r}")
         self.run_dir = Path(run_dir)
         self.run_dir.mkdir(parents=True, exist_ok=True)
-        self.path = self.run_dir / "traces.jsonl"
-        self._file = open(self.path, "a", encoding="utf-8")
+        self.format = format
+        self.redact = redact
+        self._encoder = None
+        self._json = PacketEncoder()
+        self._segments = None
+        self._index = None
+        ext = ".bin" if format == "binary" else ".jsonl"
+        if index and (format != "jsonl" or rotate_bytes or rotate_seconds):
+            raise ValueError("index requires format='jsonl' without rotation")
+        if rotate_bytes is not None or rotate_seconds is not None:
+            self._file = self._segments = SegmentedFile(
+                self.run_dir,
+                "traces",
+                ext,
+                self._open_file,
+                rotate_bytes=rotate_bytes,
+                rotate_seconds=rotate_seconds,
+                compress=compress,
+                fsync=durability == "fsync",
+            )
+            self.path = self._segments.manifest_path
+        elif compress is not None:
+            raise ValueError("compress requires rotate_bytes or rotate_seconds")
+        else:
+            self.path = self.run_dir / f"traces{ext}"
+            self._file = self._open_file(self.path)
+        if index:
+            if not index_is_current(self.path):
+                build_index(self.path)
+            self._index = TraceIndexWriter(index_path(self.path))
+            self._offset = self.path.stat().st_size
         self._flush_every_n = flush_every_n
         self._write_count = 0
+        self._written = 0
+        self.background = background
+        self._writer = None
+        if background:
+            self._writer = BackgroundWriter(
+                self._file,
+                self._encode,
+                maxsize=queue_size,
+                max_batch=max_batch,
+                durability=durability,
+                backpressure=backpressure,
+            )
+
+    def _open_file(self, path: Path):
+        if self.format == "binary":
+            f, self._encoder = open_binary_for_append(path)
+            return f
+        return open(path, "a", encoding="utf-8")
+
+    def _packet_dict(self, packet: PacketV2) -> dict:
+        """packet.to_dict() with input/external redacted (redact=True) and views resolved."""
+        d = packet.to_dict()
+        out = None
+        for field in REDACT_FIELDS:
+            v = d.get(field)
+            # Shared mode: the result is only serialized, never kept or mutated.
+            if isinstance(v, RedactedView):
+                v = v.to_dict(shared=True)
+            elif self.redact and isinstance(v, dict):
+                v = redact_dict(v, shared=True)
+            else:
+                continue
+            if out is None:
+                out = dict(d)
+            out[field] = v
+        return d if out is None else out
+
+    def _encode(self, packet: PacketV2) -> str | bytes:
+        d = self._packet_dict(packet)
+        if self._encoder is not None:
+            data = self._encoder.encode(d)
+        else:
+            data = self._json.encode_value(d) + "\n"
+        if self._segments is not None:
+            self._segments.note(packet.step)
+        if self._index is not None:
+            # JSON is ASCII (ensure_ascii), so len(data) is the byte length.
+            self._index.append(
+                packet.step, self._offset, len(data), action_key(packet.final_action)
+            )
+            self._offset += len(data)
+        return data
 
     def write(self, packet: PacketV2) -> None:
-        """Write packet to JSONL (flush based on flush_every_n)."""
-        line = json.dumps(packet.to_dict(), default=str) + "\n"
-        self._file.write(line)
+        """Write packet (flush based on flush_every_n); enqueue only if background."""
+        if self._writer is not None:
+            self._writer.put(packet)
+            return
+        self._file.write(self._encode(packet))
+        self._written += 1
         self._write_count += 1
         if self._write_count >= self._flush_every_n:
-            self._file.flush()
+            self.flush()
             self._write_count = 0
 
     def flush(self) -> None:
-        """Force flush buffer."""
-        self._file.flush()
+        """Force flush buffer (background: wait until queued packets are written)."""
+        if self._writer is not None:
+            self._writer.flush()
+        else:
+            self._file.flush()
+        if self._index is not None:
+            self._index.flush()
 
     def close(self) -> None:
-        """Close file (flushes before closing)."""
-        self.flush()
-        self._file.close()
+        """Close file (flushes before closing; background: drains the queue first)."""
+        if self._writer is not None:
+            self._writer.close()
+        else:
+            self._file.flush()
+            self._file.close()
+        if self._index is not None:
+            self._index.close()
+
+    def stats(self) -> dict:
+        """Writer counters (background: queue depth, drops, group commit latency)."""
+        if self._writer is not None:
+            return self._writer.stats()
+        return {"written": self._written}
 
     def __enter__(self):
         """Context manager entry."""
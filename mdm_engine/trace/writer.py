@@ -0,0 +1,8 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Background trace writer (re-export; implementation in mdm_engine.background_writer)."""
+
+from mdm_engine.background_writer import BACKPRESSURE, DURABILITY, BackgroundWriter
+
+__all__ = ["BACKPRESSURE", "DURABILITY", "BackgroundWriter"]
@@ -0,0 +1,32 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Shared test fixtures."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.types import Action
+
+
+def _make_packet(step: int, **fields: Any) -> PacketV2:
+    values: dict[str, Any] = {
+        "run_id": "r1",
+        "step": step,
+        "input": {"ts_ms": 1_700_000_000_000 + step, "x": 0.1 * step},
+        "external": {},
+        "mdm": {"action": Action.ACT, "confidence": 0.75},
+        "final_action": {"action": Action.HOLD, "allowed": True},
+        "latency_ms": step,
+        "mismatch": None,
+    }
+    values.update(fields)
+    return PacketV2(**values)
+
+
+@pytest.fixture
+def make_packet() -> Callable[..., PacketV2]:
+    """make_packet(step, **fields): PacketV2 with defaults for trace tests; fields override."""
+    return _make_packet
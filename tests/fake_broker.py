@@ -0,0 +1,110 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Test helper: in-process fake AsyncBroker with configurable latency."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import Any
+
+from mdm_engine.adapters.base import AsyncBroker, OrderRequest
+
+
+class FakeLatencyBroker(AsyncBroker):
+    """
+    Accepts every call after latency_ms (asyncio.sleep; no fills). Records calls in order and
+    tracks peak in-flight calls, so overlap is observable. Bulk calls cost one round-trip
+    (bulk=False: per-order fallback).
+
+    Wrap in AsyncToSyncBroker for a sync Broker with the same latency.
+    """
+
+    supports_replace = True
+    supports_bulk = True
+
+    def __init__(self, latency_ms: float = 1.0, bulk: bool = True):
+        self.latency_ms = latency_ms
+        self.supports_bulk = bulk
+        self.calls: list[tuple[Any, ...]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._ids = itertools.count(1)
+        self.open_orders: dict[str, tuple[str, str, float, float]] = {}
+
+    async def _roundtrip(self, *call: Any) -> None:
+        self.calls.append(call)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency_ms / 1000.0)
+        finally:
+            self.in_flight -= 1
+
+    async def get_state(self) -> dict[str, Any]:
+        await self._roundtrip("get_state")
+        return {"open_orders": len(self.open_orders)}
+
+    async def submit_order(
+        self,
+        market_id: str,
+        side: str,
+        price: float,
+        size_usd: float,
+        post_only: bool,
+    ) -> dict[str, Any]:
+        await self._roundtrip("submit_order", market_id, side, price, size_usd)
+        order_id = f"fake-{next(self._ids)}"
+        self.open_orders[order_id] = (market_id, side, price, size_usd)
+        return {"order_id": order_id, "filled": False}
+
+    async def replace_order(
+        self, order_id: str, price: float, size_usd: float
+    ) -> dict[str, Any]:
+        await self._roundtrip("replace_order", order_id, price, size_usd)
+        order = self.open_orders.get(order_id)
+        if order is None:
+            return {"order_id": order_id, "error": "unknown_order"}
+        self.open_orders[order_id] = (order[0], order[1], price, size_usd)
+        return {"order_id": order_id, "filled": False}
+
+    async def cancel_order(self, order_id: str) -> bool:
+        await self._roundtrip("cancel_order", order_id)
+        return self.open_orders.pop(order_id, None) is not None
+
+    async def submit_orders(self, orders: list[OrderRequest]) -> list[dict[str, Any]]:
+        if not self.supports_bulk:
+            return await super().submit_orders(orders)
+        await self._roundtrip("submit_orders", len(orders))
+        results = []
+        for o in orders:
+            order_id = f"fake-{next(self._ids)}"
+            self.open_orders[order_id] = (o.market_id, o.side, o.price, o.size_usd)
+            results.append({"order_id": order_id, "filled": False})
+        return results
+
+    async def cancel_orders(self, order_ids: list[str]) -> list[bool]:
+        if not self.supports_bulk:
+            return await super().cancel_orders(order_ids)
+        await self._roundtrip("cancel_orders", len(order_ids))
+        return [self.open_orders.pop(i, None) is not None for i in order_ids]
+
+    async def cancel_all(self, market_id: str | None = None) -> int:
+        await self._roundtrip("cancel_all", market_id)
+        ids = [
+            k
+            for k, v in self.open_orders.items()
+            if market_id is None or v[0] == market_id
+        ]
+        for order_id in ids:
+            del self.open_orders[order_id]
+        return len(ids)
+
+    async def process_fills(self, now_ms: int) -> list[dict[str, Any]]:
+        await self._roundtrip("process_fills", now_ms)
+        return []
+
+    async def flatten_position(self, market_id: str, mid: float | None = None) -> float:
+        await self._roundtrip("flatten_position", market_id, mid)
+        return 0.0
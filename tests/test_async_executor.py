@@ -0,0 +1,77 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""AsyncExecutor: concurrent legs; bulk submit; sync <-> async broker bridges."""
+
+import asyncio
+from types import SimpleNamespace
+
+from decision_schema.types import Action
+from fake_broker import FakeLatencyBroker
+
+from mdm_engine.adapters.bridge import AsyncToSyncBroker, SyncToAsyncBroker
+from mdm_engine.execution.async_executor import AsyncExecutor
+from mdm_engine.execution.executor import Executor
+
+LATENCY_MS = 50.0
+
+
+def _act() -> SimpleNamespace:
+    return SimpleNamespace(
+        action=Action.ACT, bid_quote=0.4, ask_quote=0.6, size_usd=1.0, post_only=True
+    )
+
+
+def test_act_legs_overlap() -> None:
+    """Without bulk, bid and ask are in flight together (two calls in flight at once)."""
+    broker = FakeLatencyBroker(latency_ms=LATENCY_MS, bulk=False)
+    result = asyncio.run(AsyncExecutor(broker).run(_act(), "m1"))
+    assert result["orders"] == ["bid", "ask"]
+    assert broker.max_in_flight == 2
+
+
+def test_act_uses_bulk_submit_with_per_leg_results() -> None:
+    """supports_bulk: one submit_orders round-trip; one result per leg."""
+    broker = FakeLatencyBroker(latency_ms=1.0)
+    result = asyncio.run(AsyncExecutor(broker).run(_act(), "m1"))
+    assert [c[0] for c in broker.calls] == ["submit_orders"]
+    assert [leg["order_id"] for leg in result["legs"]] == ["fake-1", "fake-2"]
+
+
+def test_exit_ordered_by_default() -> None:
+    """EXIT: cancel, then close by default; ordered_exit=False overlaps them."""
+    broker = FakeLatencyBroker(latency_ms=1.0)
+    exit_action = SimpleNamespace(action=Action.EXIT)
+    asyncio.run(AsyncExecutor(broker).run(exit_action, "m1", mid=0.5))
+    assert broker.max_in_flight == 1
+    assert [c[0] for c in broker.calls] == ["cancel_all", "flatten_position"]
+    broker = FakeLatencyBroker(latency_ms=1.0)
+    asyncio.run(AsyncExecutor(broker, ordered_exit=False).run(exit_action, "m1", 0.5))
+    assert broker.max_in_flight == 2
+
+
+def test_async_to_sync_bridge_sync_executor() -> None:
+    """Sync Executor over AsyncToSyncBroker: submit_orders reaches the async fallback (legs overlap)."""
+    fake = FakeLatencyBroker(latency_ms=LATENCY_MS, bulk=False)
+    broker = AsyncToSyncBroker(fake)
+    try:
+        result = Executor(broker).run(_act(), "m1")
+    finally:
+        broker.close()
+    assert result["orders"] == ["bid", "ask"]
+    assert fake.max_in_flight == 2
+    assert len(fake.open_orders) == 2
+
+
+def test_sync_to_async_bridge_round_trip() -> None:
+    """SyncToAsyncBroker(AsyncToSyncBroker(fake)) keeps results and capability flags."""
+    fake = FakeLatencyBroker(latency_ms=1.0)
+    sync_broker = AsyncToSyncBroker(fake)
+    try:
+        async_broker = SyncToAsyncBroker(sync_broker)
+        assert async_broker.supports_replace is True
+        result = asyncio.run(AsyncExecutor(async_broker).run(_act(), "m1"))
+        assert result["orders"] == ["bid", "ask"]
+        assert asyncio.run(async_broker.cancel_all("m1")) == 2
+    finally:
+        sync_broker.close()
@@ -0,0 +1,72 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""FeatureSchema / FeatureVector: fixed layout, validated once, accepted by DecisionEngine."""
+
+import numpy as np
+import pytest
+from decision_schema.types import Action, Proposal
+
+from mdm_engine.mdm.decision_engine import DecisionEngine
+from mdm_engine.mdm.feature_schema import FeatureSchema, FeatureVector
+
+SCHEMA = FeatureSchema(["signal_1", "state_scalar_a", "state_scalar_b", "extra"])
+FEATURES = {"signal_1": 0.3, "state_scalar_a": 120.0, "state_scalar_b": 10.0}
+
+
+def test_schema_validation() -> None:
+    with pytest.raises(ValueError):
+        FeatureSchema([])
+    with pytest.raises(ValueError):
+        FeatureSchema(["a", "a"])
+    with pytest.raises(ValueError):
+        FeatureSchema(["a"], defaults={"b": 1.0})
+    with pytest.raises(TypeError):
+        DecisionEngine(feature_schema=["signal_1"])
+
+
+def test_vector_is_mapping_with_slots() -> None:
+    vec = SCHEMA.new_vector()
+    vec.values[SCHEMA.index("signal_1")] = 0.25
+    vec["extra"] = 7.0
+    assert vec["signal_1"] == 0.25 and vec.get("missing", -1.0) == -1.0
+    assert vec.to_dict() == {
+        "signal_1": 0.25,
+        "state_scalar_a": 0.0,
+        "state_scalar_b": 0.0,
+        "extra": 7.0,
+    }
+    with pytest.raises(ValueError):
+        FeatureVector(SCHEMA, SCHEMA.new_vector().values[:2])
+
+
+def test_engine_vector_matches_dict() -> None:
+    de = DecisionEngine(feature_schema=SCHEMA)
+    vec = SCHEMA.vector_from(FEATURES)
+    p_vec, p_dict = de.propose(vec), de.propose(FEATURES)
+    assert p_vec == p_dict and p_vec.action == Action.ACT
+    # Schema without some reference keys: absent slots read as reference defaults.
+    partial = FeatureSchema(["signal_1"])
+    de2 = DecisionEngine(feature_schema=partial)
+    v2 = partial.vector_from(FEATURES)
+    assert de2.propose(v2) == de2.propose({"signal_1": 0.3})
+    # Vector of another schema goes through the Mapping path.
+    assert DecisionEngine().propose(vec) == p_dict
+
+
+def test_private_hook_receives_vector_and_batch_uses_schema_layout() -> None:
+    seen = []
+
+    def hook(features, **kwargs):
+        seen.append(features["signal_1"])
+        return Proposal(action=Action.HOLD, confidence=0.1, reasons=["hook"])
+
+    de = DecisionEngine(feature_schema=SCHEMA)
+    de.swap_model(hook)
+    assert de.propose(SCHEMA.vector_from(FEATURES)).reasons == ["hook"]
+    assert seen == [0.3]
+
+    de.swap_model(None)
+    matrix = np.array([[0.3, 120.0, 10.0, 0.0], [0.0, 0.0, 0.0, 0.0]])
+    batch = de.propose_batch(matrix)
+    assert [p.action for p in batch] == [Action.ACT, Action.HOLD]
@@ -0,0 +1,93 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: ArrayBuffer / EquityCurve match plain lists; PaperBroker FILL_DTYPE records.
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.sim (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+buffers = pytest.importorskip("mdm_engine.sim.buffers")
+from mdm_engine.sim.paper_broker import FILL_DTYPE, PaperBroker
+
+
+@pytest.mark.parametrize("maxlen", [None, 1, 7, 64])
+def test_array_buffer_matches_list_across_wrap_around(maxlen) -> None:
+    """view() equals the newest maxlen appended values (all when unbounded), oldest first."""
+    buf = buffers.ArrayBuffer(np.float64, maxlen)
+    values = []
+    for i in range(200):
+        buf.append(float(i))
+        values.append(float(i))
+        expected = values[-maxlen:] if maxlen else values
+        assert buf.view().tolist() == expected and len(buf) == len(expected)
+    assert buf.total == 200
+    with pytest.raises(ValueError):
+        buf.view()[0] = 1.0
+
+
+def test_array_buffer_clear() -> None:
+    """clear() empties the buffer and its total; appends start over (ring included)."""
+    buf = buffers.ArrayBuffer(np.int64, maxlen=4)
+    for i in range(10):
+        buf.append(i)
+    buf.clear()
+    assert len(buf) == 0 and buf.total == 0 and buf.view().tolist() == []
+    for i in range(6):
+        buf.append(100 + i)
+    assert buf.view().tolist() == [102, 103, 104, 105] and buf.total == 6
+    with pytest.raises(ValueError):
+        buffers.ArrayBuffer(maxlen=0)
+
+
+def test_array_buffer_structured_fill_records() -> None:
+    """FILL_DTYPE rows round-trip through the ring, oldest evicted first."""
+    buf = buffers.ArrayBuffer(FILL_DTYPE, maxlen=3)
+    rows = [(t, 0.5 + t / 100, t % 2, 1.5 * t, t % 3) for t in range(5)]
+    for row in rows:
+        buf.append(row)
+    assert buf.view().dtype == FILL_DTYPE
+    assert buf.view().tolist() == rows[-3:]
+
+
+@pytest.mark.parametrize("maxlen, every", [(None, 1), (None, 3), (10, 1), (10, 4)])
+def test_equity_curve_summary_matches_list(maxlen, every) -> None:
+    """Running count/last/min/max/mean/max_drawdown equal the stats of every appended point."""
+    rng = random.Random(3)
+    curve = buffers.EquityCurve(maxlen, every)
+    assert curve.summary() == {"count": 0}
+    points = []
+    equity = 1000.0
+    for _ in range(500):
+        equity += rng.gauss(0, 5)
+        curve.append(equity)
+        points.append(equity)
+    peak, drawdown = -np.inf, 0.0
+    for p in points:
+        peak = max(peak, p)
+        drawdown = max(drawdown, peak - p)
+    summary = curve.summary()
+    assert summary["count"] == len(points) and summary["last"] == points[-1]
+    assert summary["min"] == min(points) and summary["max"] == max(points)
+    assert summary["mean"] == pytest.approx(sum(points) / len(points), rel=1e-12)
+    assert summary["max_drawdown"] == drawdown
+    kept = points[::every]
+    assert list(curve) == (kept[-maxlen:] if maxlen else kept)
+
+
+def test_paper_broker_fill_records_array() -> None:
+    """fill_records_array(): FILL_DTYPE rows (newest fill_records_maxlen) and the market table."""
+    broker = PaperBroker(fill_records_maxlen=2)
+    for i, market_id in enumerate(("a", "b", "a")):
+        broker.set_book({"bid": 0.49, "ask": 0.51, "mid": 0.5, "ts_ms": i}, market_id)
+        assert broker.submit_order(market_id, "bid", 0.60, 10.0, False)["filled"]
+    records, markets = broker.fill_records_array()
+    assert records.dtype == FILL_DTYPE and markets == ["a", "b"]
+    assert records["fill_ts_ms"].tolist() == [1, 2]
+    assert [markets[m] for m in records["market"].tolist()] == ["b", "a"]
+    assert [r["market_id"] for r in broker.get_fill_records()] == ["b", "a"]
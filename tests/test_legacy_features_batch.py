@@ -0,0 +1,71 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: build_features_batch matches per-instrument build_features (ragged input).
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.features (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import numpy as np
+import pytest
+
+batch = pytest.importorskip("mdm_engine.features.batch")
+from mdm_engine.features.feature_builder import build_features
+
+N, LEVELS, VOL_WINDOW = 40, 5, 10
+
+
+def _ragged_books(seed: int = 1):
+    """Books with 1..LEVELS levels (missing: NaN price, size 0) and NaN-padded histories."""
+    rng = np.random.default_rng(seed)
+    mid = rng.uniform(0.2, 0.8, N)
+    bid0 = np.round((mid - 0.01) / 0.01) * 0.01
+    ask0 = bid0 + 0.01 * rng.integers(1, 4, N)
+    steps = 0.01 * np.arange(LEVELS)
+    bid_px, ask_px = bid0[:, None] - steps, ask0[:, None] + steps
+    bid_sz = rng.uniform(10, 200, (N, LEVELS))
+    ask_sz = rng.uniform(10, 200, (N, LEVELS))
+    for px, sz in ((bid_px, bid_sz), (ask_px, ask_sz)):
+        n_levels = rng.integers(1, LEVELS + 1, N)
+        missing = np.arange(LEVELS)[None, :] >= n_levels[:, None]
+        px[missing], sz[missing] = np.nan, 0.0
+    hist_len = VOL_WINDOW + 5
+    hist = mid[:, None] * np.exp(np.cumsum(rng.normal(0, 0.002, (N, hist_len)), axis=1))
+    hist_n = rng.integers(0, hist_len + 1, N)
+    hist[np.arange(hist_len)[None, :] < (hist_len - hist_n)[:, None]] = np.nan
+    return bid_px, bid_sz, ask_px, ask_sz, hist
+
+
+def _levels(px, sz) -> list[tuple[float, float]]:
+    return [(p, s) for p, s in zip(px.tolist(), sz.tolist()) if s != 0]
+
+
+def test_batch_matches_build_features_on_ragged_input() -> None:
+    """Every column equals build_features of that instrument (1e-9 relative, floor 1)."""
+    bid_px, bid_sz, ask_px, ask_sz, hist = _ragged_books()
+    now = np.arange(N) + 1000
+    table = batch.build_features_batch(
+        bid_px, bid_sz, ask_px, ask_sz, hist, VOL_WINDOW, 1000, now
+    )
+    assert all(col.shape == (N,) for col in table.values())
+    for i in range(N):
+        bids, asks = _levels(bid_px[i], bid_sz[i]), _levels(ask_px[i], ask_sz[i])
+        history = [m for m in hist[i].tolist() if not np.isnan(m)]
+        ref = build_features(
+            bids[0][0], asks[0][0], 0.0, 0.0, bids, asks,
+            history, VOL_WINDOW, 1000, int(now[i]),
+        )  # fmt: skip
+        for key, col in table.items():
+            assert abs(ref[key] - float(col[i])) <= 1e-9 * max(1.0, abs(ref[key])), (i, key)
+
+
+def test_batch_rejects_mismatched_shapes() -> None:
+    """Price/size shapes per side and instrument counts must agree."""
+    bid_px, bid_sz, ask_px, ask_sz, hist = _ragged_books()
+    with pytest.raises(ValueError):
+        batch.build_features_batch(bid_px, bid_sz[:, :2], ask_px, ask_sz)
+    with pytest.raises(ValueError):
+        batch.build_features_batch(bid_px, bid_sz, ask_px[:5], ask_sz[:5])
+    with pytest.raises(ValueError):
+        batch.build_features_batch(bid_px, bid_sz, ask_px, ask_sz, hist[:5], VOL_WINDOW)
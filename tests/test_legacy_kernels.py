@@ -0,0 +1,74 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: rolling_std / sigma_spike_z / SigmaSpikeZStream match the np.std loop.
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.features (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+kernels = pytest.importorskip("mdm_engine.features.kernels")
+
+
+def _sigma_spike_z_loop(mid_history, short_steps, long_steps, eps=1e-9):
+    """Previous feature_builder._sigma_spike_z: np.std per short window."""
+    if len(mid_history) < max(short_steps, long_steps) + 2:
+        return 0.0
+    arr = np.maximum(np.array(mid_history[-long_steps - 2 :], dtype=float), eps)
+    rets = np.diff(np.log(arr))
+    if len(rets) < short_steps:
+        return 0.0
+    sigma_short = float(np.std(rets[-short_steps:]))
+    vals = [
+        float(np.std(rets[i : i + short_steps]))
+        for i in range(len(rets) - short_steps + 1)
+    ]
+    mu_l, std_l = float(np.mean(vals)), float(np.std(vals))
+    if std_l < eps:
+        return 0.0
+    return (sigma_short - mu_l) / (std_l + eps)
+
+
+def _tick_mids(n: int, seed: int) -> list[float]:
+    """Random walk with volatility regimes, rounded to a 0.01 tick (many zero returns)."""
+    rng = random.Random(seed)
+    mid, out = 0.5, []
+    for t in range(n):
+        mid = max(0.01, mid + rng.gauss(0, 0.002 * (3 if (t // 300) % 2 else 1)))
+        out.append(round(mid / 0.01) * 0.01)
+    return out
+
+
+def _max_rel_diff(values, ref) -> float:
+    ref = np.asarray(ref)
+    return float(np.max(np.abs(np.asarray(values) - ref) / np.maximum(1.0, np.abs(ref))))
+
+
+def test_rolling_std_matches_np_std() -> None:
+    """Per-slice np.std to 1e-9 relative; flat slices stay within 1e-8 of 0."""
+    rets = np.diff(np.log(_tick_mids(2000, seed=0)))
+    ref = np.array([np.std(rets[i : i + 20]) for i in range(len(rets) - 19)])
+    got = kernels.rolling_std(rets, 20)
+    assert got.shape == ref.shape
+    np.testing.assert_allclose(got, ref, rtol=1e-9, atol=1e-8)
+    assert kernels.rolling_std(rets, 0).size == 0
+    assert kernels.rolling_std(rets[:5], 20).size == 0
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+@pytest.mark.parametrize("short, long", [(20, 100), (5, 30), (10, 60)])
+def test_sigma_spike_z_matches_loop(seed, short, long) -> None:
+    """Kernel within ~1e-7 and stream within ~2e-8 of the loop on tick-rounded mids."""
+    mids = _tick_mids(900, seed)
+    ref = [_sigma_spike_z_loop(mids[: i + 1], short, long) for i in range(len(mids))]
+    kernel = [kernels.sigma_spike_z(mids[: i + 1], short, long) for i in range(len(mids))]
+    stream = kernels.SigmaSpikeZStream(short, long)
+    streamed = [stream.push_mid(m) for m in mids]
+    assert any(abs(z) > 1.0 for z in ref)
+    assert _max_rel_diff(kernel, ref) < 1e-7
+    assert _max_rel_diff(streamed, ref) < 3e-8
@@ -0,0 +1,65 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: MicrostructureSim.simulate (closed-form Lindley walk) matches the step loop.
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.sim (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import numpy as np
+import pytest
+
+microstructure_sim = pytest.importorskip("mdm_engine.sim.microstructure_sim")
+
+
+def _step_loop(sim, n_steps: int, n_paths: int, seed: int):
+    """step() dynamics as a per-step loop, fed the draws simulate() takes from np_rng(seed)."""
+    rng = np.random.default_rng(seed)
+    shape = (n_paths, n_steps)
+    z = rng.normal(0.0, sim.vol, shape)
+    spread = sim.spread_min + rng.uniform(0.0, 0.02, shape)
+    bid_depth = np.maximum(10.0, 100.0 + rng.normal(0.0, 20.0, shape))
+    ask_depth = np.maximum(10.0, 100.0 + rng.normal(0.0, 20.0, shape))
+    tick = sim.tick_size
+    mids = np.empty(shape)
+    bid = np.empty(shape)
+    ask = np.empty(shape)
+    for p in range(n_paths):
+        mid = sim.mid
+        for t in range(n_steps):
+            mid = max(0.01, mid + z[p, t])
+            half = spread[p, t] / 2.0
+            b = round((mid - half) / tick) * tick
+            a = round((mid + half) / tick) * tick
+            mids[p, t], bid[p, t], ask[p, t] = mid, b, a if a > b else b + tick
+    return mids, bid, ask, bid_depth, ask_depth
+
+
+@pytest.mark.parametrize("mid0, vol", [(0.5, 0.001), (0.03, 0.01)])
+def test_simulate_matches_step_loop(mid0, vol) -> None:
+    """Same draws: bid/ask equal the loop's, and the walk is clamped at 0.01 like step()."""
+    n_steps, n_paths, seed = 2000, 4, 11
+    sim = microstructure_sim.MicrostructureSim(mid0=mid0, vol=vol, seed=seed)
+    mids, bid, ask, bid_depth, ask_depth = _step_loop(sim, n_steps, n_paths, seed)
+    out = sim.simulate(n_steps, n_paths)
+    assert out.shape == (n_paths, n_steps)
+    np.testing.assert_allclose(out["bid"], bid, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(out["ask"], ask, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(out["bid_depth"], bid_depth)
+    np.testing.assert_array_equal(out["ask_depth"], ask_depth)
+    assert out["ts_ms"][0].tolist() == list(range(100, 100 * (n_steps + 1), 100))
+    assert (out["ask"] > out["bid"]).all()
+    if vol > 0.005:
+        assert (mids == 0.01).any()  # the floor was hit
+
+
+def test_single_path_simulate_chains_like_step() -> None:
+    """n_paths == 1 continues mid and clock from the last simulated step."""
+    sim = microstructure_sim.MicrostructureSim(mid0=0.03, vol=0.01, seed=5)
+    mids, *_ = _step_loop(sim, 300, 1, 5)
+    first = sim.simulate(300)
+    assert sim.mid == pytest.approx(mids[0, -1], abs=1e-12)
+    second = sim.simulate(10)
+    assert second["ts_ms"][0, 0] == first["ts_ms"][0, -1] + sim.dt_ms
+    assert sim.simulate(0).shape == (1, 0)
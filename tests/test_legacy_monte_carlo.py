@@ -0,0 +1,43 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: Monte Carlo runs act and fill with the legacy model; no silent core default.
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.sim (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+monte_carlo = pytest.importorskip("mdm_engine.sim.monte_carlo")
+
+LEGACY_DIR = (
+    Path(__file__).resolve().parents[1] / "docs/examples/example_domain_legacy_v0"
+)
+
+
+@pytest.fixture
+def legacy_model(monkeypatch):
+    monkeypatch.syspath_prepend(str(LEGACY_DIR))
+    from reference_model_legacy import compute_proposal_reference
+
+    yield compute_proposal_reference
+    sys.modules.pop("reference_model_legacy", None)
+
+
+def test_run_with_legacy_model_acts_and_fills(legacy_model) -> None:
+    """RunConfig defaults + legacy model: every run proposes ACTs and gets fills."""
+    config = monte_carlo.RunConfig(steps=300, model=legacy_model)
+    result = monte_carlo.run_monte_carlo(config, n_runs=2, workers=1)
+    for summary in result.summaries:
+        assert summary.act_count > 0
+        assert summary.fills_count > 0
+
+
+def test_run_config_requires_model() -> None:
+    """model is a required field: no silent fallback to a model that never acts."""
+    with pytest.raises(TypeError, match="model"):
+        monte_carlo.RunConfig()
@@ -0,0 +1,79 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: PaperBroker per-market marks (MarkToMarket), version and snapshot().
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.sim (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import pytest
+
+paper_broker = pytest.importorskip("mdm_engine.sim.paper_broker")
+
+
+def _book(mid: float) -> dict:
+    return {"bid": mid - 0.01, "ask": mid + 0.01, "mid": mid, "ts_ms": 0}
+
+
+def _marked(broker, mids: dict[str, float], default_mid: float) -> tuple[float, float]:
+    """(equity, exposure) recomputed from positions and the given mids."""
+    state = broker.get_state(equity="summary")
+    positions = state["positions"]
+    mark = sum(pos * mids.get(m, default_mid) for m, pos in positions.items())
+    exposure = sum(abs(pos) * mids.get(m, default_mid) for m, pos in positions.items())
+    return state["cash"] + state["realized_pnl"] + mark, exposure
+
+
+def test_multi_market_equity_and_exposure() -> None:
+    """Own-book markets and default-mid markets are marked at their own mids."""
+    broker = paper_broker.PaperBroker(initial_cash=1000.0)
+    broker.set_book(_book(0.40), "a")
+    broker.set_book(_book(0.70), "b")
+    broker.set_book(_book(0.55))  # default mid (markets without their own book)
+    broker.submit_order("a", "bid", 0.50, 10.0, False)
+    broker.submit_order("b", "ask", 0.60, 20.0, False)
+    broker.submit_order("c", "bid", 0.60, 5.0, False)
+    assert all(broker.get_state()["positions"][m] != 0.0 for m in "abc")
+    mids, default_mid = {"a": 0.40, "b": 0.70}, 0.55
+    for mid, market_id in ((0.45, "a"), (0.65, "b"), (0.50, None)):
+        broker.set_book(_book(mid), market_id)
+        if market_id is None:
+            default_mid = mid
+        else:
+            mids[market_id] = mid
+        equity, exposure = _marked(broker, mids, default_mid)
+        assert broker.equity() == pytest.approx(equity, abs=1e-12)
+        assert broker.get_state()["exposure_usd"] == pytest.approx(exposure, abs=1e-12)
+    broker.flatten_position("a")
+    equity, exposure = _marked(broker, mids, default_mid)
+    assert broker.equity() == pytest.approx(equity, abs=1e-12)
+    assert broker.get_state()["exposure_usd"] == pytest.approx(exposure, abs=1e-12)
+
+
+def test_zero_mid_is_kept() -> None:
+    """A market mid of 0.0 marks the position at 0 (not the 0.5 fallback for a missing mid)."""
+    broker = paper_broker.PaperBroker(initial_cash=0.0)
+    broker.set_book(_book(0.50), "a")
+    broker.submit_order("a", "bid", 0.60, 10.0, False)
+    broker.set_book({"bid": 0.0, "ask": 0.0, "mid": 0.0}, "a")
+    assert broker.get_state()["exposure_usd"] == 0.0
+    assert broker.equity() == pytest.approx(_marked(broker, {"a": 0.0}, 0.5)[0], abs=1e-12)
+
+
+def test_snapshot_rebuilt_only_on_version_change() -> None:
+    """snapshot() returns the same dict until a fill, close or mid move bumps version."""
+    broker = paper_broker.PaperBroker()
+    broker.set_book(_book(0.50), "a")
+    snap = broker.snapshot()
+    assert broker.snapshot() is snap and snap["version"] == broker.version
+    broker.set_book(_book(0.50), "a")  # same mid: no change
+    broker.process_fills(now_ms=0)
+    assert broker.snapshot() is snap
+    broker.set_book(_book(0.52), "a")
+    moved = broker.snapshot()
+    assert moved is not snap and moved["version"] == snap["version"] + 1
+    broker.submit_order("a", "bid", 0.60, 10.0, False)
+    filled = broker.snapshot()
+    assert filled is not moved and filled["fills_count"] == 1
+    assert filled["equity"] == broker.equity()
@@ -0,0 +1,66 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: RollingFeatureEngine matches build_features; QuantileWindow matches numpy.
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.features (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+rolling = pytest.importorskip("mdm_engine.features.rolling")
+from mdm_engine.features.feature_builder import build_features
+
+
+def _ticks(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    mid = 0.5
+    for t in range(n):
+        mid = max(0.01, mid + rng.gauss(0, 0.002))
+        bid = round((mid - 0.01) / 0.01) * 0.01
+        ask = bid + 0.01 * rng.randint(1, 3)
+        bd, ad = rng.uniform(10, 200), rng.uniform(10, 200)
+        yield bid, ask, bd, ad, t * 100, t * 100 + rng.randint(0, 50)
+
+
+@pytest.mark.parametrize("vol_window, window_5m", [(50, 300), (5, 7)])
+def test_rolling_engine_matches_build_features(vol_window, window_5m) -> None:
+    """Every feature of every tick equals build_features within 1e-9 (running sums: abs floor)."""
+    engine = rolling.RollingFeatureEngine(vol_window, window_5m_steps=window_5m)
+    mids, spreads, depths, stale = [], [], [], []
+    for bid, ask, bd, ad, last, now in _ticks(1500):
+        mids.append((bid + ask) / 2.0)
+        spreads.append(max(0.0, ask - bid))
+        depths.append(bd + ad)
+        stale.append(now - last)
+        ref = build_features(
+            bid, ask, bd, ad, None, None, mids, vol_window, last, now,
+            spread_history=spreads, depth_history=depths, staleness_history=stale,
+            window_5m_steps=window_5m,
+        )  # fmt: skip
+        out = engine.update(bid, ask, bd, ad, None, None, last, now)
+        assert out.keys() == ref.keys()
+        for k, v in ref.items():
+            assert out[k] == pytest.approx(v, rel=1e-9, abs=1e-9), k
+
+
+@pytest.mark.parametrize("q", [0, 10, 50, 90, 100])
+def test_quantile_window_matches_numpy(q) -> None:
+    """Sliding percentile equals np.percentile / np.median, incl. ties and monotonic runs."""
+    rng = random.Random(q)
+    for window in (1, 2, 7, 40):
+        qw = rolling.QuantileWindow(window, q)
+        values: list[float] = []
+        for i in range(600):
+            x = float(i) if i < 200 else float(rng.randint(0, 5)) if i < 400 else -i
+            qw.push(x)
+            values.append(x)
+            w = np.array(values[-window:])
+            ref = np.median(w) if q == 50 else np.percentile(w, q)
+            assert qw.value() == pytest.approx(float(ref), rel=1e-12)
+            assert len(qw) == len(w)
+        assert len(qw._lo) + len(qw._hi) <= 2 * window + 1  # dead entries compacted
@@ -0,0 +1,71 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Example domain: SyntheticSource batch reads (next_events / next_columns) match next_event().
+
+Runs only when docs/examples/example_domain_legacy_v0/mdm_engine_legacy is importable as
+mdm_engine.sim (skipped otherwise; the legacy tree is not packaged).
+"""
+
+import pytest
+
+synthetic_source = pytest.importorskip("mdm_engine.sim.synthetic_source")
+from mdm_engine.sim.microstructure_sim import MicrostructureSim
+
+STEPS = 250
+
+
+def _source(block_size: int = 64):
+    return synthetic_source.SyntheticSource(
+        MicrostructureSim(seed=7), STEPS, block_size=block_size
+    )
+
+
+def _one_by_one(src) -> list[dict]:
+    events = []
+    while (event := src.next_event()) is not None:
+        events.append(event)
+    return events
+
+
+@pytest.mark.parametrize("chunk", [1, 10, 64, 100, 1000])
+def test_next_events_matches_next_event(chunk) -> None:
+    """Chunks across block boundaries yield the same events, then an empty list."""
+    expected = _one_by_one(_source())
+    src = _source()
+    events = []
+    while batch := src.next_events(chunk):
+        assert len(batch) <= chunk
+        events.extend(batch)
+    assert events == expected and len(events) == STEPS
+    assert src.next_event() is None
+
+
+@pytest.mark.parametrize("chunk", [1, 10, 64, 100, 1000])
+def test_next_columns_matches_next_event(chunk) -> None:
+    """Column chunks hold the same values as the row events, then None."""
+    expected = _one_by_one(_source())
+    src = _source()
+    rows = []
+    while (cols := src.next_columns(chunk)) is not None:
+        assert all(not col.flags.writeable for col in cols.values())
+        rows.extend(
+            dict(zip(cols, values))
+            for values in zip(*(col.tolist() for col in cols.values()))
+        )
+    assert rows == expected
+
+
+def test_interleaved_reads_and_from_block() -> None:
+    """Mixing next_event / next_events / next_columns keeps one ordered stream."""
+    expected = _one_by_one(_source())
+    src = _source()
+    events = [src.next_event()] + src.next_events(70)
+    cols = src.next_columns(30)
+    events += [dict(zip(cols, v)) for v in zip(*(c.tolist() for c in cols.values()))]
+    events += _one_by_one(src)
+    assert events == expected
+
+    book = MicrostructureSim(seed=7).simulate(STEPS)[0]
+    block_events = synthetic_source.SyntheticSource.from_block(book).next_events(STEPS)
+    assert block_events == _one_by_one(synthetic_source.SyntheticSource.from_block(book))
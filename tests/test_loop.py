@@ -0,0 +1,140 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Pipelined loop: trace per step, latency metrics, injected modulation, stage overlap."""
+
+import asyncio
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from decision_schema.types import Action
+
+from mdm_engine.adapters.base import MarketDataSource
+from mdm_engine.loop import PipelinedLoop, run_loop
+from mdm_engine.mdm.decision_engine import DecisionEngine
+from mdm_engine.trace.trace_logger import TraceLogger
+
+
+class ListSource(MarketDataSource):
+    def __init__(self, events):
+        self._events = list(events)
+
+    def next_event(self):
+        return self._events.pop(0) if self._events else None
+
+
+def _events(n: int, ts_ms: float = 0.0) -> list[dict]:
+    return [{"ts_ms": ts_ms, "signal_1": 0.5, "mid": 0.5} for _ in range(n)]
+
+
+class FakeClock:
+    """Advances 1 ms per reading."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1.0
+        return self.now
+
+
+def test_run_loop_traces_every_step_with_latencies() -> None:
+    """One PacketV2 per event; FORMULAS.md latencies recorded per step."""
+    with tempfile.TemporaryDirectory() as tmp:
+        trace = TraceLogger(Path(tmp))
+        summary = run_loop(
+            ListSource(_events(5)), trace=trace, run_id="r1", clock_ms=FakeClock()
+        )
+        trace.close()
+        lines = (Path(tmp) / "traces.jsonl").read_text().splitlines()
+    assert summary["steps"] == 5 and len(lines) == 5
+    packets = [json.loads(line) for line in lines]
+    assert [p["step"] for p in packets] == list(range(5))
+    assert packets[0]["run_id"] == "r1"
+    assert packets[0]["external"]["mdm_latency_ms"] == 1.0
+    for key in ("feature_latency_ms", "mdm_latency_ms", "latency_ms"):
+        assert summary[key]["max"] >= summary[key]["mean"] > 0
+
+
+def test_latency_ignores_simulated_event_time_by_default() -> None:
+    """ts_ms on a simulated clock (from 0) does not leak into wall-clock latencies."""
+    summary = run_loop(ListSource(_events(5, ts_ms=100.0)))
+    assert summary["latency_ms"]["max"] < 60_000
+
+
+def test_event_ts_key_uses_event_time() -> None:
+    """event_ts_key: latencies are measured from event[event_ts_key] on the clock_ms base."""
+    summary = run_loop(
+        ListSource(_events(3, ts_ms=-10.0)), event_ts_key="ts_ms", clock_ms=FakeClock()
+    )
+    assert summary["feature_latency_ms"]["p50"] > 10
+
+
+def test_modulation_is_injected() -> None:
+    """modulate(proposal, context) decides what reaches the executor."""
+    seen = []
+
+    class RecordingExecutor:
+        def run(self, final_action, market_id, mid=None):
+            seen.append((final_action.action, market_id, mid))
+            return {}
+
+    def hold_all(proposal, context):
+        assert {"now_ms", "last_event_ts_ms", "mdm_latency_ms"} <= context.keys()
+        return type(proposal)(action=Action.HOLD, confidence=0.0), None
+
+    run_loop(
+        ListSource(_events(3)),
+        RecordingExecutor(),
+        modulate=hold_all,
+        market_id="m1",
+    )
+    assert seen == [(Action.HOLD, "m1", 0.5)] * 3
+
+
+def test_stages_overlap() -> None:
+    """Trace write of step N is still running when execution of step N+1 starts."""
+    n = 10
+    started = [threading.Event() for _ in range(n)]
+
+    class SlowAsyncExecutor:
+        def __init__(self):
+            self.calls = 0
+
+        async def run(self, final_action, market_id, mid=None):
+            started[self.calls].set()
+            self.calls += 1
+            await asyncio.sleep(0.001)
+
+    class WaitingTrace:
+        """write(step N) returns once step N+1 has started executing (or times out)."""
+
+        def __init__(self):
+            self.packets = []
+            self.overlapped = 0
+
+        def write(self, packet):
+            if packet.step + 1 < n and started[packet.step + 1].wait(timeout=5.0):
+                self.overlapped += 1
+            self.packets.append(packet)
+
+    trace = WaitingTrace()
+    loop = PipelinedLoop(
+        ListSource(_events(n)), DecisionEngine(), SlowAsyncExecutor(), trace
+    )
+    summary = asyncio.run(loop.run())
+    assert summary["steps"] == n and len(trace.packets) == n
+    assert trace.overlapped == n - 1
+
+
+def test_stage_error_propagates() -> None:
+    """A failing stage stops the loop and surfaces its own exception."""
+
+    def broken(event):
+        raise ValueError("bad event")
+
+    with pytest.raises(ValueError, match="bad event"):
+        run_loop(ListSource(_events(100)), features=broken, queue_size=2)
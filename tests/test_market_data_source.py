@@ -0,0 +1,74 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""MarketDataSource pull protocol: next_events, next_columns, iteration; batch use by the loop."""
+
+import asyncio
+
+import numpy as np
+
+from mdm_engine.adapters.base import MarketDataSource
+from mdm_engine.loop import run_loop
+
+
+class CountingSource(MarketDataSource):
+    """next_event only; counts calls."""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.i = 0
+        self.calls = 0
+
+    def next_event(self):
+        self.calls += 1
+        if self.i >= self.n:
+            return None
+        self.i += 1
+        return {"ts_ms": self.i, "signal_1": 0.1 * self.i}
+
+
+class BatchSource(CountingSource):
+    """Native next_events; records batch sizes."""
+
+    supports_batch = True
+
+    def __init__(self, n: int):
+        super().__init__(n)
+        self.batches: list[int] = []
+
+    def next_events(self, max_n):
+        events = super().next_events(max_n)
+        self.batches.append(len(events))
+        return events
+
+
+def test_default_next_events_and_columns() -> None:
+    """Defaults are built on next_event: short final batch, then [] / None."""
+    src = CountingSource(5)
+    assert [e["ts_ms"] for e in src.next_events(3)] == [1, 2, 3]
+    cols = src.next_columns(10)
+    assert set(cols) == {"ts_ms", "signal_1"}
+    np.testing.assert_array_equal(cols["ts_ms"], [4, 5])
+    assert src.next_events(3) == [] and src.next_columns(3) is None
+
+
+def test_iteration_sync_and_async() -> None:
+    """for / async for yield every event once, in order."""
+    assert [e["ts_ms"] for e in CountingSource(4)] == [1, 2, 3, 4]
+    assert [e["ts_ms"] for e in BatchSource(600)] == list(range(1, 601))
+
+    async def collect(src):
+        return [e["ts_ms"] async for e in src]
+
+    assert asyncio.run(collect(CountingSource(3))) == [1, 2, 3]
+    assert asyncio.run(collect(BatchSource(300))) == list(range(1, 301))
+
+
+def test_loop_pulls_batches_from_batch_source() -> None:
+    """run_loop uses next_events(queue_size) when supports_batch, next_event otherwise."""
+    src = BatchSource(10)
+    assert run_loop(src, queue_size=4)["steps"] == 10
+    assert src.batches == [4, 4, 2, 0]
+    plain = CountingSource(10)
+    assert run_loop(plain, queue_size=4)["steps"] == 10
+    assert plain.calls == 11
@@ -0,0 +1,74 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Model registry: resolve once at construction, explicit registration, hot swap, stats."""
+
+import importlib
+
+import pytest
+from decision_schema.types import Action, Proposal
+
+from mdm_engine.mdm import model_registry
+from mdm_engine.mdm.decision_engine import DecisionEngine
+from mdm_engine.mdm.model_registry import register_model, unregister_model
+
+FEATURES = {"signal_0": 0.5, "signal_1": 0.2, "state_scalar_a": 120.0}
+
+
+def _always_act(features, **kwargs):
+    return Proposal(action=Action.ACT, confidence=0.9, reasons=["registered"])
+
+
+def test_private_hook_resolved_once(monkeypatch) -> None:
+    """Missing hook is probed at construction only, not on every propose()."""
+    calls = []
+    real_import = importlib.import_module
+
+    def counting_import(name, *args, **kwargs):
+        if name == model_registry.PRIVATE_HOOK_MODULE:
+            calls.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(model_registry.importlib, "import_module", counting_import)
+    de = DecisionEngine()
+    for _ in range(5):
+        de.propose(FEATURES)
+    assert len(calls) == 1
+    assert de.model_stats["provider"] == model_registry.PROVIDER_REFERENCE
+    assert de.model_stats["resolve_ms"] >= 0.0
+
+
+def test_explicit_registration_selected_by_name() -> None:
+    register_model("test_always_act", _always_act)
+    try:
+        de = DecisionEngine(model_provider="test_always_act")
+        assert de.propose(FEATURES).reasons == ["registered"]
+        assert de.model_stats["provider"] == "registry:test_always_act"
+        with pytest.raises(ValueError):
+            register_model("test_always_act", _always_act)
+    finally:
+        unregister_model("test_always_act")
+
+
+def test_unknown_provider_fails_at_construction() -> None:
+    with pytest.raises(LookupError):
+        DecisionEngine(model_provider="does_not_exist")
+
+
+def test_hot_swap_and_fail_closed() -> None:
+    de = DecisionEngine(confidence_threshold=0.0, signal_threshold=0.0)
+
+    def broken(features, **kwargs):
+        raise RuntimeError("boom")
+
+    de.swap_model(broken, provider="broken")
+    p = de.propose(FEATURES)
+    assert p.action == Action.HOLD and "private_hook_error" in p.reasons
+    assert de.model_stats == {
+        "provider": "broken",
+        "resolve_ms": 0.0,
+        "swap_count": 1,
+    }
+    de.swap_model(None)
+    assert de.propose(FEATURES).action == Action.ACT
+    assert de.model_stats["provider"] == model_registry.PROVIDER_REFERENCE
@@ -0,0 +1,225 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""OrderManager: per-market quote state, single-side amend, replacement budget, fill cooldown."""
+
+from typing import Any
+
+from mdm_engine.adapters.base import Broker
+from mdm_engine.execution.order_manager import OrderManager
+
+
+class RecordingBroker(Broker):
+    """Broker stub that records calls (no fills)."""
+
+    def __init__(self, supports_replace: bool = False, reject_side: str | None = None):
+        self.supports_replace = supports_replace
+        self.reject_side = reject_side
+        self.reject_cancel = False
+        self.replace_error: str | None = None
+        self.calls: list[tuple] = []
+        self._n = 0
+
+    def get_state(self) -> dict[str, Any]:
+        return {}
+
+    def submit_order(self, market_id, side, price, size_usd, post_only):
+        if side == self.reject_side:
+            raise RuntimeError("rejected")
+        self._n += 1
+        self.calls.append(("submit", market_id, side, price))
+        return {"order_id": f"o{self._n}"}
+
+    def replace_order(self, order_id, price, size_usd):
+        self.calls.append(("replace", order_id, price))
+        if self.reject_side is not None:
+            raise RuntimeError("rejected")
+        if self.replace_error is not None:
+            return {"order_id": order_id, "error": self.replace_error}
+        return {"order_id": order_id}
+
+    def cancel_order(self, order_id: str) -> bool:
+        self.calls.append(("cancel", order_id))
+        return not self.reject_cancel
+
+    def cancel_all(self, market_id: str | None = None) -> int:
+        self.calls.append(("cancel_all", market_id))
+        return 1
+
+    def process_fills(self, now_ms: int) -> list[dict[str, Any]]:
+        return []
+
+
+def test_markets_have_independent_quote_state() -> None:
+    """Quoting market b does not suppress or replace market a."""
+    broker = RecordingBroker()
+    om = OrderManager(broker, refresh_ms=0)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    om.set_quotes("b", 0.40, 0.60, 1.0, now_ms=0)
+    assert [c[1] for c in broker.calls] == ["a", "a", "b", "b"]
+    out = om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=1000)
+    assert out["skipped"] is True and out["reason"] == "unchanged"
+
+
+def test_only_moved_side_is_amended() -> None:
+    """One side moved: cancel + submit that side only (no cancel_all, other side untouched)."""
+    broker = RecordingBroker()
+    om = OrderManager(broker, refresh_ms=0)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    broker.calls.clear()
+    out = om.set_quotes("a", 0.40, 0.65, 1.0, now_ms=1000)
+    assert (out["cancel_count"], out["submitted"], out["replaced"]) == (1, 1, 0)
+    assert out["legs"] == {"ask": {"order_id": "o3", "cancelled": True}}
+    assert broker.calls == [("cancel", "o2"), ("submit", "a", "ask", 0.65)]
+    assert om.markets["a"].bid.order_id == "o1"
+
+
+def test_replace_order_used_when_supported() -> None:
+    """supports_replace: one replace_order round-trip per moved side."""
+    broker = RecordingBroker(supports_replace=True)
+    om = OrderManager(broker, refresh_ms=0)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    broker.calls.clear()
+    out = om.set_quotes("a", 0.35, 0.60, 1.0, now_ms=1000)
+    assert out["replaced"] == 1 and out["submitted"] == 0
+    assert broker.calls == [("replace", "o1", 0.35)]
+
+
+def test_replacement_budget_sliding_window() -> None:
+    """max_replacements_per_min caps replacements per market in a sliding 60 s window."""
+    broker = RecordingBroker(supports_replace=True)
+    om = OrderManager(broker, refresh_ms=0, max_replacements_per_min=2)
+    # Initial placement is not a replacement.
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    assert om.set_quotes("a", 0.30, 0.60, 1.0, now_ms=1000)["skipped"] is False
+    assert om.set_quotes("a", 0.20, 0.60, 1.0, now_ms=2000)["skipped"] is False
+    out = om.set_quotes("a", 0.10, 0.60, 1.0, now_ms=3000)
+    assert out["skipped"] is True and out["reason"] == "replace_budget"
+    assert om.set_quotes("b", 0.40, 0.60, 1.0, now_ms=3000)["skipped"] is False
+    # First replacement (t=1000) leaves the window at t=61000.
+    assert om.set_quotes("a", 0.10, 0.60, 1.0, now_ms=61_000)["skipped"] is False
+    assert om.replacements_in_window("a", 61_000) == 2
+
+
+def test_post_fill_cooldown() -> None:
+    """No requote within post_fill_cooldown_ms of on_fill()."""
+    broker = RecordingBroker()
+    om = OrderManager(broker, refresh_ms=0, post_fill_cooldown_ms=500)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    om.on_fill("a", now_ms=100)
+    out = om.set_quotes("a", 0.30, 0.60, 1.0, now_ms=400)
+    assert out["skipped"] is True and out["reason"] == "cooldown"
+    assert om.set_quotes("a", 0.30, 0.60, 1.0, now_ms=600)["skipped"] is False
+
+
+def test_cancel_all_forgets_live_orders() -> None:
+    """After cancel_all the next set_quotes places both sides again."""
+    broker = RecordingBroker()
+    om = OrderManager(broker, refresh_ms=0)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    om.cancel_all("a")
+    out = om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=10)
+    assert out["submitted"] == 2 and out["cancel_count"] == 0
+
+
+def test_failed_leg_reported_and_retried() -> None:
+    """A raising leg is reported per side and left empty; the other side is placed."""
+    broker = RecordingBroker(reject_side="ask")
+    om = OrderManager(broker, refresh_ms=0)
+    out = om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    assert out["legs"]["ask"] == {"error": "RuntimeError"}
+    assert om.markets["a"].bid.order_id == "o1" and om.markets["a"].ask is None
+    broker.reject_side = None
+    out = om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=10)
+    assert out["submitted"] == 1 and om.markets["a"].ask.order_id == "o2"
+
+
+def test_unconfirmed_cancel_keeps_old_order() -> None:
+    """No submit for a side whose cancel is rejected; the old order stays tracked."""
+    broker = RecordingBroker()
+    om = OrderManager(broker, refresh_ms=0)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    broker.calls.clear()
+    broker.reject_cancel = True
+    out = om.set_quotes("a", 0.35, 0.65, 1.0, now_ms=1000)
+    assert out["submitted"] == 0
+    assert out["legs"]["bid"] == {"error": "cancel_rejected", "cancelled": False}
+    assert [c[0] for c in broker.calls] == ["cancel", "cancel"]
+    assert set(om.orders) == {"o1", "o2"} and om.markets["a"].ask.order_id == "o2"
+    broker.reject_cancel = False
+    out = om.set_quotes("a", 0.35, 0.65, 1.0, now_ms=2000)
+    assert out["submitted"] == 2 and set(om.orders) == {"o3", "o4"}
+
+
+def test_failed_replace_keeps_old_order() -> None:
+    """A raising replace_order is an error leg; the old order stays tracked."""
+    broker = RecordingBroker(supports_replace=True)
+    om = OrderManager(broker, refresh_ms=0)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    broker.reject_side = "bid"
+    out = om.set_quotes("a", 0.35, 0.60, 1.0, now_ms=1000)
+    assert out["legs"]["bid"] == {"error": "RuntimeError"}
+    assert om.markets["a"].bid.order_id == "o1" and om.markets["a"].bid.price == 0.40
+    assert set(om.orders) == {"o1", "o2"}
+
+
+def test_replace_order_default_is_an_error_leg() -> None:
+    """Broker.replace_order without supports_replace returns an error leg."""
+    broker = RecordingBroker()
+    assert Broker.replace_order(broker, "o1", 0.5, 1.0) == {
+        "order_id": "o1",
+        "error": "replace_unsupported",
+    }
+
+
+def test_replacement_window_stays_bounded() -> None:
+    """Without a budget the replacement window is still pruned to the last 60 s."""
+    broker = RecordingBroker(supports_replace=True)
+    om = OrderManager(broker, refresh_ms=0)
+    for i in range(1000):
+        om.set_quotes("a", 0.40 + 0.01 * (i % 2), 0.60, 1.0, now_ms=i * 1000)
+    assert len(om.markets["a"].replacements) <= 60
+
+
+def test_replace_of_gone_order_drops_side() -> None:
+    """unknown_order from replace_order: the side is dropped and placed fresh next call."""
+    broker = RecordingBroker(supports_replace=True)
+    om = OrderManager(broker, refresh_ms=0, max_replacements_per_min=1)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    broker.replace_error = "unknown_order"
+    out = om.set_quotes("a", 0.35, 0.60, 1.0, now_ms=1000)
+    assert out["legs"]["bid"]["error"] == "unknown_order"
+    assert om.markets["a"].bid is None and set(om.orders) == {"o2"}
+    broker.replace_error = None
+    broker.calls.clear()
+    out = om.set_quotes("a", 0.35, 0.60, 1.0, now_ms=2000)
+    assert out["submitted"] == 1 and broker.calls == [("submit", "a", "bid", 0.35)]
+    assert om.markets["a"].bid.order_id == "o3"
+
+
+def test_failed_replace_not_counted_against_budget() -> None:
+    """Only replacements that went through use the per-market budget."""
+    broker = RecordingBroker(supports_replace=True)
+    om = OrderManager(broker, refresh_ms=0, max_replacements_per_min=1)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    broker.reject_side = "bid"
+    for t in (1000, 2000, 3000):
+        assert om.set_quotes("a", 0.35, 0.60, 1.0, now_ms=t)["skipped"] is False
+    assert om.replacements_in_window("a", 3000) == 0
+    broker.reject_side = None
+    assert om.set_quotes("a", 0.35, 0.60, 1.0, now_ms=4000)["replaced"] == 1
+    assert om.replacements_in_window("a", 4000) == 1
+
+
+def test_on_fill_with_side_forgets_filled_order() -> None:
+    """on_fill(side=...) / on_fill(order_id=...) drop the filled order only."""
+    broker = RecordingBroker()
+    om = OrderManager(broker, refresh_ms=0)
+    om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=0)
+    om.on_fill("a", now_ms=10, side="bid")
+    assert om.markets["a"].bid is None and set(om.orders) == {"o2"}
+    om.on_fill("a", now_ms=20, order_id="o2")
+    assert om.markets["a"].ask is None and om.orders == {}
+    broker.calls.clear()
+    out = om.set_quotes("a", 0.40, 0.60, 1.0, now_ms=30)
+    assert out["submitted"] == 2 and out["cancel_count"] == 0
@@ -0,0 +1,68 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""ProposalBatch: typed columnar storage, lazy Proposal rows, lean mode."""
+
+import numpy as np
+from decision_schema.types import Action, Proposal
+
+from mdm_engine.mdm.decision_engine import DecisionEngine
+from mdm_engine.mdm.proposal_batch import ProposalBatch, decode_reasons, encode_reasons
+
+COLUMNS = {
+    "signal_1": np.array([0.5, 0.05, -0.3, 0.0]),
+    "state_scalar_a": np.array([120.0, 40.0, 90.0, 0.0]),
+    "state_scalar_b": np.array([10.0, 900.0, 100.0, 0.0]),
+}
+
+
+def _rows() -> list[dict[str, float]]:
+    return [{k: float(v[i]) for k, v in COLUMNS.items()} for i in range(4)]
+
+
+def test_batch_arrays_are_typed() -> None:
+    batch = DecisionEngine().propose_batch(COLUMNS)
+    assert isinstance(batch, ProposalBatch) and len(batch) == 4
+    assert batch.actions.dtype == np.uint8
+    assert batch.confidences.dtype == np.float64
+    assert batch.reason_bits.dtype == np.uint8
+    assert batch.mask(Action.ACT).tolist() == [True, False, True, False]
+    assert batch.has_reason("low_confidence").tolist() == [False, True, False, False]
+    assert batch.action_at(1) == Action.HOLD
+
+
+def test_rows_materialize_like_scalar() -> None:
+    de = DecisionEngine()
+    batch = de.propose_batch(COLUMNS)
+    for row, p in zip(_rows(), batch):
+        s = de.propose(row)
+        assert (p.action, p.reasons, p.params, p.features_summary) == (
+            s.action,
+            s.reasons,
+            s.params,
+            s.features_summary,
+        )
+    assert [p.action for p in batch[2:]] == [Action.ACT, Action.HOLD]
+
+
+def test_lean_mode_skips_dicts() -> None:
+    de = DecisionEngine(lean=True)
+    p = de.propose(_rows()[0])
+    assert p.action == Action.ACT and not p.params and not p.features_summary
+    row = de.propose_batch(COLUMNS)[0]
+    assert row.action == Action.ACT and not row.params and not row.features_summary
+    assert row.reasons == p.reasons
+
+
+def test_from_proposals_keeps_rows() -> None:
+    rows = [
+        Proposal(action=Action.HOLD, confidence=0.0, reasons=["private_hook_error"]),
+        Proposal(action=Action.ACT, confidence=0.9, reasons=["custom"]),
+    ]
+    batch = ProposalBatch.from_proposals(rows)
+    assert batch[1] is rows[1]
+    assert batch.has_reason("private_hook_error").tolist() == [True, False]
+    assert decode_reasons(encode_reasons(["tight_penalty", "sufficient_scale"])) == [
+        "sufficient_scale",
+        "tight_penalty",
+    ]
@@ -0,0 +1,86 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""propose_batch: vectorized reference matches scalar propose(); private batch opt-in."""
+
+import numpy as np
+import pytest
+from decision_schema.types import Action, Proposal
+
+from mdm_engine.mdm.decision_engine import DecisionEngine
+
+KEYS = ["signal_0", "signal_1", "state_scalar_a", "state_scalar_b"]
+
+
+def _random_columns(n: int, seed: int = 7) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "signal_0": rng.uniform(0, 1, n),
+        "signal_1": rng.uniform(-1, 1, n),
+        "state_scalar_a": np.where(rng.random(n) < 0.1, 0.0, rng.uniform(0, 300, n)),
+        "state_scalar_b": rng.uniform(0, 1500, n),
+    }
+
+
+def _assert_same(batch: list[Proposal], scalar: list[Proposal]) -> None:
+    assert len(batch) == len(scalar)
+    for b, s in zip(batch, scalar):
+        assert b.action == s.action
+        assert b.reasons == s.reasons
+        assert b.confidence == pytest.approx(s.confidence, rel=1e-12)
+
+
+def test_batch_matches_scalar_dict_of_arrays() -> None:
+    de = DecisionEngine(confidence_threshold=0.5, signal_threshold=0.1)
+    cols = _random_columns(500)
+    rows = [{k: float(cols[k][i]) for k in KEYS} for i in range(500)]
+    _assert_same(de.propose_batch(cols), [de.propose(r) for r in rows])
+
+
+def test_batch_matches_scalar_2d_layout_and_missing_keys() -> None:
+    de = DecisionEngine()
+    cols = _random_columns(50)
+    arr = np.column_stack([cols["signal_1"], cols["state_scalar_a"]])
+    batch = de.propose_batch(arr, keys=["signal_1", "state_scalar_a"])
+    rows = [{"signal_1": float(a), "state_scalar_a": float(b)} for a, b in arr]
+    _assert_same(batch, [de.propose(r) for r in rows])
+
+
+def test_batch_rejects_bad_layout() -> None:
+    de = DecisionEngine()
+    with pytest.raises(ValueError):
+        de.propose_batch(np.zeros((3, 2)), keys=["signal_1"])
+    with pytest.raises(ValueError):
+        de.propose_batch({"signal_1": np.zeros(3), "state_scalar_a": np.zeros(2)})
+
+
+def test_private_batch_opt_in_and_scalar_fallback() -> None:
+    de = DecisionEngine(confidence_threshold=0.0, signal_threshold=0.0)
+    cols = {"signal_1": np.array([0.5, 0.2, 0.9])}
+    scalar_calls = []
+
+    def scalar_only(features, **kwargs):
+        scalar_calls.append(features)
+        return Proposal(action=Action.HOLD, confidence=0.1, reasons=["scalar"])
+
+    de.swap_model(scalar_only, provider="scalar_only")
+    assert [p.reasons for p in de.propose_batch(cols)] == [["scalar"]] * 3
+    assert len(scalar_calls) == 3
+
+    def batch(columns, **kwargs):
+        return [
+            None if v > 0.8 else Proposal(Action.HOLD, 0.2, ["batch"])
+            for v in columns["signal_1"]
+        ]
+
+    de.swap_model(scalar_only, provider="batched", batch_fn=batch)
+    out = de.propose_batch(cols)
+    assert [p.reasons for p in out[:2]] == [["batch"], ["batch"]]
+    assert out[2].action == Action.ACT  # None row defers to reference
+    assert len(scalar_calls) == 3
+
+    def broken(columns, **kwargs):
+        raise RuntimeError("boom")
+
+    de.swap_model(scalar_only, provider="broken", batch_fn=broken)
+    assert all("private_hook_error" in p.reasons for p in de.propose_batch(cols))
@@ -1,9 +1,19 @@
 # Decision Ecosystem — mdm-engine
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""RateLimiter: token bucket and start_full policy."""
+"""RateLimiter: token bucket, start_full policy, acquire, thread-safe and keyed variants."""
 
-from mdm_engine.security.rate_limit import RateLimiter
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mdm_engine.security.rate_limit import (
+    KeyedRateLimiter,
+    RateLimiter,
+    ThreadSafeRateLimiter,
+)
 
 
 def test_start_full_first_allow_succeeds() -> None:
@@ -30,3 +40,112 @@ def test_tokens_clamped_to_capacity() -> None:
     assert limiter.tokens == 5.0
     limiter2 = RateLimiter(rate=1.0, capacity=5, tokens=-1.0)
     assert limiter2.tokens == 0.0
+
+
+def test_weighted_allow_and_oversized_cost() -> None:
+    """allow(cost) consumes cost tokens; a cost above capacity is denied (acquire raises)."""
+    limiter = RateLimiter(rate=0.001, capacity=5, start_full=True)
+    assert limiter.allow(cost=3) is True
+    assert limiter.allow(cost=3) is False
+    assert limiter.allow(cost=2) is True
+    assert RateLimiter(rate=1.0, capacity=5, start_full=True).allow(cost=6) is False
+    with pytest.raises(ValueError):
+        limiter.acquire(cost=6)
+    with pytest.raises(ValueError):
+        asyncio.run(limiter.acquire_async(cost=6))
+
+
+def test_zero_rate_never_refills() -> None:
+    """rate=0: allow() denies once empty; acquire with a timeout returns False, no error."""
+    limiter = RateLimiter(rate=0.0, capacity=2, start_full=True)
+    assert limiter.allow(cost=2) is True
+    assert limiter.allow() is False
+    assert limiter.acquire(timeout=0.0) is False
+    assert limiter.acquire(timeout=10.0) is False  # never refills: fails at once
+    assert asyncio.run(limiter.acquire_async(timeout=10.0)) is False
+    keyed = KeyedRateLimiter(0.0, 5, start_full=True)
+    assert keyed.idle_seconds == float("inf")
+    assert sum(keyed.allow("a") for _ in range(10)) == 5
+    assert keyed.acquire("a", timeout=1.0) is False
+
+
+def test_acquire_sleeps_until_tokens_refill() -> None:
+    """acquire() waits about deficit / rate (no polling); timeout fails fast."""
+    limiter = RateLimiter(rate=100.0, capacity=5, start_full=True)
+    assert limiter.acquire(cost=5) is True
+    assert limiter.acquire(cost=2, timeout=0.001) is False
+    t0 = time.monotonic()
+    assert limiter.acquire(cost=3) is True
+    elapsed = time.monotonic() - t0
+    assert 0.025 <= elapsed < 0.5
+    assert 0 <= limiter.tokens <= limiter.capacity
+
+
+def test_acquire_async() -> None:
+    """acquire_async() awaits the refill; other tasks keep running meanwhile."""
+    limiter = RateLimiter(rate=200.0, capacity=2, start_full=True)
+    ticks = []
+
+    async def ticker() -> None:
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.001)
+
+    async def main() -> list[bool]:
+        task = asyncio.create_task(ticker())
+        results = [await limiter.acquire_async(cost=2) for _ in range(3)]
+        await task
+        return results
+
+    t0 = time.monotonic()
+    assert asyncio.run(main()) == [True, True, True]
+    assert time.monotonic() - t0 >= 0.019
+    assert len(ticks) == 5
+
+
+def test_thread_safe_limiter_never_over_admits() -> None:
+    """Concurrent acquire() on one ThreadSafeRateLimiter admits exactly capacity + refill."""
+    limiter = ThreadSafeRateLimiter(rate=0.001, capacity=50, start_full=True)
+    admitted = []
+
+    def worker() -> None:
+        admitted.append(sum(limiter.allow() for _ in range(100)))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(admitted) == 50
+    assert limiter.acquire(cost=1, timeout=0.01) is False
+
+
+def test_keyed_limiter_separate_buckets_and_eviction() -> None:
+    """One bucket per key; idle buckets and refilled buckets beyond max_keys are evicted."""
+    keyed = KeyedRateLimiter(
+        rate=1000.0, capacity=1, start_full=True, idle_seconds=60.0, max_keys=3
+    )
+    assert keyed.allow("a") and keyed.allow("b")
+    time.sleep(0.005)  # both refilled
+    for key in ("c", "d"):
+        keyed.allow(key)
+    assert len(keyed) == 3  # "a" (least recently used) evicted
+    idle = KeyedRateLimiter(rate=1000.0, capacity=1, idle_seconds=0.005)
+    for i in range(100):
+        idle.allow(i)
+    time.sleep(0.01)
+    idle.allow("new")
+    assert len(idle) == 1
+    assert idle.limiter("new") is idle.limiter("new")
+
+
+def test_keyed_limiter_key_churn_does_not_refill_spent_key() -> None:
+    """A spent start_full bucket is kept past max_keys / idle_seconds until it has refilled."""
+    keyed = KeyedRateLimiter(
+        rate=0.001, capacity=1, start_full=True, idle_seconds=0.0, max_keys=2
+    )
+    assert keyed.allow("a")
+    for i in range(10):
+        keyed.allow(i)
+    assert not keyed.allow("a")
+    assert len(keyed) == 11
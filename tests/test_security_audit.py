@@ -0,0 +1,65 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""AuditLogger: per-event and group-commit modes, sync(), counters."""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from mdm_engine.security.audit import AuditLogger
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_batched_output_matches_unbatched() -> None:
+    """Same lines either way; batched mode commits them in fewer batches."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = AuditLogger(Path(tmp) / "plain")
+        batched = AuditLogger(Path(tmp) / "batched", batched=True, batch_size=64)
+        for i in range(200):
+            plain.log("guard", {"i": i, "reason": "rate"})
+            batched.log("guard", {"i": i, "reason": "rate"})
+        assert plain.stats()["lines_written"] == plain.stats()["batches"] == 200
+        plain.close()
+        batched.close()
+        stats = batched.stats()
+        assert stats["lines_written"] == 200 and stats["batches"] < 200
+        assert stats["flush_ms_max"] >= stats["flush_ms_mean"] >= 0
+        assert (Path(tmp) / "batched" / "security_audit.jsonl").read_bytes() == (
+            Path(tmp) / "plain" / "security_audit.jsonl"
+        ).read_bytes()
+
+
+def test_flush_interval_and_sync() -> None:
+    """A full batch commits at once; a partial one waits for the interval or sync()."""
+    with tempfile.TemporaryDirectory() as tmp:
+        audit = AuditLogger(Path(tmp), batched=True, flush_interval_s=30, batch_size=4)
+        for i in range(4):
+            audit.log("guard", {"i": i})
+        deadline = time.monotonic() + 5
+        while audit.stats()["lines_written"] < 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert audit.stats()["lines_written"] == 4
+        audit.log("kill_switch", {"i": 4})
+        time.sleep(0.05)
+        assert len(_lines(audit.path)) == 4  # lingering, not yet written
+        audit.log("kill_switch", {"i": 5}, sync=True)
+        assert [e["i"] for e in _lines(audit.path)] == list(range(6))
+        assert audit.stats()["batches"] == 2
+        audit.close()
+
+
+def test_unbatched_sync() -> None:
+    """Per-event mode: every line is visible immediately; sync() fsyncs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        audit = AuditLogger(Path(tmp))
+        audit.log("start")
+        assert _lines(audit.path) == [{"event": "start"}]
+        audit.log("stop", {"code": 0}, sync=True)
+        audit.sync()
+        assert audit.stats()["lines_written"] == 2
+        audit.close()
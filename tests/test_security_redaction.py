@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: MIT
 """Redaction: no secrets in output."""
 
-from mdm_engine.security.redaction import redact_dict
+from mdm_engine.security.redaction import RedactedView, redact_dict
 
 
 def test_redact_dict_removes_api_key():
@@ -18,3 +18,55 @@ def test_redact_dict_nested():
     out = redact_dict(d)
     assert out["nested"]["authorization"] == "[REDACTED]"
     assert out["data"] == 1
+
+
+def test_redact_dict_shared_reuses_clean_subtrees():
+    clean = {"a": {"b": [1, 2]}, "rows": [{"x": 1}]}
+    d = {"clean": clean, "dirty": {"Api-Key": "k", "keep": {"y": 2}}}
+    out = redact_dict(d, shared=True)
+    assert out is not d
+    assert out["clean"] is clean
+    assert out["dirty"] == {"Api-Key": "[REDACTED]", "keep": {"y": 2}}
+    assert out["dirty"]["keep"] is d["dirty"]["keep"]
+    assert d["dirty"]["Api-Key"] == "k"
+
+
+def test_redact_dict_default_copy_is_independent():
+    d = {"a": {"b": 1}, "rows": [{"token": "t"}, {"x": 1}, 3]}
+    out = redact_dict(d)
+    assert out == {"a": {"b": 1}, "rows": [{"token": "[REDACTED]"}, {"x": 1}, 3]}
+    assert out["a"] is not d["a"] and out["rows"][1] is not d["rows"][1]
+    assert d["rows"][0]["token"] == "t"
+    out["a"]["b"] = 2
+    assert d["a"]["b"] == 1
+    assert redact_dict(d, shared=True) == out | {"a": {"b": 1}}
+
+
+def test_redact_dict_lists_subset_and_non_str_keys():
+    d = {"rows": [{"SECRET": "s"}, 5], 1: {"password": "p"}, "custom_field": "c"}
+    out = redact_dict(d)
+    assert out["rows"] == [{"SECRET": "[REDACTED]"}, 5]
+    assert out[1] == {"password": "[REDACTED]"}
+    assert redact_dict(d, key_subset={"custom-field"})["custom_field"] == "[REDACTED]"
+    assert redact_dict(d, key_subset={"custom-field"})[1] == {"password": "p"}
+
+
+def test_redacted_view_is_lazy_and_read_only():
+    d = {
+        "Token": "t",
+        "nested": {"password": "p", "x": 1},
+        "rows": [{"secret": "s"}, 2],
+    }
+    view = RedactedView(d)
+    assert len(view) == 3 and list(view) == ["Token", "nested", "rows"]
+    assert view["Token"] == "[REDACTED]"
+    assert isinstance(view["nested"], RedactedView)
+    assert view["nested"]["password"] == "[REDACTED]" and view["nested"]["x"] == 1
+    assert view["rows"][0]["secret"] == "[REDACTED]" and view["rows"][1] == 2
+    assert view == redact_dict(d) and view.to_dict() == redact_dict(d)
+    assert view.to_dict()["rows"] is not d["rows"]
+    assert view.to_dict(shared=True) == view.to_dict()
+    assert "'t'" not in repr(view)
+    d["nested"]["x"] = 2
+    assert view["nested"]["x"] == 2
+    assert not hasattr(view, "__setitem__")
@@ -0,0 +1,126 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Binary trace format: TraceLogger(format="binary"), mmap reader, JSONL converters."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from decision_schema.packet_v2 import PacketV2
+from decision_schema.types import Action
+
+from mdm_engine.trace import (
+    BinaryTraceReader,
+    TraceLogger,
+    binary_to_jsonl,
+    jsonl_to_binary,
+)
+
+
+class Opaque:
+    def __str__(self) -> str:
+        return "opaque"
+
+
+@pytest.fixture
+def packet(make_packet):
+    """Packets with values the binary format must round-trip (NaN, bigint, objects, int keys)."""
+
+    def make(step: int):
+        return make_packet(
+            step,
+            input={
+                "ts_ms": 1_700_000_000_000 + step,
+                "x": 0.1 * step,
+                "nan": float("nan"),
+            },
+            external={
+                "flags": [True, False, None],
+                "big": 2**70,
+                "obj": Opaque(),
+                3: "k",
+            },
+            mdm={"action": Action.ACT, "confidence": 0.75, "reasons": ["a", "é"]},
+            final_action={"action": Action.HOLD, "allowed": step % 2 == 0},
+        )
+
+    return make
+
+
+def _as_json(packet: PacketV2) -> str:
+    return json.dumps(packet.to_dict(), default=str)
+
+
+def test_binary_round_trip_matches_jsonl(packet) -> None:
+    """Decoded binary packets re-encode to exactly the JSONL TraceLogger would write."""
+    packets = [packet(i) for i in range(20)]
+    with tempfile.TemporaryDirectory() as tmp:
+        with TraceLogger(Path(tmp), format="binary") as logger:
+            for p in packets:
+                logger.write(p)
+        path = Path(tmp) / "traces.bin"
+        with BinaryTraceReader(path) as reader:
+            lines = [json.dumps(d, default=str) for d in reader]
+        assert lines == [_as_json(p) for p in packets]
+        assert path.stat().st_size < sum(len(line) + 1 for line in lines)
+
+
+def test_reader_yields_views_and_append_keeps_key_table(packet) -> None:
+    """records() yields memoryviews; reopening for append reuses interned keys."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with TraceLogger(Path(tmp), format="binary") as logger:
+            logger.write(packet(0))
+        with TraceLogger(Path(tmp), format="binary") as logger:
+            logger.write(packet(1))
+        with BinaryTraceReader(Path(tmp) / "traces.bin") as reader:
+            bodies = list(reader.records())
+            assert all(isinstance(b, memoryview) for _, b in bodies)
+            assert [reader.decode(b)["step"] for _, b in bodies] == [0, 1]
+            assert len(reader.keys) == len(set(reader.keys))
+            del bodies
+
+
+def test_converters_round_trip_bytes(packet) -> None:
+    """jsonl -> binary -> jsonl reproduces the original file byte for byte."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with TraceLogger(Path(tmp)) as logger:
+            for i in range(10):
+                logger.write(packet(i))
+        src = Path(tmp) / "traces.jsonl"
+        assert jsonl_to_binary(src, Path(tmp) / "t.bin") == 10
+        assert binary_to_jsonl(Path(tmp) / "t.bin", Path(tmp) / "back.jsonl") == 10
+        assert (Path(tmp) / "back.jsonl").read_bytes() == src.read_bytes()
+
+
+def test_truncated_tail_and_bad_magic(packet) -> None:
+    """A torn final record is skipped; a non-trace file is rejected."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with TraceLogger(Path(tmp), format="binary") as logger:
+            logger.write(packet(0))
+            logger.write(packet(1))
+        path = Path(tmp) / "traces.bin"
+        path.write_bytes(path.read_bytes()[:-3])
+        with BinaryTraceReader(path) as reader:
+            assert [d["step"] for d in reader] == [0]
+        path.write_bytes(b"{}\n")
+        with pytest.raises(ValueError):
+            BinaryTraceReader(path)
+        with pytest.raises(ValueError):
+            TraceLogger(Path(tmp), format="xml")
+
+
+def test_append_after_torn_tail_truncates_it(packet) -> None:
+    """Reopen after a crash mid-record: the torn record is dropped, new ones stay readable."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "traces.bin"
+        with TraceLogger(Path(tmp), format="binary") as logger:
+            for step in range(3):
+                logger.write(packet(step))
+        path.write_bytes(path.read_bytes()[:-5])
+        with TraceLogger(Path(tmp), format="binary") as logger:
+            for step in range(3, 6):
+                logger.write(packet(step))
+        with BinaryTraceReader(path) as reader:
+            assert [p["step"] for p in reader] == [0, 1, 3, 4, 5]
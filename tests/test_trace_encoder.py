@@ -0,0 +1,101 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""PacketEncoder: byte-compatible with json.dumps(to_dict(), default=str), fallbacks."""
+
+import json
+from enum import Enum
+
+import pytest
+from decision_schema.types import Action
+
+from mdm_engine.trace import PacketEncoder
+
+
+class Color(Enum):
+    RED = 1
+
+
+class Opaque:
+    def __str__(self) -> str:
+        return "opaque"
+
+
+VALUES = [
+    0.1,
+    -0.0,
+    1e300,
+    float("nan"),
+    float("inf"),
+    -float("inf"),
+    2**70,
+    -5,
+    True,
+    None,
+    'é\n"',
+    Action.ACT,
+    Color.RED,
+    Opaque(),
+    [1, (2.5, "x")],
+    {1: 2, None: 3, 1.5: "y", False: {}},
+]
+
+
+@pytest.fixture
+def value_packet(make_packet):
+    """Packets carrying every VALUES entry in input."""
+
+    def make(step: int, run_id: str = "r1", latency=3):
+        return make_packet(
+            step,
+            run_id=run_id,
+            input={f"k{i}": v for i, v in enumerate(VALUES)},
+            external={"now_ms": 1_700_000_000_000.5, "step": step},
+            mdm={"action": Action.ACT, "confidence": 0.75, "reasons": ["a", "é"]},
+            final_action={"action": Action.HOLD, "allowed": step % 2 == 0},
+            latency_ms=latency,
+            mismatch=None if step % 3 else {"flags": ["x"]},
+        )
+
+    return make
+
+
+def test_round_trip_byte_compatible(value_packet) -> None:
+    """encode() equals json.dumps(to_dict(), default=str) and parses back the same."""
+    encoder = PacketEncoder()
+    for step, run_id, latency in [(0, "r1", 3), (1, "é", 2.5), (2**70, "", None)]:
+        packet = value_packet(step, run_id, latency)
+        expected = json.dumps(packet.to_dict(), default=str)
+        assert encoder.encode(packet) == expected
+        assert encoder.encode(packet, newline=True) == expected + "\n"
+        assert json.loads(encoder.encode(packet)) == json.loads(expected)
+
+
+def test_any_to_dict_object_and_repeated_enums() -> None:
+    """Objects other than PacketV2 work; cached enum formatting matches str()."""
+
+    class Renamed:
+        step = 1
+
+        def to_dict(self):
+            return {"id": self.step, "payload": {"x": [Action.EXIT, Color.RED]}}
+
+    encoder = PacketEncoder()
+    for _ in range(3):
+        assert encoder.encode(Renamed()) == json.dumps(Renamed().to_dict(), default=str)
+    assert encoder.encode_value([Color.RED, 0.5]) == json.dumps(
+        [Color.RED, 0.5], default=str
+    )
+
+
+def test_error_matches_json_and_encoder_recovers(value_packet) -> None:
+    """Unencodable keys raise TypeError like json.dumps; the next packet still encodes."""
+    encoder = PacketEncoder()
+    bad = value_packet(0)
+    bad.input = {"nested": {(1, 2): 3}}
+    with pytest.raises(TypeError):
+        json.dumps(bad.to_dict(), default=str)
+    with pytest.raises(TypeError):
+        encoder.encode(bad)
+    good = value_packet(1)
+    assert encoder.encode(good) == json.dumps(good.to_dict(), default=str)
@@ -0,0 +1,81 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Sidecar trace index: incremental rows, TraceReader seeks, offline indexer."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from decision_schema.types import Action
+
+from mdm_engine.trace import TraceLogger, TraceReader, build_index
+from mdm_engine.trace.index import index_path, load_index
+
+ACTIONS = [Action.ACT, Action.HOLD, Action.HOLD, Action.EXIT]
+
+
+@pytest.fixture
+def write_trace(make_packet):
+    """write_trace(run_dir, steps, **logger_kwargs) -> traces.jsonl; actions cycle ACTIONS."""
+
+    def write(run_dir: Path, steps, **kwargs) -> Path:
+        with TraceLogger(run_dir, **kwargs) as logger:
+            for i in steps:
+                action = {"action": ACTIONS[i % 4], "allowed": True}
+                logger.write(make_packet(i, final_action=action))
+        return run_dir / "traces.jsonl"
+
+    return write
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_logger_index_matches_offline_build(background, write_trace) -> None:
+    """Incremental rows equal a fresh build_index; offsets point at each line."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_trace(Path(tmp), range(100), index=True, background=background)
+        rows = load_index(index_path(path))
+        data = path.read_bytes()
+        assert list(rows["step"]) == list(range(100))
+        for row in rows[:5]:
+            line = data[row["offset"] : row["offset"] + row["length"]]
+            assert json.loads(line)["step"] == row["step"]
+        assert build_index(path, Path(tmp) / "rebuilt.idx") == 100
+        assert (Path(tmp) / "rebuilt.idx").read_bytes() == index_path(path).read_bytes()
+
+
+def test_reader_seeks_by_step_range_and_action(write_trace) -> None:
+    """get / range / by_action / offsets return only the matching packets."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_trace(Path(tmp), range(40), index=True)
+        with TraceReader(path) as reader:
+            assert len(reader) == 40
+            assert reader.get(17)["step"] == 17
+            with pytest.raises(KeyError):
+                reader.get(40)
+            assert [p["step"] for p in reader.range(10, 14)] == [10, 11, 12, 13]
+            acts = [p["step"] for p in reader.by_action(Action.ACT)]
+            assert acts == list(range(0, 40, 4))
+            assert [p["step"] for p in reader.by_action("EXIT")] == list(
+                range(3, 40, 4)
+            )
+            assert len(reader.offsets(Action.HOLD)) == 20
+            assert len(reader.offsets()) == 40
+
+
+def test_offline_index_for_existing_trace_and_reopen(write_trace) -> None:
+    """A trace written without an index is indexed on open; appends keep it current."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        path = write_trace(run_dir, range(10))
+        with TraceReader(path) as reader:  # builds traces.jsonl.idx
+            assert [p["step"] for p in reader.range(8, 100)] == [8, 9]
+        write_trace(run_dir, range(10, 20), index=True)
+        write_trace(run_dir, range(20, 25))  # no index: stale now
+        write_trace(run_dir, range(25, 30), index=True)  # re-indexes before appending
+        with TraceReader(path) as reader:
+            assert list(reader.steps) == list(range(30))
+            assert reader.get(27)["final_action"]["action"] == "EXIT"
+        with pytest.raises(ValueError):
+            TraceLogger(run_dir, format="binary", index=True)
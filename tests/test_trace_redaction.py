@@ -0,0 +1,87 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Trace redaction: redact=True at serialization time, RedactedView values, loop hand-off."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mdm_engine.adapters.base import MarketDataSource
+from mdm_engine.loop import run_loop
+from mdm_engine.security import RedactedView
+from mdm_engine.trace import BinaryTraceReader, TraceLogger
+
+
+def _raw(step: int) -> tuple[dict, dict]:
+    return (
+        {"x": step, "api_key": "k-secret", "rows": [{"Token": "t-secret"}]},
+        {"headers": {"Authorization": "a-secret"}, "now_ms": 1.0},
+    )
+
+
+@pytest.mark.parametrize("format", ["jsonl", "binary"])
+def test_background_redaction_matches_pre_redacted(format, make_packet) -> None:
+    """redact=True on the writer thread writes what pre-redacted packets write."""
+    raws = [_raw(i) for i in range(50)]
+    with tempfile.TemporaryDirectory() as tmp:
+        pre, bg = Path(tmp) / "pre", Path(tmp) / "bg"
+        with TraceLogger(pre, format=format) as logger:
+            for i, (inp, ext) in enumerate(raws):
+                logger.write(
+                    make_packet(
+                        i,
+                        input=RedactedView(inp).to_dict(),
+                        external=RedactedView(ext).to_dict(),
+                    )
+                )
+        with TraceLogger(bg, format=format, background=True, redact=True) as logger:
+            for i, (inp, ext) in enumerate(raws):
+                logger.write(make_packet(i, input=inp, external=ext))
+        name = "traces.bin" if format == "binary" else "traces.jsonl"
+        data = (bg / name).read_bytes()
+        assert data == (pre / name).read_bytes()
+        assert b"secret" not in data
+        if format == "binary":
+            with BinaryTraceReader(bg / name) as reader:
+                first = next(iter(reader))
+        else:
+            first = json.loads(data.splitlines()[0])
+    assert first["input"]["rows"] == [{"Token": "[REDACTED]"}]
+    assert first["external"]["headers"] == "[REDACTED]"
+    assert raws[0][0]["api_key"] == "k-secret"  # caller's dicts are untouched
+
+
+def test_redacted_view_is_written_redacted(make_packet) -> None:
+    """Views are serialized via to_dict() even without redact=True."""
+    inp, ext = _raw(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        with TraceLogger(Path(tmp)) as logger:
+            logger.write(
+                make_packet(0, input=RedactedView(inp), external=RedactedView(ext))
+            )
+        line = (Path(tmp) / "traces.jsonl").read_text()
+    assert "secret" not in line
+    assert json.loads(line)["input"]["api_key"] == "[REDACTED]"
+
+
+def test_loop_leaves_redaction_to_the_trace() -> None:
+    """With a redacting trace the loop hands raw events over; the file is still clean."""
+
+    class ListSource(MarketDataSource):
+        def __init__(self, events):
+            self._events = list(events)
+
+        def next_event(self):
+            return self._events.pop(0) if self._events else None
+
+    events = [{"ts_ms": 0.0, "signal_1": 0.5, "password": "p-secret"} for _ in range(5)]
+    with tempfile.TemporaryDirectory() as tmp:
+        trace = TraceLogger(Path(tmp), background=True, redact=True)
+        run_loop(ListSource(events), trace=trace)
+        trace.close()
+        lines = (Path(tmp) / "traces.jsonl").read_text().splitlines()
+    assert len(lines) == 5
+    assert all(json.loads(line)["input"]["password"] == "[REDACTED]" for line in lines)
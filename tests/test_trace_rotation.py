@@ -0,0 +1,135 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Trace rotation: size/time segments, background compression, manifest, cross-segment reads."""
+
+import itertools
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mdm_engine.trace import TraceLogger, iter_trace, load_manifest
+
+
+@pytest.fixture
+def packet(make_packet):
+    return lambda step: make_packet(step, external={"reasons": ["a"] * 5})
+
+
+def _expected(packets) -> list[dict]:
+    return [json.loads(json.dumps(p.to_dict(), default=str)) for p in packets]
+
+
+@pytest.mark.parametrize(
+    ("format", "compress", "background"),
+    [
+        ("jsonl", None, False),
+        ("jsonl", "gzip", True),
+        ("binary", "lzma", False),
+        ("binary", "gzip", True),
+    ],
+)
+def test_size_rotation_manifest_and_stream(
+    format, compress, background, packet
+) -> None:
+    """Segments stay near rotate_bytes; manifest covers every step; reads stream across."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        with TraceLogger(
+            run_dir,
+            format=format,
+            rotate_bytes=4096,
+            compress=compress,
+            background=background,
+            max_batch=8,
+        ) as logger:
+            for i in range(300):
+                logger.write(packet(i))
+        segments = load_manifest(run_dir)["segments"]
+        assert len(segments) > 2
+        assert [s["index"] for s in segments] == list(range(len(segments)))
+        assert segments[0]["first_step"] == 0 and segments[-1]["last_step"] == 299
+        for prev, seg in itertools.pairwise(segments):
+            assert seg["first_step"] == prev["last_step"] + 1
+        assert sum(s["records"] for s in segments) == 300
+        for seg in segments:
+            path = run_dir / seg["file"]
+            assert path.stat().st_size == seg["stored_bytes"]
+            if compress:
+                assert path.suffix == {"gzip": ".gz", "lzma": ".xz"}[compress]
+                assert seg["stored_bytes"] < seg["bytes"]
+        assert list(iter_trace(run_dir)) == _expected(packet(i) for i in range(300))
+
+
+def test_time_rotation_and_reopen_continues_numbering(packet) -> None:
+    """rotate_seconds rolls segments by age; a new logger appends after the last one."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        with TraceLogger(run_dir, rotate_seconds=1e-9) as logger:
+            for i in range(3):
+                logger.write(packet(i))
+        with TraceLogger(run_dir, rotate_bytes=1 << 20) as logger:
+            logger.write(packet(3))
+        segments = load_manifest(run_dir)["segments"]
+        assert [(s["index"], s["first_step"]) for s in segments] == [
+            (0, 0),
+            (1, 1),
+            (2, 2),
+            (3, 3),
+        ]
+        assert sorted(p.name for p in run_dir.glob("traces.0*")) == [
+            f"traces.00000{i}.jsonl" for i in range(4)
+        ]
+        assert [p["step"] for p in iter_trace(run_dir)] == [0, 1, 2, 3]
+
+
+def test_live_segment_and_unrotated_file_are_read(packet) -> None:
+    """iter_trace reads traces.jsonl and the open (unlisted) segment, skipping a torn tail."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        with TraceLogger(run_dir) as logger:
+            logger.write(packet(0))
+        logger = TraceLogger(run_dir, rotate_bytes=1 << 20)
+        logger.write(packet(1))
+        logger.flush()
+        with open(run_dir / "traces.000000.jsonl", "a") as f:
+            f.write('{"step": ')
+        assert [p["step"] for p in iter_trace(run_dir)] == [0, 1]
+        assert load_manifest(run_dir)["segments"] == []
+        logger.close()
+        with pytest.raises(ValueError):
+            TraceLogger(run_dir, compress="gzip")
+
+
+def test_fsync_durability_syncs_each_segment_before_rotation(
+    monkeypatch, packet
+) -> None:
+    """durability="fsync": every completed segment is fsynced at its final size."""
+    synced: set[tuple[int, int]] = set()
+    real_fsync = os.fsync
+
+    def spy(fd: int) -> None:
+        st = os.fstat(fd)
+        synced.add((st.st_ino, st.st_size))
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", spy)
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        with TraceLogger(
+            run_dir,
+            rotate_bytes=2048,
+            background=True,
+            durability="fsync",
+            max_batch=4,
+        ) as logger:
+            for i in range(100):
+                logger.write(packet(i))
+        segments = load_manifest(run_dir)["segments"]
+        assert len(segments) > 2
+        for seg in segments:
+            st = (run_dir / seg["file"]).stat()
+            assert (st.st_ino, st.st_size) in synced, seg["file"]
@@ -0,0 +1,121 @@
+# Decision Ecosystem — mdm-engine
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Background trace writer: group commit, backpressure policies, durability, error surfacing."""
+
+import io
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from mdm_engine.trace import BackgroundWriter, BinaryTraceReader, TraceLogger
+
+
+class GatedFile(io.StringIO):
+    """write() blocks until the gate is opened; records write() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.writes = 0
+
+    def write(self, s):
+        self.gate.wait()
+        self.writes += 1
+        return super().write(s)
+
+    def close(self):
+        self.value = self.getvalue()
+        super().close()
+
+
+@pytest.mark.parametrize("format", ["jsonl", "binary"])
+def test_background_output_matches_sync(format, make_packet) -> None:
+    """Same bytes as the synchronous logger, written in fewer groups."""
+    packets = [make_packet(i, external={"flags": [True, None]}) for i in range(200)]
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_dir, bg_dir = Path(tmp) / "sync", Path(tmp) / "bg"
+        with TraceLogger(sync_dir, format=format) as logger:
+            for p in packets:
+                logger.write(p)
+        with TraceLogger(bg_dir, format=format, background=True) as logger:
+            for p in packets:
+                logger.write(p)
+            logger.flush()
+            stats = logger.stats()
+        name = "traces.bin" if format == "binary" else "traces.jsonl"
+        assert (bg_dir / name).read_bytes() == (sync_dir / name).read_bytes()
+        assert stats["written"] == 200 and stats["dropped"] == 0
+        assert 1 <= stats["groups"] <= 200
+        if format == "binary":
+            with BinaryTraceReader(bg_dir / name) as reader:
+                assert [d["step"] for d in reader] == list(range(200))
+
+
+def test_drop_policies_count_and_keep_order() -> None:
+    """drop keeps the oldest items, drop_oldest the newest; both count drops."""
+    for policy, expected in (("drop", "0123"), ("drop_oldest", "0789")):
+        f = GatedFile()
+        writer = BackgroundWriter(f, str, maxsize=3, max_batch=1, backpressure=policy)
+        writer.put(0)
+        while writer.stats()["depth"]:  # item 0 taken, writer blocked on the gate
+            pass
+        results = [writer.put(i) for i in range(1, 10)]
+        assert writer.stats()["dropped"] == 6 and writer.stats()["max_depth"] == 3
+        assert results.count(False) == (6 if policy == "drop" else 0)
+        f.gate.set()
+        writer.close()
+        assert f.value == expected
+
+
+def test_block_policy_waits_and_close_drains() -> None:
+    """A full queue blocks the producer until the writer catches up; close() writes all."""
+    f = GatedFile()
+    writer = BackgroundWriter(f, str, maxsize=2, max_batch=8)
+    producer = threading.Thread(target=lambda: [writer.put(i) for i in range(10)])
+    producer.start()
+    producer.join(0.05)
+    assert producer.is_alive()
+    f.gate.set()
+    producer.join()
+    writer.close()
+    assert f.value == "0123456789"
+    assert writer.stats()["dropped"] == 0 and f.writes < 10
+    with pytest.raises(ValueError):
+        writer.put(10)
+
+
+def test_fsync_durability_and_flush_visibility(make_packet) -> None:
+    """flush() makes queued packets visible on disk; fsync mode closes cleanly."""
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = TraceLogger(
+            Path(tmp), background=True, durability="fsync", max_batch=16
+        )
+        for i in range(50):
+            logger.write(make_packet(i))
+        logger.flush()
+        assert len((Path(tmp) / "traces.jsonl").read_text().splitlines()) == 50
+        logger.close()
+    with pytest.raises(ValueError):
+        BackgroundWriter(io.StringIO(), str, durability="sometimes")
+
+
+def test_encode_error_surfaces_once() -> None:
+    """A failing encode is counted, skipped, and re-raised by the next flush()/close()."""
+
+    def encode(item):
+        if item == 2:
+            raise TypeError("not serializable")
+        return f"{item}\n"
+
+    f = GatedFile()
+    f.gate.set()
+    writer = BackgroundWriter(f, encode)
+    for i in range(4):
+        writer.put(i)
+    with pytest.raises(TypeError, match="not serializable"):
+        writer.flush()
+    writer.close()
+    assert f.value == "0\n1\n3\n" and writer.stats()["errors"] == 1